@@ -48,6 +48,16 @@ class SkratimeauthAuthStack(Stack):
             removal_policy=RemovalPolicy.DESTROY,
         )
 
+        # Members get "admin" in their cognito:groups claim, which unlocks
+        # admin-only API options such as segmented news exports.
+        cognito.CfnUserPoolGroup(
+            self,
+            "SkratimeauthAdminGroup",
+            user_pool_id=user_pool.user_pool_id,
+            group_name="admin",
+            description="Skratime administrators",
+        )
+
         # User Pool Client
         user_pool_client = cognito.UserPoolClient(
             self,
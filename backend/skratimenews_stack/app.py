@@ -9,6 +9,8 @@ from aws_cdk import (
     aws_apigateway as apigateway,
     aws_events as events,
     aws_sqs as sqs,
+    aws_s3 as s3,
+    aws_secretsmanager as secretsmanager,
     aws_events_targets as targets,
     Duration,
     aws_iam as iam,
@@ -18,6 +20,7 @@ from aws_cdk import CfnOutput
 import os
 
 BEDROCK_MODEL_ID = "amazon.titan-text-lite-v1"
+SCRAPE_SHARD_COUNT = 1
 
 
 class SkratimenewsStack(Stack):
@@ -37,20 +40,99 @@ class SkratimenewsStack(Stack):
             self,
             "UserBookmarksTable",
             partition_key={"name": "user_id", "type": dynamodb.AttributeType.STRING},
+            sort_key={"name": "news_id", "type": dynamodb.AttributeType.STRING},
             billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
             removal_policy=RemovalPolicy.DESTROY,
         )
 
-        # === GSI: news-category-index ===
+        # === LSI: bookmarks-created-index (a user's bookmarks, newest first) ===
+        bookmarks_table.add_local_secondary_index(
+            index_name="bookmarks-created-index",
+            sort_key=dynamodb.Attribute(
+                name="created_at",
+                type=dynamodb.AttributeType.STRING,
+            ),
+            projection_type=dynamodb.ProjectionType.ALL,
+        )
+
+        # === GSI: bookmarks-news-index (who bookmarked a news item) ===
+        bookmarks_table.add_global_secondary_index(
+            index_name="bookmarks-news-index",
+            partition_key=dynamodb.Attribute(
+                name="news_id",
+                type=dynamodb.AttributeType.STRING,
+            ),
+            sort_key=dynamodb.Attribute(
+                name="user_id",
+                type=dynamodb.AttributeType.STRING,
+            ),
+            projection_type=dynamodb.ProjectionType.KEYS_ONLY,
+        )
+
+        # === GSI: news-category-index (unused, being dropped) ===
+        # Nothing queries it since category pages moved to
+        # news-category-date-index. It stays on existing stacks until the last
+        # step of scripts/deploy_news_indexes.sh deploys with
+        # legacyCategoryIndex=false, since one table update can't drop it and
+        # create the date indexes together.
+        if self.node.try_get_context("legacyCategoryIndex") in (True, "true"):
+            table.add_global_secondary_index(
+                index_name="news-category-index",
+                partition_key=dynamodb.Attribute(
+                    name="category_id",
+                    type=dynamodb.AttributeType.STRING,
+                ),
+                projection_type=dynamodb.ProjectionType.ALL,
+            )
+
+        # === GSI: news-category-date-index (category pages in date order) ===
+        # Projects only the card fields: a query is charged for the whole
+        # index item, so projecting full_article would bill it on every page.
         table.add_global_secondary_index(
-            index_name="news-category-index",
+            index_name="news-category-date-index",
             partition_key=dynamodb.Attribute(
                 name="category_id",
                 type=dynamodb.AttributeType.STRING,
             ),
-            projection_type=dynamodb.ProjectionType.ALL,
+            sort_key=dynamodb.Attribute(
+                name="published_at",
+                type=dynamodb.AttributeType.STRING,
+            ),
+            projection_type=dynamodb.ProjectionType.INCLUDE,
+            non_key_attributes=["title", "summary", "picture_url", "news_link"],
         )
 
+        # === GSI: news-date-index (latest news, bucketed by UTC day) ===
+        # DynamoDB creates one GSI per table update, so on an existing stack
+        # this index is deployed separately from news-category-date-index
+        # (scripts/deploy_news_indexes.sh). Without it the get Lambda serves
+        # the latest listing from a scan.
+        news_date_index_enabled = self.node.try_get_context("newsDateIndex") in (
+            True,
+            "true",
+        )
+        if news_date_index_enabled:
+            table.add_global_secondary_index(
+                index_name="news-date-index",
+                partition_key=dynamodb.Attribute(
+                    name="published_day",
+                    type=dynamodb.AttributeType.STRING,
+                ),
+                sort_key=dynamodb.Attribute(
+                    name="published_at",
+                    type=dynamodb.AttributeType.STRING,
+                ),
+                projection_type=dynamodb.ProjectionType.INCLUDE,
+                non_key_attributes=[
+                    "title",
+                    "summary",
+                    "category_id",
+                    "picture_url",
+                    "news_link",
+                    "author",
+                ],
+            )
+
         fetch_table = dynamodb.Table(
             self,
             "ScrapeTracking",
@@ -61,6 +143,13 @@ class SkratimenewsStack(Stack):
             billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
         )
 
+        feeds_table = dynamodb.Table(
+            self,
+            "FeedsTable",
+            partition_key={"name": "id", "type": dynamodb.AttributeType.STRING},
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+        )
+
         categories_table = dynamodb.Table(
             self,
             "CategoriesTable",
@@ -68,6 +157,15 @@ class SkratimenewsStack(Stack):
             billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
         )
 
+        categorizer_cache_table = dynamodb.Table(
+            self,
+            "CategorizerCacheTable",
+            partition_key={"name": "key", "type": dynamodb.AttributeType.STRING},
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            time_to_live_attribute="expires_at",
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
         # === Lambda Functions ===
 
         # Import existing Cognito User Pool
@@ -106,10 +204,35 @@ class SkratimenewsStack(Stack):
 
         categories_resource = api.root.add_resource("categories")
 
+        # === Secret for signing pagination cursors ===
+        cursor_secret = secretsmanager.Secret(
+            self,
+            "CursorSigningSecret",
+            generate_secret_string=secretsmanager.SecretStringGenerator(
+                exclude_punctuation=True,
+                password_length=64,
+            ),
+        )
+
+        # === SQS Queue for refreshing bookmark card snapshots ===
+        bookmark_cards_queue = sqs.Queue(
+            self,
+            "BookmarkCardsQueue",
+            visibility_timeout=Duration.seconds(120),
+        )
+
         # Create Lambda functions and integrate with API Gateway
         lambda_functions = {}
         for op in ["create", "get", "update", "delete"]:
             env_vars = {"TABLE_NAME": table.table_name}
+            if op == "get":
+                env_vars["NEWS_DATE_INDEX_ENABLED"] = str(
+                    news_date_index_enabled
+                ).lower()
+                env_vars["CURSOR_SECRET_ARN"] = cursor_secret.secret_arn
+                env_vars["BOOKMARKS_TABLE_NAME"] = bookmarks_table.table_name
+            if op in ("update", "delete"):
+                env_vars["BOOKMARK_CARDS_QUEUE_URL"] = bookmark_cards_queue.queue_url
 
             fn = _lambda.Function(
                 self,
@@ -131,6 +254,11 @@ class SkratimenewsStack(Stack):
             )
 
             table.grant_read_write_data(fn)
+            if op == "get":
+                cursor_secret.grant_read(fn)
+                bookmarks_table.grant_read_data(fn)
+            if op in ("update", "delete"):
+                bookmark_cards_queue.grant_send_messages(fn)
 
             lambda_functions[op] = fn
 
@@ -173,10 +301,12 @@ class SkratimenewsStack(Stack):
             ),
             environment={
                 "CATEGORIES_TABLE_NAME": categories_table.table_name,
+                "CATEGORIZER_CACHE_TABLE_NAME": categorizer_cache_table.table_name,
             },
         )
 
         categories_table.grant_read_write_data(create_category_lambda)
+        categorizer_cache_table.grant_write_data(create_category_lambda)
         categories_table.grant_read_data(get_category_lambda)
 
         # Add methods to API Gateway with Cognito authorizer
@@ -221,6 +351,27 @@ class SkratimenewsStack(Stack):
             authorization_type=apigateway.AuthorizationType.COGNITO,
         )
 
+        # === S3 Bucket for offloaded article bodies (claim-check) ===
+        article_bucket = s3.Bucket(
+            self,
+            "ArticleBodiesBucket",
+            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+            encryption=s3.BucketEncryption.S3_MANAGED,
+            lifecycle_rules=[s3.LifecycleRule(expiration=Duration.days(7))],
+            removal_policy=RemovalPolicy.DESTROY,
+            auto_delete_objects=True,
+        )
+
+        # === S3 Bucket for the published pre-classifier model ===
+        preclassifier_bucket = s3.Bucket(
+            self,
+            "PreclassifierModelBucket",
+            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+            encryption=s3.BucketEncryption.S3_MANAGED,
+            removal_policy=RemovalPolicy.DESTROY,
+            auto_delete_objects=True,
+        )
+
         # === SQS Queue ===
         rss_queue = sqs.Queue(
             self,
@@ -234,6 +385,9 @@ class SkratimenewsStack(Stack):
             runtime=_lambda.Runtime.PYTHON_3_12,
             handler="categorizer.lambda_handler",
             timeout=Duration.seconds(600),
+            # Pre-classifier centroids are ~64 KB per category; the headroom
+            # is for numpy and the Bedrock batches, and buys CPU share.
+            memory_size=512,
             code=_lambda.Code.from_asset(
                 os.path.join("lambdas"),
                 bundling={
@@ -241,21 +395,28 @@ class SkratimenewsStack(Stack):
                     "command": [
                         "bash",
                         "-c",
-                        "pip install pynamodb pydantic aws-lambda-powertools -t /asset-output && cp -r . /asset-output",
+                        "pip install pynamodb pydantic aws-lambda-powertools numpy -t /asset-output && cp -r . /asset-output",
                     ],
                 },
             ),
             environment={
                 "NEWS_TABLE_NAME": table.table_name,
                 "CATEGORIES_TABLE_NAME": categories_table.table_name,
+                "CATEGORIZER_CACHE_TABLE_NAME": categorizer_cache_table.table_name,
+                "PRECLASSIFIER_BUCKET_NAME": preclassifier_bucket.bucket_name,
             },
         )
 
+        article_bucket.grant_read(categorizer_lambda)
+        preclassifier_bucket.grant_read(categorizer_lambda)
+        categorizer_cache_table.grant_read_write_data(categorizer_lambda)
+
         categorizer_lambda.add_event_source_mapping(
             "CategorizerQueueMapping",
             event_source_arn=rss_queue.queue_arn,
             batch_size=10,
             enabled=True,
+            report_batch_item_failures=True,
         )
 
         categorizer_lambda.add_to_role_policy(
@@ -271,6 +432,45 @@ class SkratimenewsStack(Stack):
         categories_table.grant_read_write_data(categorizer_lambda)
         table.grant_read_write_data(categorizer_lambda)
 
+        # === Pre-classifier builder ===
+        # Scans the labelled news off the request path and publishes the
+        # centroids the categorizer loads, so its cold starts read no table.
+        preclassifier_builder_lambda = _lambda.Function(
+            self,
+            "PreclassifierBuilderLambda",
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            handler="build_preclassifier.lambda_handler",
+            timeout=Duration.seconds(300),
+            memory_size=512,
+            code=_lambda.Code.from_asset(
+                os.path.join("lambdas"),
+                bundling={
+                    "image": _lambda.Runtime.PYTHON_3_12.bundling_image,
+                    "command": [
+                        "bash",
+                        "-c",
+                        "pip install pynamodb pydantic aws-lambda-powertools numpy -t /asset-output && cp -r . /asset-output",
+                    ],
+                },
+            ),
+            environment={
+                "NEWS_TABLE_NAME": table.table_name,
+                "CATEGORIES_TABLE_NAME": categories_table.table_name,
+                "PRECLASSIFIER_BUCKET_NAME": preclassifier_bucket.bucket_name,
+            },
+        )
+
+        table.grant_read_data(preclassifier_builder_lambda)
+        categories_table.grant_read_data(preclassifier_builder_lambda)
+        preclassifier_bucket.grant_put(preclassifier_builder_lambda)
+
+        events.Rule(
+            self,
+            "PreclassifierScheduleRule",
+            schedule=events.Schedule.rate(duration=Duration.hours(6)),
+            targets=[targets.LambdaFunction(preclassifier_builder_lambda)],
+        )
+
         # === RSS Lambda ===
         rss_lambda = _lambda.Function(
             self,
@@ -285,21 +485,28 @@ class SkratimenewsStack(Stack):
                     "command": [
                         "bash",
                         "-c",
-                        "pip install pynamodb pydantic aws-lambda-powertools feedparser beautifulsoup4 requests -t /asset-output && cp -r . /asset-output",
+                        "pip install pynamodb pydantic aws-lambda-powertools feedparser beautifulsoup4 lxml requests -t /asset-output && cp -r . /asset-output",
                     ],
                 },
             ),
             environment={
                 "RSS_URL": "https://feeds.feedburner.com/TheHackersNews",
                 "TABLE_NAME": fetch_table.table_name,
+                "FEEDS_TABLE_NAME": feeds_table.table_name,
                 "NEWS_TABLE_NAME": table.table_name,
                 "CATEGORIES_TABLE_NAME": categories_table.table_name,
                 "RSS_QUEUE_URL": rss_queue.queue_url,
+                "FETCH_CONCURRENCY": "8",
+                "FETCH_PER_HOST_LIMIT": "2",
+                "ARTICLE_BUCKET_NAME": article_bucket.bucket_name,
             },
         )
 
+        article_bucket.grant_put(rss_lambda)
+
         # Grant permissions
         fetch_table.grant_read_write_data(rss_lambda)
+        feeds_table.grant_read_data(rss_lambda)
         table.grant_read_write_data(rss_lambda)
         categories_table.grant_read_write_data(rss_lambda)
         rss_lambda.add_to_role_policy(
@@ -319,19 +526,54 @@ class SkratimenewsStack(Stack):
             schedule=events.Schedule.rate(duration=Duration.minutes(30)),
         )
 
-        rule.add_target(targets.LambdaFunction(rss_lambda))
+        # Each target scrapes the subset of feeds whose id hashes to its shard.
+        for shard_index in range(SCRAPE_SHARD_COUNT):
+            rule.add_target(
+                targets.LambdaFunction(
+                    rss_lambda,
+                    event=events.RuleTargetInput.from_object(
+                        {
+                            "shard_index": shard_index,
+                            "shard_count": SCRAPE_SHARD_COUNT,
+                        }
+                    ),
+                )
+            )
 
         # === Bookmarks lambdas ===
-        for op in ["add", "remove", "get"]:
+        bookmarks_resource = api.root.add_resource("bookmarks")
+        bookmark_routes = {
+            "add": (bookmarks_resource, "POST", "add_bookmark"),
+            "remove": (
+                bookmarks_resource.add_resource("{news_id}"),
+                "DELETE",
+                "remove_bookmark",
+            ),
+            "get": (bookmarks_resource, "GET", "get_bookmark"),
+            "bulk": (
+                bookmarks_resource.add_resource("batch"),
+                "POST",
+                "bulk_bookmarks",
+            ),
+            "membership": (
+                bookmarks_resource.add_resource("membership"),
+                "GET",
+                "bookmark_membership",
+            ),
+        }
+        for op, (bookmark_resource, method, module) in bookmark_routes.items():
             env_vars = {
                 "BOOKMARKS_TABLE_NAME": bookmarks_table.table_name,
+                "NEWS_TABLE_NAME": table.table_name,
             }
+            if op == "get":
+                env_vars["CURSOR_SECRET_ARN"] = cursor_secret.secret_arn
 
             fn = _lambda.Function(
                 self,
                 f"{op.capitalize()}BookmarkLambda",
                 runtime=_lambda.Runtime.PYTHON_3_12,
-                handler=f"{op}_bookmark.handler",
+                handler=f"{module}.handler",
                 code=_lambda.Code.from_asset(
                     os.path.join("lambdas"),
                     bundling={
@@ -347,16 +589,11 @@ class SkratimenewsStack(Stack):
             )
 
             bookmarks_table.grant_read_write_data(fn)
-
-            # Add API Gateway methods for bookmarks
+            table.grant_read_data(fn)
             if op == "get":
-                method = "GET"
-            elif op == "remove":
-                method = "DELETE"
-            else:
-                method = "POST"
+                cursor_secret.grant_read(fn)
 
-            bookmark_resource = api.root.add_resource("bookmarks")
+            # Add API Gateway methods for bookmarks
             bookmark_resource.add_method(
                 method,
                 apigateway.LambdaIntegration(fn),
@@ -364,6 +601,45 @@ class SkratimenewsStack(Stack):
                 authorization_type=apigateway.AuthorizationType.COGNITO,
             )
 
+        # === Bookmark card refresher ===
+        refresh_bookmark_cards_lambda = _lambda.Function(
+            self,
+            "RefreshBookmarkCardsLambda",
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            handler="refresh_bookmark_cards.handler",
+            timeout=Duration.seconds(60),
+            code=_lambda.Code.from_asset(
+                os.path.join("lambdas"),
+                bundling={
+                    "image": _lambda.Runtime.PYTHON_3_12.bundling_image,
+                    "command": [
+                        "bash",
+                        "-c",
+                        "pip install pynamodb pydantic aws-lambda-powertools -t /asset-output && cp -r . /asset-output",
+                    ],
+                },
+            ),
+            environment={
+                "BOOKMARKS_TABLE_NAME": bookmarks_table.table_name,
+                "NEWS_TABLE_NAME": table.table_name,
+            },
+        )
+
+        refresh_bookmark_cards_lambda.add_event_source_mapping(
+            "BookmarkCardsQueueMapping",
+            event_source_arn=bookmark_cards_queue.queue_arn,
+            batch_size=10,
+            enabled=True,
+            report_batch_item_failures=True,
+        )
+
+        bookmark_cards_queue.grant_consume_messages(refresh_bookmark_cards_lambda)
+        bookmarks_table.grant_read_write_data(refresh_bookmark_cards_lambda)
+        table.grant_read_data(refresh_bookmark_cards_lambda)
+
+        # Read by scripts/deploy_news_indexes.sh to backfill published_day.
+        CfnOutput(self, "NewsTableName", value=table.table_name)
+
 
 app = App()
 SkratimenewsStack(app, "SkratimenewsStack")
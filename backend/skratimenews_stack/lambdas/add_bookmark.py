@@ -3,10 +3,13 @@ import json
 from datetime import datetime
 from pynamodb.models import Model
 from pynamodb.attributes import UnicodeAttribute, UTCDateTimeAttribute
+from pynamodb.exceptions import PutError
 from aws_lambda_powertools import Logger
 
 TABLE_NAME = os.environ["BOOKMARKS_TABLE_NAME"]
+NEWS_TABLE_NAME = os.environ["NEWS_TABLE_NAME"]
 AWS_REGION = "eu-central-1"
+CARD_FIELDS = ["id", "title", "summary", "category_id", "picture_url"]
 
 logger = Logger(service="AddBookmarkLambda")
 
@@ -20,6 +23,25 @@ class UserBookmarkModel(Model):
     news_id = UnicodeAttribute(range_key=True)
     created_at = UTCDateTimeAttribute()
 
+    # Card snapshot of the bookmarked news item, kept fresh by
+    # refresh_bookmark_cards so listing bookmarks needs no join.
+    title = UnicodeAttribute(null=True)
+    summary = UnicodeAttribute(null=True)
+    category_id = UnicodeAttribute(null=True)
+    picture_url = UnicodeAttribute(null=True)
+
+
+class SkratimenewsModel(Model):
+    class Meta:
+        table_name = NEWS_TABLE_NAME
+        region = AWS_REGION
+
+    id = UnicodeAttribute(hash_key=True)
+    title = UnicodeAttribute(null=True)
+    summary = UnicodeAttribute(null=True)
+    category_id = UnicodeAttribute(null=True)
+    picture_url = UnicodeAttribute(null=True)
+
 
 def handler(event, context):
     logger.info("Received event", extra={"event": event})
@@ -54,28 +76,40 @@ def handler(event, context):
                 "body": json.dumps({"error": "news_id is required"}),
             }
 
-        # Check if bookmark already exists
         try:
-            existing_bookmark = UserBookmarkModel.get(user_id, news_id)
-            logger.info(
-                "Bookmark already exists",
-                extra={"user_id": user_id, "news_id": news_id},
-            )
+            news_item = SkratimenewsModel.get(news_id, attributes_to_get=CARD_FIELDS)
+        except SkratimenewsModel.DoesNotExist:
+            logger.warning("News item not found", extra={"news_id": news_id})
             return {
-                "statusCode": 200,
-                "body": json.dumps({"message": "Bookmark already exists"}),
+                "statusCode": 404,
+                "body": json.dumps({"error": "News item not found"}),
             }
-        except UserBookmarkModel.DoesNotExist:
-            # Bookmark doesn't exist, create it
-            pass
 
-        # Create bookmark
+        # Create bookmark with a snapshot of the news card
         bookmark = UserBookmarkModel(
             user_id=user_id,
             news_id=news_id,
             created_at=datetime.utcnow(),
+            title=news_item.title,
+            summary=news_item.summary,
+            category_id=news_item.category_id,
+            picture_url=news_item.picture_url,
         )
-        bookmark.save()
+        try:
+            # The condition replaces a separate existence check and keeps
+            # concurrent clicks from overwriting the original created_at.
+            bookmark.save(condition=UserBookmarkModel.news_id.does_not_exist())
+        except PutError as e:
+            if e.cause_response_code != "ConditionalCheckFailedException":
+                raise
+            logger.info(
+                "Bookmark already exists",
+                extra={"user_id": user_id, "news_id": news_id},
+            )
+            return {
+                "statusCode": 200,
+                "body": json.dumps({"message": "Bookmark already exists"}),
+            }
 
         logger.info(
             "Bookmark created successfully",
@@ -0,0 +1,104 @@
+import os
+import json
+from pynamodb.models import Model
+from pynamodb.attributes import UnicodeAttribute, UTCDateTimeAttribute
+from aws_lambda_powertools import Logger
+
+BOOKMARKS_TABLE_NAME = os.environ["BOOKMARKS_TABLE_NAME"]
+AWS_REGION = "eu-central-1"
+# One BatchGetItem call reads at most 100 keys.
+MAX_MEMBERSHIP_IDS = 100
+
+logger = Logger(service="BookmarkMembershipLambda")
+
+
+class UserBookmarkModel(Model):
+    class Meta:
+        table_name = BOOKMARKS_TABLE_NAME
+        region = AWS_REGION
+
+    user_id = UnicodeAttribute(hash_key=True)
+    news_id = UnicodeAttribute(range_key=True)
+    created_at = UTCDateTimeAttribute()
+
+
+def find_bookmarked(user_id, news_ids):
+    """Return the subset of ``news_ids`` the user has bookmarked.
+
+    Reads keys only, so the cost doesn't depend on the size of the bookmark
+    items or on how many bookmarks the user has.
+    """
+    news_ids = list(dict.fromkeys(news_ids))
+    if not news_ids:
+        return set()
+    return {
+        bookmark.news_id
+        for bookmark in UserBookmarkModel.batch_get(
+            [(user_id, news_id) for news_id in news_ids],
+            attributes_to_get=["news_id"],
+        )
+    }
+
+
+def handler(event, context):
+    logger.info("Received event", extra={"event": event})
+
+    # Handle CORS preflight
+    if event.get("httpMethod") == "OPTIONS":
+        logger.info("OPTIONS preflight request")
+        return {
+            "statusCode": 200,
+            "headers": {
+                "Access-Control-Allow-Origin": event.get("headers", {}).get(
+                    "origin", "*"
+                ),
+                "Access-Control-Allow-Methods": "OPTIONS,GET",
+                "Access-Control-Allow-Headers": "Content-Type,Authorization",
+            },
+            "body": json.dumps({"message": "OK"}),
+        }
+
+    try:
+        # Extract user ID from Cognito authorizer context
+        user_id = event["requestContext"]["authorizer"]["claims"]["sub"]
+        logger.info("User ID extracted", extra={"user_id": user_id})
+
+        query_params = event.get("queryStringParameters") or {}
+        news_ids = [
+            news_id.strip()
+            for news_id in query_params.get("news_ids", "").split(",")
+            if news_id.strip()
+        ]
+
+        if not news_ids:
+            return {
+                "statusCode": 400,
+                "body": json.dumps({"error": "news_ids is required"}),
+            }
+        if len(news_ids) > MAX_MEMBERSHIP_IDS:
+            return {
+                "statusCode": 400,
+                "body": json.dumps(
+                    {"error": f"At most {MAX_MEMBERSHIP_IDS} news ids per request"}
+                ),
+            }
+
+        bookmarked = find_bookmarked(user_id, news_ids)
+
+        return {
+            "statusCode": 200,
+            "body": json.dumps(
+                {
+                    "bookmarked": [
+                        news_id for news_id in news_ids if news_id in bookmarked
+                    ]
+                }
+            ),
+        }
+
+    except Exception as e:
+        logger.error("Unhandled exception", extra={"error": str(e)})
+        return {
+            "statusCode": 500,
+            "body": json.dumps({"error": str(e)}),
+        }
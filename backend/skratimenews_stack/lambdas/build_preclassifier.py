@@ -0,0 +1,74 @@
+"""Rebuild the categorizer's pre-classifier and publish it to S3.
+
+Runs on a schedule so the categorizer never scans the news table itself: it
+trains on the Bedrock-labelled news, keeps the categories that still exist,
+and writes the centroids, tagged with the category-set version, to
+PRECLASSIFIER_BUCKET_NAME/PRECLASSIFIER_MODEL_KEY. Invoke it by hand after
+the first deploy or after changing categories to publish right away.
+"""
+
+import io
+import os
+import time
+
+import boto3
+from aws_lambda_powertools import Logger
+
+import categorizer
+import preclassifier
+
+logger = Logger(service="PreclassifierBuilderLambda", level="INFO")
+
+PRECLASSIFIER_SAMPLE_SIZE = int(os.environ.get("PRECLASSIFIER_SAMPLE_SIZE", "2000"))
+
+s3 = boto3.client("s3", region_name=categorizer.AWS_REGION)
+
+
+def lambda_handler(event, context):
+    if not categorizer.PRECLASSIFIER_BUCKET_NAME:
+        logger.warning("PRECLASSIFIER_BUCKET_NAME is not set; nothing to publish")
+        return {"published": False}
+
+    started = time.monotonic()
+    snapshot = categorizer._build_category_snapshot(
+        categorizer._load_categories(), None, started
+    )
+    known_ids = set(snapshot["lookup"].values())
+    samples = [
+        (summary, category_id)
+        for summary, category_id in preclassifier._scan_labeled_news(
+            categorizer.NEWS_TABLE_NAME,
+            categorizer.AWS_REGION,
+            PRECLASSIFIER_SAMPLE_SIZE,
+        )
+        if category_id in known_ids
+    ]
+    model = preclassifier.build_model(samples)
+    if model is None:
+        # The categorizer rejects a model built for another category set, so
+        # a stale artifact left in place is never used.
+        logger.warning(
+            "Not enough labelled news to build the pre-classifier",
+            extra={"samples": len(samples)},
+        )
+        return {"published": False, "samples": len(samples)}
+
+    body = io.BytesIO()
+    preclassifier.save_model(model, body, snapshot["set_version"])
+    s3.put_object(
+        Bucket=categorizer.PRECLASSIFIER_BUCKET_NAME,
+        Key=categorizer.PRECLASSIFIER_MODEL_KEY,
+        Body=body.getvalue(),
+    )
+    result = {
+        "published": True,
+        "samples": model["samples"],
+        "categories": len(model["category_ids"]),
+        "category_version": snapshot["set_version"],
+        "bytes": body.tell(),
+    }
+    logger.info(
+        "Published pre-classifier",
+        extra={**result, "latency_ms": int((time.monotonic() - started) * 1000)},
+    )
+    return result
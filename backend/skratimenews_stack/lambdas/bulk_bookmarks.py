@@ -0,0 +1,171 @@
+import os
+import json
+from datetime import datetime
+from pynamodb.models import Model
+from pynamodb.attributes import UnicodeAttribute, UTCDateTimeAttribute
+from aws_lambda_powertools import Logger
+
+TABLE_NAME = os.environ["BOOKMARKS_TABLE_NAME"]
+NEWS_TABLE_NAME = os.environ["NEWS_TABLE_NAME"]
+AWS_REGION = "eu-central-1"
+CARD_FIELDS = ["id", "title", "summary", "category_id", "picture_url"]
+# One BatchWriteItem call carries at most 25 put/delete requests.
+MAX_BULK_BOOKMARKS = 25
+
+logger = Logger(service="BulkBookmarksLambda")
+
+
+class UserBookmarkModel(Model):
+    class Meta:
+        table_name = TABLE_NAME
+        region = AWS_REGION
+
+    user_id = UnicodeAttribute(hash_key=True)
+    news_id = UnicodeAttribute(range_key=True)
+    created_at = UTCDateTimeAttribute()
+
+    # Card snapshot of the bookmarked news item
+    title = UnicodeAttribute(null=True)
+    summary = UnicodeAttribute(null=True)
+    category_id = UnicodeAttribute(null=True)
+    picture_url = UnicodeAttribute(null=True)
+
+
+class SkratimenewsModel(Model):
+    class Meta:
+        table_name = NEWS_TABLE_NAME
+        region = AWS_REGION
+
+    id = UnicodeAttribute(hash_key=True)
+    title = UnicodeAttribute(null=True)
+    summary = UnicodeAttribute(null=True)
+    category_id = UnicodeAttribute(null=True)
+    picture_url = UnicodeAttribute(null=True)
+
+
+def handler(event, context):
+    """Add and remove many bookmarks with a single BatchWriteItem call.
+
+    The body is ``{"add": [news_id, ...], "remove": [news_id, ...]}``. Adds
+    skip news items that don't exist and bookmarks the user already has, so
+    their ``created_at`` is kept; removes of missing bookmarks are no-ops.
+    """
+    logger.info("Received event", extra={"event": event})
+
+    # Handle CORS preflight
+    if event.get("httpMethod") == "OPTIONS":
+        logger.info("OPTIONS preflight request")
+        return {
+            "statusCode": 200,
+            "headers": {
+                "Access-Control-Allow-Origin": event.get("headers", {}).get(
+                    "origin", "*"
+                ),
+                "Access-Control-Allow-Methods": "OPTIONS,POST",
+                "Access-Control-Allow-Headers": "Content-Type,Authorization",
+            },
+            "body": json.dumps({"message": "OK"}),
+        }
+
+    try:
+        # Extract user ID from Cognito authorizer context
+        user_id = event["requestContext"]["authorizer"]["claims"]["sub"]
+        logger.info("User ID extracted", extra={"user_id": user_id})
+
+        # Parse request body
+        body = json.loads(event.get("body") or "{}")
+        add_ids = list(dict.fromkeys(body.get("add") or []))
+        remove_ids = list(dict.fromkeys(body.get("remove") or []))
+
+        if not add_ids and not remove_ids:
+            return {
+                "statusCode": 400,
+                "body": json.dumps({"error": "add or remove is required"}),
+            }
+        if len(add_ids) + len(remove_ids) > MAX_BULK_BOOKMARKS:
+            return {
+                "statusCode": 400,
+                "body": json.dumps(
+                    {"error": f"At most {MAX_BULK_BOOKMARKS} news ids per request"}
+                ),
+            }
+        if set(add_ids) & set(remove_ids):
+            return {
+                "statusCode": 400,
+                "body": json.dumps({"error": "A news id can't be added and removed"}),
+            }
+
+        not_found = []
+        already_bookmarked = []
+        new_bookmarks = []
+        if add_ids:
+            existing_ids = {
+                bookmark.news_id
+                for bookmark in UserBookmarkModel.batch_get(
+                    [(user_id, news_id) for news_id in add_ids],
+                    attributes_to_get=["user_id", "news_id"],
+                )
+            }
+            cards = {
+                news_item.id: news_item
+                for news_item in SkratimenewsModel.batch_get(
+                    [news_id for news_id in add_ids if news_id not in existing_ids],
+                    attributes_to_get=CARD_FIELDS,
+                )
+            }
+
+            created_at = datetime.utcnow()
+            for news_id in add_ids:
+                if news_id in existing_ids:
+                    already_bookmarked.append(news_id)
+                elif news_id not in cards:
+                    not_found.append(news_id)
+                else:
+                    news_item = cards[news_id]
+                    new_bookmarks.append(
+                        UserBookmarkModel(
+                            user_id=user_id,
+                            news_id=news_id,
+                            created_at=created_at,
+                            title=news_item.title,
+                            summary=news_item.summary,
+                            category_id=news_item.category_id,
+                            picture_url=news_item.picture_url,
+                        )
+                    )
+
+        # Puts and deletes go out together; unprocessed items are retried.
+        with UserBookmarkModel.batch_write() as batch:
+            for bookmark in new_bookmarks:
+                batch.save(bookmark)
+            for news_id in remove_ids:
+                batch.delete(UserBookmarkModel(user_id, news_id))
+
+        logger.info(
+            "Bulk bookmarks applied",
+            extra={
+                "user_id": user_id,
+                "added": len(new_bookmarks),
+                "removed": len(remove_ids),
+                "skipped": len(already_bookmarked) + len(not_found),
+            },
+        )
+
+        return {
+            "statusCode": 200,
+            "body": json.dumps(
+                {
+                    "added": [bookmark.news_id for bookmark in new_bookmarks],
+                    "removed": remove_ids,
+                    "already_bookmarked": already_bookmarked,
+                    "not_found": not_found,
+                }
+            ),
+        }
+
+    except Exception as e:
+        logger.error("Unhandled exception", extra={"error": str(e)})
+        return {
+            "statusCode": 500,
+            "body": json.dumps({"error": str(e)}),
+        }
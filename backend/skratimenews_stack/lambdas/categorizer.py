@@ -1,90 +1,380 @@
+import datetime
+import gzip
+import hashlib
+import io
 import json
 import os
+import random
 import re
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
-from aws_lambda_powertools import Logger
+from aws_lambda_powertools import Logger, Metrics
+from aws_lambda_powertools.metrics import MetricUnit
+from botocore.config import Config
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotocoreConnectionError
+
+import preclassifier
+from news_store import (
+    DYNAMODB_BATCH_GET_LIMIT,
+    dynamodb_resource,
+    find_existing_news_ids,
+)
 
 logger = Logger(service="CategorizerLambda", level="INFO")
+metrics = Metrics(namespace="Skratimenews", service="CategorizerLambda")
 
 BEDROCK_MODEL_ID = os.environ.get("BEDROCK_MODEL_ID", "amazon.titan-text-lite-v1")
 AWS_REGION = os.environ.get("AWS_REGION", "eu-central-1")
 NEWS_TABLE_NAME = os.environ["NEWS_TABLE_NAME"]
 CATEGORIES_TABLE_NAME = os.environ["CATEGORIES_TABLE_NAME"]
+CATEGORIZER_CACHE_TABLE_NAME = os.environ.get("CATEGORIZER_CACHE_TABLE_NAME")
+CATEGORY_CACHE_TTL_SECONDS = int(
+    os.environ.get("CATEGORY_CACHE_TTL_SECONDS", str(30 * 24 * 3600))
+)
+CATEGORY_VERSION_KEY = "categories#version"
+CATEGORY_VERSION_CHECK_SECONDS = int(
+    os.environ.get("CATEGORY_VERSION_CHECK_SECONDS", "60")
+)
+CATEGORY_CACHE_MAX_AGE_SECONDS = int(
+    os.environ.get("CATEGORY_CACHE_MAX_AGE_SECONDS", "3600")
+)
+PRECLASSIFIER_THRESHOLD = float(
+    os.environ.get("PRECLASSIFIER_THRESHOLD", str(preclassifier.DEFAULT_THRESHOLD))
+)
+PRECLASSIFIER_MIN_MARGIN = float(
+    os.environ.get("PRECLASSIFIER_MIN_MARGIN", str(preclassifier.DEFAULT_MIN_MARGIN))
+)
+# Published by build_preclassifier; warm containers look for a newer copy
+# every PRECLASSIFIER_MAX_AGE_SECONDS with a conditional GET.
+PRECLASSIFIER_BUCKET_NAME = os.environ.get("PRECLASSIFIER_BUCKET_NAME")
+PRECLASSIFIER_MODEL_KEY = os.environ.get(
+    "PRECLASSIFIER_MODEL_KEY", "preclassifier/model.npz"
+)
+PRECLASSIFIER_MAX_AGE_SECONDS = int(
+    os.environ.get("PRECLASSIFIER_MAX_AGE_SECONDS", "900")
+)
+ARTICLE_STORE_DIR = os.environ.get("ARTICLE_STORE_DIR")
+DYNAMODB_BATCH_WRITE_LIMIT = 25
+DYNAMODB_WRITE_ATTEMPTS = int(os.environ.get("DYNAMODB_WRITE_ATTEMPTS", "4"))
+CATEGORIZE_BATCH_SIZE = int(os.environ.get("CATEGORIZE_BATCH_SIZE", "10"))
+BEDROCK_ENDPOINT_URL = os.environ.get("BEDROCK_ENDPOINT_URL")
+BEDROCK_CONCURRENCY = int(os.environ.get("BEDROCK_CONCURRENCY", "4"))
+BEDROCK_RATE_PER_SECOND = float(os.environ.get("BEDROCK_RATE_PER_SECOND", "5"))
+BEDROCK_MAX_ATTEMPTS = int(os.environ.get("BEDROCK_MAX_ATTEMPTS", "5"))
+BEDROCK_BACKOFF_BASE_SECONDS = 0.5
+BEDROCK_BACKOFF_CAP_SECONDS = 8.0
+# Besides these codes, any 5xx response and connection or read timeouts are
+# retried; everything else (validation, access denied) fails straight away.
+BEDROCK_RETRYABLE_ERRORS = {
+    "ThrottlingException",
+    "ServiceUnavailableException",
+    "ModelTimeoutException",
+    "ModelNotReadyException",
+    "InternalServerException",
+}
+
+# Throttling and transient errors are retried here (with the token bucket)
+# rather than by botocore.
+bedrock = boto3.client(
+    "bedrock-runtime",
+    region_name=AWS_REGION,
+    endpoint_url=BEDROCK_ENDPOINT_URL,
+    config=Config(
+        retries={"total_max_attempts": 1},
+        max_pool_connections=BEDROCK_CONCURRENCY,
+    ),
+)
+s3 = boto3.client("s3", region_name=AWS_REGION)
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the Bedrock request rate."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 
-dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
-news_table = dynamodb.Table(NEWS_TABLE_NAME)
-categories_table = dynamodb.Table(CATEGORIES_TABLE_NAME)
-bedrock = boto3.client("bedrock-runtime", region_name=AWS_REGION)
+bedrock_limiter = TokenBucket(BEDROCK_RATE_PER_SECOND, max(1, BEDROCK_CONCURRENCY))
 
 
+@metrics.log_metrics
 def lambda_handler(event, context):
     records = event.get("Records", [])
     logger.info("Received records", extra={"count": len(records)})
 
-    categories = _load_categories()
-    if not categories:
+    snapshot = _get_category_snapshot()
+    category_names = snapshot["names"]
+    category_lookup = snapshot["lookup"]
+    if not category_names:
         logger.warning("No categories loaded; all items default to uncategorized")
 
-    category_names = [cat["name"] for cat in categories if cat.get("name")]
-    category_lookup = {
-        cat["name"].lower(): cat["id"]
-        for cat in categories
-        if cat.get("id") and cat.get("name")
-    }
-
     processed = 0
+    duplicates = 0
     failed = 0
+    batch_item_failures = []
+
+    payloads = [_parse_payload(record) for record in records]
+    existing_ids = _find_existing_news_ids(
+        [payload["id"] for payload in payloads if payload and payload.get("id")]
+    )
 
-    for idx, record in enumerate(records):
+    pending = []
+    pending_ids = set()
+    for idx, (record, payload) in enumerate(zip(records, payloads)):
         logger.info("Processing record", extra={"record_index": idx})
-        payload = _parse_payload(record)
         if not payload:
+            # Malformed bodies never succeed on redelivery, so they aren't retried.
             failed += 1
             continue
 
-        category_id = categorize_summary(
-            payload.get("summary", ""),
-            category_names,
-            category_lookup,
-        )
-
-        news_item = {
-            "id": str(uuid.uuid4()),
-            "title": payload.get("title", ""),
-            "summary": payload.get("summary", ""),
-            "category_id": category_id,
-            "picture_url": payload.get("picture_url", ""),
-            "news_link": payload.get("news_link", ""),
-            "published_at": payload.get("published_at_utc", ""),
-            "author": payload.get("author", ""),
-            "full_article": payload.get("full_article", ""),
-        }
+        news_id = payload.get("id") or str(uuid.uuid4())
+        if news_id in existing_ids or news_id in pending_ids:
+            duplicates += 1
+            logger.info(
+                "Skipping already stored news item",
+                extra={"news_id": news_id, "title": payload.get("title")},
+            )
+            continue
+        pending_ids.add(news_id)
+        pending.append((record.get("messageId"), news_id, payload))
 
+    categories = categorize_summaries(
+        [payload.get("summary", "") for _, _, payload in pending],
+        category_names,
+        category_lookup,
+        category_version=snapshot["set_version"],
+        category_index=snapshot["index"],
+    )
+
+    news_items = {}
+    for (message_id, news_id, payload), (category_id, category_source) in zip(
+        pending, categories
+    ):
+        if category_id is None:
+            # Stored as "uncategorized" it would never be revisited, since
+            # redeliveries of a stored id are skipped as duplicates.
+            failed += 1
+            batch_item_failures.append({"itemIdentifier": message_id})
+            logger.error(
+                "Bedrock call failed; leaving item for redelivery",
+                extra={"news_id": news_id},
+            )
+            continue
         try:
-            news_table.put_item(Item=news_item)
+            news_item = build_news_item(news_id, payload, category_id, category_source)
+        except Exception as exc:
+            failed += 1
+            batch_item_failures.append({"itemIdentifier": message_id})
+            logger.error(
+                "Failed to load offloaded article body",
+                extra={"error": str(exc), "ref": payload.get("full_article_ref")},
+            )
+            continue
+
+        news_items[message_id] = news_item
+
+    failed_ids = write_news_items(list(news_items.values()))
+    for message_id, news_item in news_items.items():
+        if news_item["id"] in failed_ids:
+            failed += 1
+            batch_item_failures.append({"itemIdentifier": message_id})
+        else:
             processed += 1
             logger.info(
                 "Saved news item",
-                extra={"title": news_item["title"], "category_id": category_id},
+                extra={
+                    "title": news_item["title"],
+                    "category_id": news_item["category_id"],
+                },
             )
+
+    logger.info(
+        "Categorizer finished",
+        extra={
+            "processed": processed,
+            "duplicates": duplicates,
+            "failed": failed,
+            "retried": len(batch_item_failures),
+        },
+    )
+    return {"batchItemFailures": batch_item_failures}
+
+
+def build_news_item(news_id, payload, category_id, category_source=None):
+    """Build the news table item, resolving an offloaded article body."""
+    # published_at is an index sort key, so it can't be empty; items without a
+    # feed date are dated when they're stored. published_day buckets the
+    # latest-news index.
+    published_at = payload.get("published_at_utc") or _utc_now_iso()
+    news_item = {
+        "id": news_id,
+        "title": payload.get("title", ""),
+        "summary": payload.get("summary", ""),
+        "category_id": category_id,
+        "picture_url": payload.get("picture_url", ""),
+        "news_link": payload.get("news_link", ""),
+        "published_at": published_at,
+        "published_day": published_at[:10],
+        "author": payload.get("author", ""),
+        "full_article": _resolve_full_article(payload),
+    }
+    if category_source:
+        news_item["category_source"] = category_source
+    return news_item
+
+
+def _utc_now_iso():
+    return (
+        datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat()
+    )
+
+
+def write_news_items(news_items):
+    """Persist items with BatchWriteItem and return the ids that failed.
+
+    News ids are derived from the article link, so a retried or duplicate
+    put overwrites the same row instead of adding one.
+    """
+    failed_ids = set()
+    for start in range(0, len(news_items), DYNAMODB_BATCH_WRITE_LIMIT):
+        chunk = news_items[start : start + DYNAMODB_BATCH_WRITE_LIMIT]
+        request = {NEWS_TABLE_NAME: [{"PutRequest": {"Item": item}} for item in chunk]}
+        try:
+            for attempt in range(1, DYNAMODB_WRITE_ATTEMPTS + 1):
+                response = dynamodb_resource(AWS_REGION).batch_write_item(
+                    RequestItems=request
+                )
+                request = response.get("UnprocessedItems") or None
+                if not request or attempt == DYNAMODB_WRITE_ATTEMPTS:
+                    break
+                time.sleep(random.uniform(0, 0.1 * 2**attempt))
         except Exception as exc:
-            failed += 1
+            logger.warning(
+                "BatchWriteItem failed; writing items individually",
+                extra={"error": str(exc), "size": len(chunk)},
+            )
+            failed_ids.update(_put_news_items(chunk))
+            continue
+
+        for put in (request or {}).get(NEWS_TABLE_NAME, []):
+            failed_ids.add(put["PutRequest"]["Item"]["id"])
+            logger.error(
+                "News item left unprocessed after retries",
+                extra={"news_id": put["PutRequest"]["Item"]["id"]},
+            )
+    return failed_ids
+
+
+def _put_news_items(news_items):
+    failed_ids = set()
+    news_table = dynamodb_resource(AWS_REGION).Table(NEWS_TABLE_NAME)
+    for news_item in news_items:
+        try:
+            news_table.put_item(Item=news_item)
+        except Exception as exc:
+            failed_ids.add(news_item["id"])
             logger.error(
                 "Failed to save news item",
                 extra={"error": str(exc), "news_id": news_item["id"]},
             )
+    return failed_ids
+
+
+# Survives across warm invocations; rebuilt when create_category bumps the
+# version counter or the snapshot outlives CATEGORY_CACHE_MAX_AGE_SECONDS.
+_category_snapshot = None
+
+
+def _get_category_snapshot():
+    global _category_snapshot
+
+    now = time.monotonic()
+    snapshot = _category_snapshot
+    version = None
+    if snapshot and now - snapshot["loaded_at"] < CATEGORY_CACHE_MAX_AGE_SECONDS:
+        if now - snapshot["checked_at"] < CATEGORY_VERSION_CHECK_SECONDS:
+            return snapshot
+        version = _load_category_version()
+        if version == snapshot["version"]:
+            snapshot["checked_at"] = now
+            return snapshot
+    else:
+        version = _load_category_version()
 
+    categories = _load_categories()
+    if not categories and snapshot and snapshot["names"]:
+        logger.warning("Category reload returned nothing; keeping cached categories")
+        snapshot["checked_at"] = now
+        return snapshot
+
+    rebuilt = _build_category_snapshot(categories, version, now)
     logger.info(
-        "Categorizer finished",
-        extra={"processed": processed, "failed": failed},
+        "Built category snapshot",
+        extra={"version": version, "count": len(rebuilt["names"])},
     )
-    return {"statusCode": 200}
+    if rebuilt["names"]:
+        _category_snapshot = rebuilt
+    return rebuilt
+
+
+def _build_category_snapshot(categories, version, now):
+    lookup = {
+        cat["name"].lower(): cat["id"]
+        for cat in categories
+        if cat.get("id") and cat.get("name")
+    }
+    return {
+        "version": version,
+        "set_version": _category_set_version(categories),
+        "names": [cat["name"] for cat in categories if cat.get("name")],
+        "lookup": lookup,
+        "index": build_category_index(lookup),
+        "loaded_at": now,
+        "checked_at": now,
+    }
+
+
+def _load_category_version():
+    if not CATEGORIZER_CACHE_TABLE_NAME:
+        return None
+    cache_table = dynamodb_resource(AWS_REGION).Table(CATEGORIZER_CACHE_TABLE_NAME)
+    try:
+        response = cache_table.get_item(
+            Key={"key": CATEGORY_VERSION_KEY},
+            ProjectionExpression="version",
+        )
+        return int(response.get("Item", {}).get("version", 0))
+    except Exception as exc:
+        logger.warning("Failed to read category version", extra={"error": str(exc)})
+        return None
 
 
 def _load_categories():
     items = []
+    categories_table = dynamodb_resource(AWS_REGION).Table(CATEGORIES_TABLE_NAME)
     try:
         response = categories_table.scan()
         items.extend(response.get("Items", []))
@@ -99,6 +389,18 @@ def _load_categories():
     return items
 
 
+def _find_existing_news_ids(news_ids):
+    try:
+        return find_existing_news_ids(
+            dynamodb_resource(AWS_REGION), NEWS_TABLE_NAME, news_ids
+        )
+    except Exception as exc:
+        logger.warning(
+            "Failed to check for stored news items", extra={"error": str(exc)}
+        )
+        return set()
+
+
 def _parse_payload(record):
     body = record.get("body")
     if not body:
@@ -113,7 +415,366 @@ def _parse_payload(record):
         return None
 
 
-def categorize_summary(summary, category_names, category_lookup):
+def _resolve_full_article(payload):
+    ref = payload.get("full_article_ref")
+    if not ref:
+        return payload.get("full_article", "")
+
+    if ref.startswith("file://"):
+        path = ref[len("file://") :]
+        if ARTICLE_STORE_DIR and not os.path.abspath(path).startswith(
+            os.path.abspath(ARTICLE_STORE_DIR)
+        ):
+            raise ValueError(f"Article reference outside store: {ref}")
+        with open(path, "rb") as fh:
+            data = fh.read()
+    elif ref.startswith("s3://"):
+        bucket, _, key = ref[len("s3://") :].partition("/")
+        data = s3.get_object(Bucket=bucket, Key=key)["Body"].read()
+    else:
+        raise ValueError(f"Unsupported article reference: {ref}")
+
+    logger.info("Loaded offloaded article body", extra={"ref": ref})
+    return gzip.decompress(data).decode("utf-8")
+
+
+def categorize_summaries(
+    summaries,
+    category_names,
+    category_lookup,
+    category_version=None,
+    category_index=None,
+):
+    """Categorize many summaries with one numbered-prompt call per chunk.
+
+    Results cached for the same summary and ``category_version`` are reused
+    without a model call. Items the batch response can't resolve to a known
+    category are retried individually through ``categorize_summary``.
+
+    Returns ``(category_id, category_source)`` per summary, where the source
+    is ``"cache"``, ``"preclassifier"`` or ``"bedrock"``, or ``None`` when the
+    item was never categorized (empty summary or no categories). Items whose
+    model call still failed after retries come back as ``(None, None)`` so
+    the caller can retry them later instead of storing them uncategorized.
+    """
+    results = ["uncategorized"] * len(summaries)
+    sources = [None] * len(summaries)
+    if not summaries:
+        return []
+
+    started = time.monotonic()
+    calls = 0
+    unresolved = []
+
+    batchable = [idx for idx, summary in enumerate(summaries) if summary]
+    if not category_names:
+        batchable = []
+
+    fingerprints = {}
+    duplicates_of = {}
+    if category_version and batchable:
+        fingerprints = {
+            idx: summary_fingerprint(summaries[idx], category_version)
+            for idx in batchable
+        }
+        cached = _load_cached_categories(set(fingerprints.values()))
+        hits = 0
+        for idx, fingerprint in fingerprints.items():
+            category_id = cached.get(fingerprint)
+            if category_id in category_lookup.values():
+                results[idx] = category_id
+                sources[idx] = preclassifier.SOURCE_CACHE
+                hits += 1
+        batchable = [idx for idx in batchable if results[idx] == "uncategorized"]
+
+        # Identical summaries in the same batch share one model call.
+        first_by_fingerprint = {}
+        for idx in batchable:
+            first_by_fingerprint.setdefault(fingerprints[idx], idx)
+        duplicates_of = {
+            idx: first_by_fingerprint[fingerprints[idx]]
+            for idx in batchable
+            if first_by_fingerprint[fingerprints[idx]] != idx
+        }
+        batchable = list(first_by_fingerprint.values())
+
+        metrics.add_metric(
+            name="CategorizationCacheHits", unit=MetricUnit.Count, value=hits
+        )
+        metrics.add_metric(
+            name="CategorizationCacheMisses",
+            unit=MetricUnit.Count,
+            value=len(fingerprints) - hits,
+        )
+        metrics.add_metric(
+            name="CategorizationCacheHitRate",
+            unit=MetricUnit.Percent,
+            value=100.0 * hits / len(fingerprints),
+        )
+
+    model = None
+    if batchable and PRECLASSIFIER_THRESHOLD > 0:
+        model = _get_preclassifier(category_version)
+    if model is not None:
+        predictions = preclassifier.classify(
+            model,
+            [summaries[idx] for idx in batchable],
+            PRECLASSIFIER_THRESHOLD,
+            PRECLASSIFIER_MIN_MARGIN,
+        )
+        for idx, category_id in zip(batchable, predictions):
+            if category_id:
+                results[idx] = category_id
+                sources[idx] = preclassifier.SOURCE_PRECLASSIFIER
+        batchable = [
+            idx for idx, category_id in zip(batchable, predictions) if not category_id
+        ]
+        metrics.add_metric(
+            name="PreclassifiedItems",
+            unit=MetricUnit.Count,
+            value=sum(1 for category_id in predictions if category_id),
+        )
+
+    chunks = [
+        batchable[start : start + CATEGORIZE_BATCH_SIZE]
+        for start in range(0, len(batchable), CATEGORIZE_BATCH_SIZE)
+    ]
+
+    with ThreadPoolExecutor(max_workers=max(1, BEDROCK_CONCURRENCY)) as executor:
+        batch_chunks = [chunk for chunk in chunks if len(chunk) > 1]
+        unresolved.extend(idx for chunk in chunks if len(chunk) == 1 for idx in chunk)
+
+        calls += len(batch_chunks)
+        batch_results = executor.map(
+            lambda chunk: _categorize_batch(
+                [summaries[idx] for idx in chunk],
+                category_names,
+                category_lookup,
+                category_index,
+            ),
+            batch_chunks,
+        )
+        for chunk, resolved in zip(batch_chunks, batch_results):
+            if resolved is None:
+                for idx in chunk:
+                    results[idx] = None
+                continue
+            for position, idx in enumerate(chunk, start=1):
+                category_id = resolved.get(position)
+                if category_id:
+                    results[idx] = category_id
+                    sources[idx] = preclassifier.SOURCE_BEDROCK
+                else:
+                    unresolved.append(idx)
+
+        calls += len(unresolved)
+        fallback_results = executor.map(
+            lambda idx: categorize_summary(
+                summaries[idx], category_names, category_lookup, category_index
+            ),
+            unresolved,
+        )
+        for idx, category_id in zip(unresolved, fallback_results):
+            results[idx] = category_id
+            if category_id is not None:
+                sources[idx] = preclassifier.SOURCE_BEDROCK
+
+    if fingerprints:
+        for idx, first in duplicates_of.items():
+            results[idx] = results[first]
+            sources[idx] = sources[first]
+        _store_cached_categories(
+            {
+                fingerprints[idx]: results[idx]
+                for idx in batchable
+                if results[idx] not in (None, "uncategorized")
+            }
+        )
+
+    logger.info(
+        "Categorized batch",
+        extra={
+            "items": len(summaries),
+            "bedrock_calls": calls,
+            "calls_per_item": round(calls / len(summaries), 2),
+            "fallback_items": len(unresolved),
+            "latency_ms": int((time.monotonic() - started) * 1000),
+        },
+    )
+    return list(zip(results, sources))
+
+
+# Survives across warm invocations. The model is only used while it was built
+# for the current category set, so centroids never name deleted categories.
+_preclassifier_state = {
+    "checked_at": 0.0,
+    "etag": None,
+    "category_version": None,
+    "model": None,
+}
+
+
+def _get_preclassifier(category_version):
+    if not preclassifier.available() or not PRECLASSIFIER_BUCKET_NAME:
+        return None
+
+    now = time.monotonic()
+    state = _preclassifier_state
+    if (
+        not state["checked_at"]
+        or now - state["checked_at"] >= PRECLASSIFIER_MAX_AGE_SECONDS
+    ):
+        state["checked_at"] = now
+        _refresh_preclassifier(state)
+
+    if state["model"] is None or state["category_version"] != category_version:
+        return None
+    return state["model"]
+
+
+def _refresh_preclassifier(state):
+    """Download the published model unless it matches the one already loaded."""
+    started = time.monotonic()
+    request = {"Bucket": PRECLASSIFIER_BUCKET_NAME, "Key": PRECLASSIFIER_MODEL_KEY}
+    if state["etag"]:
+        request["IfNoneMatch"] = state["etag"]
+    try:
+        response = s3.get_object(**request)
+        model, category_version = preclassifier.load_model(
+            io.BytesIO(response["Body"].read())
+        )
+    except ClientError as exc:
+        code = exc.response.get("Error", {}).get("Code")
+        if code == "NoSuchKey":
+            logger.info("No pre-classifier published yet")
+        elif code not in ("304", "NotModified"):
+            logger.warning("Failed to load pre-classifier", extra={"error": str(exc)})
+        return
+    except Exception as exc:
+        logger.warning("Failed to load pre-classifier", extra={"error": str(exc)})
+        return
+
+    state.update(
+        etag=response.get("ETag"), category_version=category_version, model=model
+    )
+    logger.info(
+        "Loaded pre-classifier",
+        extra={
+            "samples": model["samples"],
+            "categories": len(model["category_ids"]),
+            "category_version": category_version,
+            "latency_ms": int((time.monotonic() - started) * 1000),
+        },
+    )
+
+
+def summary_fingerprint(summary, category_version):
+    normalized = " ".join(re.sub(r"[^\w\s]", " ", summary.lower()).split())
+    return hashlib.sha256(
+        f"{category_version}\n{normalized}".encode("utf-8")
+    ).hexdigest()
+
+
+def _category_set_version(categories):
+    pairs = sorted(
+        f"{cat['id']}={cat['name']}"
+        for cat in categories
+        if cat.get("id") and cat.get("name")
+    )
+    if not pairs:
+        return None
+    return hashlib.sha256("\n".join(pairs).encode("utf-8")).hexdigest()[:16]
+
+
+def _load_cached_categories(fingerprints):
+    cached = {}
+    if not CATEGORIZER_CACHE_TABLE_NAME or not fingerprints:
+        return cached
+
+    now = int(time.time())
+    keys = [{"key": f"summary#{fingerprint}"} for fingerprint in fingerprints]
+    try:
+        for start in range(0, len(keys), DYNAMODB_BATCH_GET_LIMIT):
+            request = {
+                CATEGORIZER_CACHE_TABLE_NAME: {
+                    "Keys": keys[start : start + DYNAMODB_BATCH_GET_LIMIT]
+                }
+            }
+            while request:
+                response = dynamodb_resource(AWS_REGION).batch_get_item(
+                    RequestItems=request
+                )
+                for item in response.get("Responses", {}).get(
+                    CATEGORIZER_CACHE_TABLE_NAME, []
+                ):
+                    # DynamoDB TTL deletes lazily, so expiry is checked here too.
+                    if int(item.get("expires_at", 0)) > now:
+                        fingerprint = item["key"].removeprefix("summary#")
+                        cached[fingerprint] = item["category_id"]
+                request = response.get("UnprocessedKeys") or None
+    except Exception as exc:
+        logger.warning("Failed to read categorization cache", extra={"error": str(exc)})
+    return cached
+
+
+def _store_cached_categories(entries):
+    if not CATEGORIZER_CACHE_TABLE_NAME or not entries:
+        return
+
+    expires_at = int(time.time()) + CATEGORY_CACHE_TTL_SECONDS
+    cache_table = dynamodb_resource(AWS_REGION).Table(CATEGORIZER_CACHE_TABLE_NAME)
+    try:
+        with cache_table.batch_writer() as batch:
+            for fingerprint, category_id in entries.items():
+                batch.put_item(
+                    Item={
+                        "key": f"summary#{fingerprint}",
+                        "category_id": category_id,
+                        "expires_at": expires_at,
+                    }
+                )
+    except Exception as exc:
+        logger.warning(
+            "Failed to write categorization cache", extra={"error": str(exc)}
+        )
+
+
+def _categorize_batch(summaries, category_names, category_lookup, category_index):
+    """Map 1-based positions to category ids, or return None if the call failed."""
+    numbered = "\n".join(
+        f"{position}. {' '.join(summary.split())}"
+        for position, summary in enumerate(summaries, start=1)
+    )
+    prompt = (
+        "You are a news categorization assistant. "
+        "For each numbered summary, respond with one line in the form "
+        "'<number>: <category>', choosing exactly one category (maximum two words) "
+        f"from this list: {', '.join(category_names)}.\n"
+        f"Summaries:\n{numbered}\nCategories:"
+    )
+
+    raw_output = _invoke_bedrock(prompt, max_tokens=20 * len(summaries))
+    if raw_output is None:
+        return None
+
+    resolved = {}
+    for line in raw_output.splitlines():
+        match = re.match(r"^\s*(\d+)\s*[.:)\-]\s*(.+)$", line)
+        if not match:
+            continue
+        position = int(match.group(1))
+        if not 1 <= position <= len(summaries) or position in resolved:
+            continue
+        category_id = normalize_category(
+            match.group(2), category_lookup, category_index
+        )
+        if category_id != "uncategorized":
+            resolved[position] = category_id
+    return resolved
+
+
+def categorize_summary(summary, category_names, category_lookup, category_index=None):
+    """Return the summary's category id, or None if the model call failed."""
     if not summary:
         logger.warning("Empty summary; defaulting category")
         return "uncategorized"
@@ -128,30 +789,189 @@ def categorize_summary(summary, category_names, category_lookup):
         f"Summary: {summary}\nCategory:"
     )
 
+    raw_output = _invoke_bedrock(prompt, max_tokens=20)
+    if raw_output is None:
+        return None
+
+    return normalize_category(raw_output, category_lookup, category_index)
+
+
+def _invoke_bedrock(prompt, max_tokens):
     body = json.dumps(
         {
             "inputText": prompt,
             "textGenerationConfig": {
-                "maxTokenCount": 20,
+                "maxTokenCount": max_tokens,
                 "temperature": 0.2,
                 "topP": 0.9,
             },
         }
     )
 
-    try:
-        response = bedrock.invoke_model(modelId=BEDROCK_MODEL_ID, body=body)
-        payload = json.loads(response["body"].read())
-        raw_output = payload.get("results", [{}])[0].get("outputText", "").strip()
-        logger.info("Bedrock response", extra={"raw_output": raw_output})
-    except Exception as exc:
-        logger.error("Bedrock invocation failed", extra={"error": str(exc)})
-        return "uncategorized"
+    for attempt in range(1, BEDROCK_MAX_ATTEMPTS + 1):
+        bedrock_limiter.acquire()
+        try:
+            response = bedrock.invoke_model(modelId=BEDROCK_MODEL_ID, body=body)
+            payload = json.loads(response["body"].read())
+            raw_output = payload.get("results", [{}])[0].get("outputText", "").strip()
+            logger.info("Bedrock response", extra={"raw_output": raw_output})
+            return raw_output
+        except (ClientError, BotocoreConnectionError, HTTPClientError) as exc:
+            if not _is_retryable(exc) or attempt == BEDROCK_MAX_ATTEMPTS:
+                logger.error("Bedrock invocation failed", extra={"error": str(exc)})
+                return None
+            # Full jitter keeps concurrent workers from retrying in lockstep.
+            delay = random.uniform(
+                0,
+                min(
+                    BEDROCK_BACKOFF_CAP_SECONDS,
+                    BEDROCK_BACKOFF_BASE_SECONDS * 2 ** (attempt - 1),
+                ),
+            )
+            logger.warning(
+                "Bedrock call failed; retrying",
+                extra={
+                    "attempt": attempt,
+                    "delay_seconds": round(delay, 2),
+                    "error": str(exc),
+                },
+            )
+            time.sleep(delay)
+        except Exception as exc:
+            logger.error("Bedrock invocation failed", extra={"error": str(exc)})
+            return None
+    return None
+
+
+def _is_retryable(exc):
+    if not isinstance(exc, ClientError):
+        # Connection resets, endpoint and read timeouts.
+        return True
+    if exc.response.get("Error", {}).get("Code") in BEDROCK_RETRYABLE_ERRORS:
+        return True
+    return exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0) >= 500
 
-    return normalize_category(raw_output, category_lookup)
 
+# Token-level aliases applied to both category names and model output.
+CATEGORY_SYNONYMS = {
+    "ai": "artificial intelligence",
+    "ml": "machine learning",
+    "vuln": "vulnerability",
+    "vulns": "vulnerability",
+    "cve": "vulnerability",
+    "cves": "vulnerability",
+    "infosec": "cybersecurity",
+    "cyber": "cybersecurity",
+    "ddos": "denial of service",
+    "dos": "denial of service",
+    "apt": "advanced persistent threat",
+    "apts": "advanced persistent threat",
+    "&": "and",
+}
+CATEGORY_STOPWORDS = {"and", "of", "the", "a", "an", "category", "news"}
+FUZZY_MAX_CANDIDATES = 20
 
-def normalize_category(text, category_lookup):
+
+def _stem(token):
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 4 and token.endswith(("sses", "xes", "ches", "shes")):
+        return token[:-2]
+    if len(token) > 3 and token.endswith("s") and not token.endswith(("ss", "us")):
+        return token[:-1]
+    return token
+
+
+def _category_tokens(text):
+    tokens = []
+    for token in re.findall(r"[a-z0-9&]+", text.lower()):
+        tokens.extend(CATEGORY_SYNONYMS.get(token, token).split())
+    return [_stem(token) for token in tokens if token not in CATEGORY_STOPWORDS]
+
+
+def build_category_index(category_lookup):
+    """Precompute normalized keys for ``normalize_category``.
+
+    Built once per category snapshot; lookups are a dict hit on the
+    token-normalized key, then a containment check and a bounded
+    edit-distance search over categories sharing a token or similar length.
+    """
+    normalized = {}
+    by_token = {}
+    for name, category_id in category_lookup.items():
+        tokens = _category_tokens(name)
+        if not tokens:
+            continue
+        key = " ".join(sorted(tokens))
+        normalized.setdefault(key, category_id)
+        for token in set(tokens):
+            by_token.setdefault(token, set()).add(key)
+    return {"normalized": normalized, "by_token": by_token}
+
+
+def _match_category_fuzzy(text, category_index):
+    tokens = _category_tokens(text)
+    if not tokens:
+        return None, None
+
+    key = " ".join(sorted(tokens))
+    normalized = category_index["normalized"]
+    if key in normalized:
+        return normalized[key], "normalized"
+
+    # Output that wraps a category in extra words ("Malware attack").
+    token_set = set(tokens)
+    candidates = set()
+    for token in token_set:
+        candidates.update(category_index["by_token"].get(token, ()))
+    contained = [
+        candidate for candidate in candidates if set(candidate.split()) <= token_set
+    ]
+    if contained:
+        best = max(contained, key=lambda candidate: len(candidate.split()))
+        return normalized[best], "contained"
+
+    # Misspellings: compare against a bounded set of similar-length keys.
+    if len(candidates) < FUZZY_MAX_CANDIDATES:
+        for candidate in normalized:
+            if abs(len(candidate) - len(key)) <= 2:
+                candidates.add(candidate)
+                if len(candidates) >= FUZZY_MAX_CANDIDATES:
+                    break
+
+    max_distance = max(1, len(key) // 5)
+    best, best_distance = None, max_distance + 1
+    for candidate in candidates:
+        distance = _edit_distance(key, candidate, best_distance - 1)
+        if distance < best_distance:
+            best, best_distance = candidate, distance
+    if best is not None:
+        return normalized[best], "edit_distance"
+    return None, None
+
+
+def _edit_distance(left, right, limit):
+    """Levenshtein distance, returning ``limit + 1`` once it is exceeded."""
+    if abs(len(left) - len(right)) > limit:
+        return limit + 1
+    previous = list(range(len(right) + 1))
+    for i, left_char in enumerate(left, start=1):
+        current = [i]
+        for j, right_char in enumerate(right, start=1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (left_char != right_char),
+                )
+            )
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def normalize_category(text, category_lookup, category_index=None):
     if not text:
         logger.warning("Empty category text; defaulting")
         return "uncategorized"
@@ -169,5 +989,19 @@ def normalize_category(text, category_lookup):
         )
         return category_id
 
+    if category_index is None:
+        category_index = build_category_index(category_lookup)
+    category_id, method = _match_category_fuzzy(cleaned, category_index)
+    if category_id:
+        logger.info(
+            "Matched category",
+            extra={
+                "normalized_text": cleaned,
+                "category_id": category_id,
+                "method": method,
+            },
+        )
+        return category_id
+
     logger.warning("Category not found; defaulting", extra={"normalized_text": cleaned})
     return "uncategorized"
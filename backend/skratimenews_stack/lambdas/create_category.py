@@ -3,13 +3,15 @@ import base64
 import json
 import uuid
 from pynamodb.models import Model
-from pynamodb.attributes import UnicodeAttribute
+from pynamodb.attributes import NumberAttribute, UnicodeAttribute
 from pydantic import BaseModel, ValidationError
 from aws_lambda_powertools import Logger
 
 
 CATEGORIES_TABLE_NAME = os.environ["CATEGORIES_TABLE_NAME"]
+CATEGORIZER_CACHE_TABLE_NAME = os.environ.get("CATEGORIZER_CACHE_TABLE_NAME")
 AWS_REGION = "eu-central-1"
+CATEGORY_VERSION_KEY = "categories#version"
 
 
 class CategoriesModel(Model):
@@ -22,6 +24,16 @@ class CategoriesModel(Model):
     name = UnicodeAttribute(null=True)
 
 
+class CategorizerCacheModel(Model):
+    class Meta:
+        table_name = CATEGORIZER_CACHE_TABLE_NAME
+        region = AWS_REGION
+
+    key = UnicodeAttribute(hash_key=True)
+
+    version = NumberAttribute(null=True)
+
+
 class CreateCategorySchema(BaseModel):
     """Validation schema for creating a category."""
 
@@ -63,6 +75,8 @@ def handler(event, context):
             "Category saved successfully", extra={"category": category.attribute_values}
         )
 
+        bump_category_version()
+
         return {
             "statusCode": 201,
             "body": json.dumps(
@@ -83,3 +97,16 @@ def handler(event, context):
     except Exception as e:
         logger.error("Unhandled exception", extra={"error": str(e)})
         return {"statusCode": 500, "body": json.dumps({"error": str(e)})}
+
+
+def bump_category_version():
+    """Signal warm categorizer containers to reload their category cache."""
+    if not CATEGORIZER_CACHE_TABLE_NAME:
+        return
+    try:
+        marker = CategorizerCacheModel(key=CATEGORY_VERSION_KEY)
+        marker.update(actions=[CategorizerCacheModel.version.add(1)])
+        logger.info("Bumped category version", extra={"version": marker.version})
+    except Exception as e:
+        # The categorizer also refreshes on a max age, so this is best effort.
+        logger.warning("Failed to bump category version", extra={"error": str(e)})
@@ -2,6 +2,7 @@ import os
 import base64
 import json
 import uuid
+from datetime import datetime, timezone
 from pynamodb.models import Model
 from pynamodb.attributes import UnicodeAttribute
 from pydantic import BaseModel, ValidationError
@@ -27,6 +28,10 @@ class SkratimenewsModel(Model):
 
     picture_url = UnicodeAttribute(null=True)
 
+    published_at = UnicodeAttribute(null=True)
+
+    published_day = UnicodeAttribute(null=True)
+
 
 class CreateSkratimenewsSchema(BaseModel):
 
@@ -68,6 +73,8 @@ def handler(event, context):
             },
         )
 
+        published_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
         # Build DynamoDB item
         item = SkratimenewsModel(
             id=item_id,
@@ -75,6 +82,8 @@ def handler(event, context):
             summary=data.summary,
             category_id=data.category_id,
             picture_url=data.picture_url,
+            published_at=published_at,
+            published_day=published_at[:10],
         )
 
         # Save to DynamoDB
@@ -1,13 +1,17 @@
 import os
 import json
+import boto3
 from pynamodb.models import Model
 from pynamodb.attributes import UnicodeAttribute
 from aws_lambda_powertools import Logger
 
 
 TABLE_NAME = os.environ["TABLE_NAME"]
+BOOKMARK_CARDS_QUEUE_URL = os.environ["BOOKMARK_CARDS_QUEUE_URL"]
 AWS_REGION = "eu-central-1"
 
+sqs = boto3.client("sqs", region_name=AWS_REGION)
+
 
 
 class SkratimenewsModel(Model):
@@ -23,6 +27,18 @@ class SkratimenewsModel(Model):
 
 logger = Logger(service="SkratimenewsDeleteLambda")
 
+def notify_bookmark_cards(news_id):
+    """Queue a refresh of the bookmark cards that snapshot this item."""
+    try:
+        sqs.send_message(
+            QueueUrl=BOOKMARK_CARDS_QUEUE_URL,
+            MessageBody=json.dumps({"news_id": news_id}),
+        )
+    except Exception as e:
+        # The item change is already committed; cards refresh on the next one.
+        logger.error("Failed to queue bookmark card refresh", extra={"news_id": news_id, "error": str(e)})
+
+
 def handler(event, context):
     logger.info("Received event", extra={"event": event})
 
@@ -43,6 +59,8 @@ def handler(event, context):
         item.delete()
         logger.info("Deleted item from database", extra={"key": partition_key_value})
 
+        notify_bookmark_cards(partition_key_value)
+
         response = {"statusCode": 200, "body": json.dumps({"message": "Item deleted"})}
         logger.info("Returning response", extra={"response": response})
         return response
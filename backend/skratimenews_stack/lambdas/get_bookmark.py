@@ -2,15 +2,31 @@ import os
 import json
 from pynamodb.models import Model
 from pynamodb.attributes import UnicodeAttribute, UTCDateTimeAttribute
+from pynamodb.indexes import LocalSecondaryIndex, AllProjection
 from aws_lambda_powertools import Logger
 
+from pagination import decode_cursor, encode_cursor
+
 BOOKMARKS_TABLE_NAME = os.environ["BOOKMARKS_TABLE_NAME"]
 NEWS_TABLE_NAME = os.environ["NEWS_TABLE_NAME"]
 AWS_REGION = "eu-central-1"
+CARD_FIELDS = ["id", "title", "summary", "category_id", "picture_url"]
+BOOKMARKS_PER_PAGE = int(os.environ.get("BOOKMARKS_PER_PAGE", "50"))
+MAX_BOOKMARKS_PER_PAGE = 100
 
 logger = Logger(service="GetBookmarksLambda")
 
 
+class CreatedAtIndex(LocalSecondaryIndex):
+    class Meta:
+        index_name = "bookmarks-created-index"
+        projection = AllProjection()
+        region = AWS_REGION
+
+    user_id = UnicodeAttribute(hash_key=True)
+    created_at = UTCDateTimeAttribute(range_key=True)
+
+
 class UserBookmarkModel(Model):
     class Meta:
         table_name = BOOKMARKS_TABLE_NAME
@@ -19,6 +35,13 @@ class UserBookmarkModel(Model):
     user_id = UnicodeAttribute(hash_key=True)
     news_id = UnicodeAttribute(range_key=True)
     created_at = UTCDateTimeAttribute()
+    created_index = CreatedAtIndex()
+
+    # Card snapshot of the bookmarked news item
+    title = UnicodeAttribute(null=True)
+    summary = UnicodeAttribute(null=True)
+    category_id = UnicodeAttribute(null=True)
+    picture_url = UnicodeAttribute(null=True)
 
 
 class SkratimenewsModel(Model):
@@ -56,47 +79,86 @@ def handler(event, context):
         user_id = event["requestContext"]["authorizer"]["claims"]["sub"]
         logger.info("User ID extracted", extra={"user_id": user_id})
 
-        # Query all bookmarks for this user
-        bookmarks = list(UserBookmarkModel.query(user_id))
+        query_params = event.get("queryStringParameters") or {}
+        page_size = min(
+            max(1, int(query_params.get("page_size", BOOKMARKS_PER_PAGE))),
+            MAX_BOOKMARKS_PER_PAGE,
+        )
+        scope = f"bookmarks:{user_id}"
+
+        # Query one page of bookmarks, newest first; each carries its news card
+        query = UserBookmarkModel.created_index.query(
+            user_id,
+            scan_index_forward=False,
+            limit=page_size,
+            last_evaluated_key=decode_cursor(
+                query_params.get("last_evaluated_key"), scope
+            ),
+        )
+        bookmarks = list(query)
         logger.info(
             f"Found {len(bookmarks)} bookmarks",
             extra={"user_id": user_id, "count": len(bookmarks)},
         )
 
-        # Get news details for each bookmark
+        # Bookmarks saved before card snapshots existed still need a join
+        legacy_ids = {
+            bookmark.news_id for bookmark in bookmarks if bookmark.title is None
+        }
+        news_by_id = {}
+        if legacy_ids:
+            news_by_id = {
+                news_item.id: news_item
+                for news_item in SkratimenewsModel.batch_get(
+                    legacy_ids, attributes_to_get=CARD_FIELDS
+                )
+            }
+
         bookmarked_news = []
         for bookmark in bookmarks:
-            try:
-                news_item = SkratimenewsModel.get(bookmark.news_id)
-                bookmarked_news.append(
-                    {
-                        "id": news_item.id,
-                        "title": news_item.title,
-                        "summary": news_item.summary,
-                        "category_id": news_item.category_id,
-                        "picture_url": news_item.picture_url,
-                        "bookmarked_at": (
-                            bookmark.created_at.isoformat()
-                            if bookmark.created_at
-                            else None
-                        ),
-                    }
-                )
-            except SkratimenewsModel.DoesNotExist:
+            card = bookmark
+            if bookmark.news_id in legacy_ids:
+                card = news_by_id.get(bookmark.news_id)
+            if card is None:
                 logger.warning(
                     f"News item not found for bookmark",
                     extra={"news_id": bookmark.news_id},
                 )
                 # Skip this bookmark if news was deleted
                 continue
+            bookmarked_news.append(
+                {
+                    "id": bookmark.news_id,
+                    "title": card.title,
+                    "summary": card.summary,
+                    "category_id": card.category_id,
+                    "picture_url": card.picture_url,
+                    "bookmarked_at": (
+                        bookmark.created_at.isoformat() if bookmark.created_at else None
+                    ),
+                }
+            )
 
         return {
             "statusCode": 200,
             "body": json.dumps(
-                {"bookmarks": bookmarked_news, "count": len(bookmarked_news)}
+                {
+                    "bookmarks": bookmarked_news,
+                    "count": len(bookmarked_news),
+                    "last_evaluated_key": encode_cursor(
+                        query.last_evaluated_key, scope
+                    ),
+                }
             ),
         }
 
+    except ValueError as e:
+        logger.warning("Invalid request", extra={"error": str(e)})
+        return {
+            "statusCode": 400,
+            "body": json.dumps({"error": str(e)}),
+        }
+
     except Exception as e:
         logger.error("Unhandled exception", extra={"error": str(e)})
         return {
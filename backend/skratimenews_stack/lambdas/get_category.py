@@ -4,9 +4,13 @@ from pynamodb.models import Model
 from pynamodb.attributes import UnicodeAttribute
 from aws_lambda_powertools import Logger
 
+from response_cache import cached
 
 CATEGORIES_TABLE_NAME = os.environ["CATEGORIES_TABLE_NAME"]
 AWS_REGION = "eu-central-1"
+CATEGORY_RESPONSE_TTL_SECONDS = int(
+    os.environ.get("CATEGORY_RESPONSE_TTL_SECONDS", "300")
+)
 CORS_HEADERS = {
     "Access-Control-Allow-Origin": "*",
     "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token",
@@ -27,6 +31,15 @@ class CategoriesModel(Model):
 logger = Logger(service="CategoryGetLambda")
 
 
+def cache_policy(event):
+    # Categories are public and change only when an admin adds one.
+    return (
+        f"public, max-age={CATEGORY_RESPONSE_TTL_SECONDS}",
+        CATEGORY_RESPONSE_TTL_SECONDS,
+    )
+
+
+@cached(cache_policy)
 def handler(event, context):
     logger.info("Received event", extra={"event": event})
 
@@ -1,14 +1,29 @@
 import os
 import json
-from boto3.dynamodb.conditions import Key
+from datetime import datetime, timedelta, timezone
 from pynamodb.models import Model
 from pynamodb.attributes import UnicodeAttribute
 from aws_lambda_powertools import Logger
-from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
+from pynamodb.indexes import GlobalSecondaryIndex, IncludeProjection
 from pynamodb.attributes import UnicodeAttribute
 
+from bookmark_membership import find_bookmarked
+from pagination import decode_cursor, encode_cursor
+from response_cache import cached
+
 ITEMS_PER_PAGE = 10
+MAX_SCAN_PAGE_SIZE = 100
+LATEST_NEWS_LOOKBACK_DAYS = int(os.environ.get("LATEST_NEWS_LOOKBACK_DAYS", "14"))
+ITEM_CACHE_TTL_SECONDS = int(os.environ.get("ITEM_CACHE_TTL_SECONDS", "300"))
+LIST_CACHE_TTL_SECONDS = int(os.environ.get("LIST_CACHE_TTL_SECONDS", "60"))
+# False until news-date-index is deployed (see scripts/deploy_news_indexes.sh);
+# the latest listing is a plain scan until then.
+NEWS_DATE_INDEX_ENABLED = os.environ.get("NEWS_DATE_INDEX_ENABLED", "true") == "true"
 TABLE_NAME = os.environ["TABLE_NAME"]
+# Cognito group whose members may run segmented scan exports.
+ADMIN_GROUP = os.environ.get("ADMIN_GROUP", "admin")
+# Scan options that turn a scan page into an export; admin only.
+EXPORT_PARAMS = ("segment", "total_segments", "page_size")
 AWS_REGION = "eu-central-1"
 CORS_HEADERS = {
     "Access-Control-Allow-Origin": "*",
@@ -16,14 +31,58 @@ CORS_HEADERS = {
     "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS",
 }
 
-
-class CategoryIndex(GlobalSecondaryIndex):
+# Attributes returned by list endpoints unless ``fields=`` asks for others.
+CARD_FIELDS = [
+    "id",
+    "title",
+    "summary",
+    "picture_url",
+    "published_at",
+    "category_id",
+    "news_link",
+]
+# Attributes projected into news-category-date-index: the card fields.
+CATEGORY_DATE_INDEX_FIELDS = [
+    "id",
+    "category_id",
+    "published_at",
+    "title",
+    "summary",
+    "picture_url",
+    "news_link",
+]
+# Attributes projected into news-date-index; anything else needs the table.
+DATE_INDEX_FIELDS = [
+    "id",
+    "published_day",
+    "published_at",
+    "title",
+    "summary",
+    "category_id",
+    "picture_url",
+    "news_link",
+    "author",
+]
+
+
+class CategoryDateIndex(GlobalSecondaryIndex):
     class Meta:
-        index_name = "news-category-index"
-        projection = AllProjection()
+        index_name = "news-category-date-index"
+        projection = IncludeProjection(CATEGORY_DATE_INDEX_FIELDS[3:])
         region = AWS_REGION
 
     category_id = UnicodeAttribute(hash_key=True)
+    published_at = UnicodeAttribute(range_key=True)
+
+
+class DateIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "news-date-index"
+        projection = IncludeProjection(DATE_INDEX_FIELDS[3:])
+        region = AWS_REGION
+
+    published_day = UnicodeAttribute(hash_key=True)
+    published_at = UnicodeAttribute(range_key=True)
 
 
 class SkratimenewsModel(Model):
@@ -38,17 +97,21 @@ class SkratimenewsModel(Model):
     summary = UnicodeAttribute(null=True)
 
     category_id = UnicodeAttribute(null=True)
-    category_index = CategoryIndex()
+    category_date_index = CategoryDateIndex()
 
     picture_url = UnicodeAttribute(null=True)
     news_link = UnicodeAttribute(null=True)
     published_at = UnicodeAttribute(null=True)
+    published_day = UnicodeAttribute(null=True)
+    date_index = DateIndex()
     author = UnicodeAttribute(null=True)
     full_article = UnicodeAttribute(null=True)
 
 
 logger = Logger(service="SkratimenewsGetLambda")
 
+MODEL_FIELDS = set(SkratimenewsModel.get_attributes())
+
 
 CORS_HEADERS = {
     "Access-Control-Allow-Origin": "*",
@@ -57,6 +120,22 @@ CORS_HEADERS = {
 }
 
 
+def cache_policy(event):
+    """Cache-Control and LRU TTL per route.
+
+    The API sits behind a Cognito authorizer, so responses are ``private``.
+    Bookmark flags are per caller and scans serve admin exports; both are
+    revalidated by ETag only.
+    """
+    query_params = event.get("queryStringParameters") or {}
+    if query_params.get("include_bookmarks") == "true" or query_params.get("scan"):
+        return "private, no-cache", 0
+    if query_params.get("id"):
+        return f"private, max-age={ITEM_CACHE_TTL_SECONDS}", ITEM_CACHE_TTL_SECONDS
+    return f"private, max-age={LIST_CACHE_TTL_SECONDS}", LIST_CACHE_TTL_SECONDS
+
+
+@cached(cache_policy)
 def handler(event, context):
     logger.info("Received event", extra={"event": event})
 
@@ -78,7 +157,9 @@ def handler(event, context):
         if item_id:
             # Fetch single item by id
             logger.debug("Fetching single item", extra={"id": item_id})
-            item = SkratimenewsModel.get(item_id)
+            item = SkratimenewsModel.get(
+                item_id, attributes_to_get=_requested_fields(query_params, None)
+            )
             response_body = item.attribute_values.copy()
 
             return {
@@ -87,35 +168,54 @@ def handler(event, context):
                 "body": json.dumps(response_body),
             }
         if category_id:
-            # Query using news-category-index
-            query_kwargs = {
-                "Index": "news-category-index",
-                "KeyConditionExpression": Key("category_id").eq(category_id),
-                "Limit": ITEMS_PER_PAGE,
-            }
-
-            if last_evaluated_key:
-                query_kwargs["ExclusiveStartKey"] = json.loads(last_evaluated_key)
+            # Query news-category-date-index so a page is read in date order
+            newest_first = query_params.get("order", "newest") != "oldest"
+            since = query_params.get("since")
 
-            items = []
-            last_key = None
+            scope = f"category:{category_id}:{newest_first}:{since or ''}"
 
-            query = SkratimenewsModel.category_index.query(
+            query = SkratimenewsModel.category_date_index.query(
                 category_id,
+                range_key_condition=(
+                    SkratimenewsModel.published_at > since if since else None
+                ),
+                scan_index_forward=not newest_first,
                 limit=ITEMS_PER_PAGE,
-                last_evaluated_key=(
-                    json.loads(last_evaluated_key) if last_evaluated_key else None
+                last_evaluated_key=decode_cursor(last_evaluated_key, scope),
+                attributes_to_get=_requested_fields(
+                    query_params, CARD_FIELDS, allowed=CATEGORY_DATE_INDEX_FIELDS
                 ),
             )
+            items = [item.attribute_values.copy() for item in query]
+
+            _embed_bookmarks(event, query_params, items)
 
-            for item in query:
-                items.append(item.attribute_values.copy())
+            response_body = {
+                "items": items,
+                "last_evaluated_key": encode_cursor(query.last_evaluated_key, scope),
+            }
+            return {
+                "statusCode": 200,
+                "headers": CORS_HEADERS,
+                "body": json.dumps(response_body),
+            }
+        if query_params.get("scan") != "true":
+            # Latest news from the day-bucketed news-date-index
+            since = query_params.get("since")
+            scope = f"latest:{since or ''}"
+            items, position = list_latest_news(
+                decode_cursor(last_evaluated_key, scope),
+                since=since,
+                fields=_requested_fields(
+                    query_params, CARD_FIELDS, allowed=DATE_INDEX_FIELDS
+                ),
+            )
 
-            last_key = query.last_evaluated_key
+            _embed_bookmarks(event, query_params, items)
 
             response_body = {
                 "items": items,
-                "last_evaluated_key": json.dumps(last_key) if last_key else None,
+                "last_evaluated_key": encode_cursor(position, scope),
             }
             return {
                 "statusCode": 200,
@@ -123,25 +223,38 @@ def handler(event, context):
                 "body": json.dumps(response_body),
             }
         else:
-            # Paginated scan
-            scan_kwargs = {}
-            scan_kwargs["limit"] = ITEMS_PER_PAGE
-            if last_evaluated_key:
-                scan_kwargs["exclusive_start_key"] = json.loads(last_evaluated_key)
-
-            items = []
-            last_key = None
-            for item in SkratimenewsModel.scan(**scan_kwargs):
-                item_data = item.attribute_values.copy()
+            # Paginated scan, optionally one segment of a parallel export
+            if any(query_params.get(name) for name in EXPORT_PARAMS):
+                if not _is_admin(event):
+                    logger.warning("Export scan denied", extra={"params": query_params})
+                    return {
+                        "statusCode": 403,
+                        "headers": CORS_HEADERS,
+                        "body": json.dumps(
+                            {"error": f"Export scans require the {ADMIN_GROUP} group"}
+                        ),
+                    }
+            segment, total_segments = _scan_segment(query_params)
+            scope = f"scan:{segment}/{total_segments}"
+            page_size = min(
+                max(1, int(query_params.get("page_size", ITEMS_PER_PAGE))),
+                MAX_SCAN_PAGE_SIZE,
+            )
 
-                items.append(item_data)
+            results = SkratimenewsModel.scan(
+                segment=segment,
+                total_segments=total_segments,
+                limit=page_size,
+                last_evaluated_key=decode_cursor(last_evaluated_key, scope),
+                attributes_to_get=_requested_fields(query_params, CARD_FIELDS),
+            )
+            items = [item.attribute_values.copy() for item in results]
 
-            if hasattr(item, "last_evaluated_key") and item.last_evaluated_key:
-                last_key = item.last_evaluated_key
+            _embed_bookmarks(event, query_params, items)
 
             response_body = {
                 "items": items,
-                "last_evaluated_key": json.dumps(last_key) if last_key else None,
+                "last_evaluated_key": encode_cursor(results.last_evaluated_key, scope),
             }
 
             return {
@@ -150,6 +263,14 @@ def handler(event, context):
                 "body": json.dumps(response_body),
             }
 
+    except ValueError as e:
+        logger.warning("Invalid request", extra={"error": str(e)})
+        return {
+            "statusCode": 400,
+            "headers": CORS_HEADERS,
+            "body": json.dumps({"error": str(e)}),
+        }
+
     except SkratimenewsModel.DoesNotExist:
         logger.warning("Item not found", extra={"id": item_id})
         return {
@@ -165,3 +286,135 @@ def handler(event, context):
             "headers": CORS_HEADERS,
             "body": json.dumps({"error": str(e)}),
         }
+
+
+def _requested_fields(query_params, default, allowed=None):
+    """Resolve ``fields=`` into the attribute list passed as a projection.
+
+    ``fields=all`` (or ``None`` as the default) returns whole items. Unknown
+    attributes, or ones the queried index doesn't project, raise ValueError.
+    """
+    fields = query_params.get("fields")
+    if not fields:
+        return default
+    if fields == "all":
+        if allowed is not None:
+            return list(allowed)
+        return None
+
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = sorted(set(requested) - set(allowed or MODEL_FIELDS))
+    if unknown:
+        raise ValueError(f"Unsupported fields: {', '.join(unknown)}")
+    if "id" not in requested:
+        requested.insert(0, "id")
+    return requested
+
+
+def _embed_bookmarks(event, query_params, items):
+    """Flag items the caller bookmarked when ``include_bookmarks=true``.
+
+    Saves the client a separate membership call per page; one keys-only
+    BatchGetItem covers a page of up to 100 items.
+    """
+    if query_params.get("include_bookmarks") != "true" or not items:
+        return
+    claims = (event.get("requestContext") or {}).get("authorizer", {}).get("claims")
+    if not claims or "sub" not in claims:
+        return
+
+    bookmarked = find_bookmarked(claims["sub"], [item["id"] for item in items])
+    for item in items:
+        item["bookmarked"] = item["id"] in bookmarked
+
+
+def _is_admin(event):
+    """True when the caller's Cognito groups include ``ADMIN_GROUP``.
+
+    API Gateway passes ``cognito:groups`` as a string, e.g. ``admin`` or
+    ``[admin, editors]``.
+    """
+    claims = (event.get("requestContext") or {}).get("authorizer", {}).get("claims")
+    groups = (claims or {}).get("cognito:groups") or ""
+    if isinstance(groups, str):
+        groups = groups.strip("[]").replace(",", " ").split()
+    return ADMIN_GROUP in groups
+
+
+def _scan_segment(query_params):
+    """Return ``(segment, total_segments)`` for a parallel scan, or Nones."""
+    total_segments = query_params.get("total_segments")
+    if not total_segments:
+        return None, None
+
+    segment = int(query_params.get("segment", 0))
+    total_segments = int(total_segments)
+    if not 0 <= segment < total_segments:
+        raise ValueError("segment must be between 0 and total_segments - 1")
+    return segment, total_segments
+
+
+def list_latest_news(cursor=None, since=None, fields=None):
+    """Read one page of the latest listing.
+
+    Served from news-date-index when it's enabled. Falls back to a plain scan
+    page while the index is disabled, or when its first page comes back empty
+    because stored items predate ``published_day`` (run
+    scripts/backfill_published_day.py). A scan position is ``{"scan": ...}``,
+    so follow-up pages stay on the scan.
+    """
+    if NEWS_DATE_INDEX_ENABLED and not (cursor and "scan" in cursor):
+        items, position = query_latest_news(cursor, since=since, fields=fields)
+        if items or cursor:
+            return items, position
+        logger.warning("news-date-index returned no items; falling back to a scan")
+
+    results = SkratimenewsModel.scan(
+        filter_condition=SkratimenewsModel.published_at > since if since else None,
+        limit=ITEMS_PER_PAGE,
+        last_evaluated_key=cursor["scan"] if cursor else None,
+        attributes_to_get=fields,
+    )
+    items = [item.attribute_values.copy() for item in results]
+    if not results.last_evaluated_key:
+        return items, None
+    return items, {"scan": results.last_evaluated_key}
+
+
+def query_latest_news(cursor=None, since=None, fields=None):
+    """Read one page of the newest items, walking day buckets backwards.
+
+    Each bucket is queried newest-first with the remaining page size, so a
+    request reads at most one page of items plus one empty query per day
+    without news. The cursor is ``{"day": ..., "key": ...}``.
+    """
+    today = datetime.now(timezone.utc).date()
+    oldest_day = (today - timedelta(days=LATEST_NEWS_LOOKBACK_DAYS)).isoformat()
+    if since:
+        oldest_day = max(oldest_day, since[:10])
+
+    day = cursor["day"] if cursor else today.isoformat()
+    start_key = cursor.get("key") if cursor else None
+
+    items = []
+    while len(items) < ITEMS_PER_PAGE and day >= oldest_day:
+        query = SkratimenewsModel.date_index.query(
+            day,
+            range_key_condition=(
+                SkratimenewsModel.published_at > since if since else None
+            ),
+            scan_index_forward=False,
+            limit=ITEMS_PER_PAGE - len(items),
+            last_evaluated_key=start_key,
+            attributes_to_get=fields,
+        )
+        items.extend(item.attribute_values.copy() for item in query)
+
+        start_key = query.last_evaluated_key
+        if start_key:
+            return items, {"day": day, "key": start_key}
+        day = (datetime.fromisoformat(day) - timedelta(days=1)).date().isoformat()
+
+    if day < oldest_day:
+        return items, None
+    return items, {"day": day, "key": None}
@@ -0,0 +1,49 @@
+"""DynamoDB helpers shared by the Lambdas that read the news table."""
+
+import threading
+
+import boto3
+
+DYNAMODB_BATCH_GET_LIMIT = 100
+
+_local = threading.local()
+
+
+def dynamodb_resource(region_name):
+    """Return the calling thread's DynamoDB resource.
+
+    boto3 resources are not thread-safe, so code that fans out over a thread
+    pool gets one resource per thread, each from its own session, instead of
+    sharing a module-level one. The resource is reused across warm invocations.
+    """
+    resource = getattr(_local, "dynamodb", None)
+    if resource is None:
+        resource = boto3.session.Session().resource("dynamodb", region_name=region_name)
+        _local.dynamodb = resource
+    return resource
+
+
+def find_existing_news_ids(dynamodb, table_name, news_ids):
+    """Return the subset of ``news_ids`` already stored in ``table_name``.
+
+    Reads keys only, in BatchGetItem pages of 100, and re-requests
+    UnprocessedKeys until they drain. Errors propagate so each caller can
+    decide how to degrade.
+    """
+    existing = set()
+    unique_ids = list(dict.fromkeys(news_ids))
+    for start in range(0, len(unique_ids), DYNAMODB_BATCH_GET_LIMIT):
+        chunk = unique_ids[start : start + DYNAMODB_BATCH_GET_LIMIT]
+        request = {
+            table_name: {
+                "Keys": [{"id": news_id} for news_id in chunk],
+                "ProjectionExpression": "id",
+            }
+        }
+        while request:
+            response = dynamodb.batch_get_item(RequestItems=request)
+            existing.update(
+                item["id"] for item in response.get("Responses", {}).get(table_name, [])
+            )
+            request = response.get("UnprocessedKeys") or None
+    return existing
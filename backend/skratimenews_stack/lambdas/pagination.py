@@ -0,0 +1,86 @@
+"""Opaque, signed pagination cursors shared by the list endpoints.
+
+A cursor is ``v1.<payload>.<signature>``: the payload is URL-safe base64 of
+the JSON position (usually a DynamoDB LastEvaluatedKey) together with the
+scope it was issued for, and the signature is an HMAC-SHA256 over the version
+tag and payload. Clients can't forge positions or replay a cursor against a
+different listing, and the format can change behind a new version tag.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+
+import boto3
+
+CURSOR_VERSION = "v1"
+CURSOR_SECRET = os.environ.get("CURSOR_SECRET")
+CURSOR_SECRET_ARN = os.environ.get("CURSOR_SECRET_ARN")
+
+_signing_key = None
+
+
+def _get_signing_key():
+    """Read the signing secret once per container."""
+    global _signing_key
+    if _signing_key is None:
+        if CURSOR_SECRET:
+            secret = CURSOR_SECRET
+        elif CURSOR_SECRET_ARN:
+            secret = boto3.client("secretsmanager").get_secret_value(
+                SecretId=CURSOR_SECRET_ARN
+            )["SecretString"]
+        else:
+            raise RuntimeError("CURSOR_SECRET or CURSOR_SECRET_ARN must be set")
+        _signing_key = secret.encode("utf-8")
+    return _signing_key
+
+
+def _b64encode(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text):
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(message):
+    digest = hmac.new(_get_signing_key(), message.encode("ascii"), hashlib.sha256)
+    return _b64encode(digest.digest())
+
+
+def encode_cursor(position, scope):
+    """Return an opaque cursor for ``position``, or ``None`` at the end."""
+    if position is None:
+        return None
+    payload = _b64encode(
+        json.dumps({"s": scope, "p": position}, separators=(",", ":")).encode("utf-8")
+    )
+    message = f"{CURSOR_VERSION}.{payload}"
+    return f"{message}.{_sign(message)}"
+
+
+def decode_cursor(cursor, scope):
+    """Return the position stored in ``cursor``, or ``None`` without one.
+
+    Raises ValueError for malformed, tampered or foreign-scope cursors.
+    """
+    if not cursor:
+        return None
+
+    parts = cursor.split(".")
+    if len(parts) != 3 or parts[0] != CURSOR_VERSION:
+        raise ValueError("Invalid cursor")
+    version, payload, signature = parts
+    if not hmac.compare_digest(signature, _sign(f"{version}.{payload}")):
+        raise ValueError("Invalid cursor")
+
+    try:
+        data = json.loads(_b64decode(payload))
+    except ValueError:
+        raise ValueError("Invalid cursor")
+    if data.get("s") != scope:
+        raise ValueError("Cursor does not belong to this listing")
+    return data.get("p")
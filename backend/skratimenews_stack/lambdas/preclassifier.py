@@ -0,0 +1,264 @@
+"""CPU-only pre-classifier that assigns obvious categories without Bedrock.
+
+Summaries are turned into hashed unigram/bigram TF-IDF vectors and compared
+against per-category centroids built from news that is already categorized.
+Only items whose best cosine similarity clears a threshold (and beats the
+runner-up by a margin) are assigned; everything else goes to the model.
+
+The model is built off the request path by build_preclassifier, which
+publishes it with ``save_model``; the categorizer only reads it back with
+``load_model``.
+
+Run as a script to evaluate against the Bedrock labels already stored in the
+news table:
+
+    NEWS_TABLE_NAME=... python preclassifier.py --threshold 0.45
+"""
+
+import argparse
+import json
+import os
+import re
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+FEATURE_DIMENSIONS = 2**14
+MIN_SAMPLES_PER_CATEGORY = 5
+# Defaults shared with the categorizer so the evaluation matches production.
+DEFAULT_THRESHOLD = 0.45
+DEFAULT_MIN_MARGIN = 0.1
+# Values of the news items' ``category_source`` attribute. Only Bedrock labels
+# are trained and evaluated on, so the classifier never learns from its own
+# guesses.
+SOURCE_BEDROCK = "bedrock"
+SOURCE_PRECLASSIFIER = "preclassifier"
+SOURCE_CACHE = "cache"
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def available():
+    return np is not None
+
+
+def _features(text):
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+    return [zlib.crc32(gram.encode("utf-8")) % FEATURE_DIMENSIONS for gram in grams]
+
+
+def _sparse_terms(text):
+    """Return ``(indices, weights)`` of the sublinear term frequencies."""
+    indices, counts = np.unique(
+        np.asarray(_features(text), dtype=np.int64), return_counts=True
+    )
+    # Sublinear term frequency keeps repeated boilerplate from dominating.
+    return indices, np.log1p(counts.astype(np.float32))
+
+
+def _tfidf(terms, idf):
+    """L2-normalized TF-IDF weights for one document's sparse terms."""
+    indices, weights = terms
+    weights = weights * idf[indices]
+    norm = np.linalg.norm(weights)
+    if norm:
+        weights = weights / norm
+    return indices, weights
+
+
+def _normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def build_model(samples):
+    """Build centroids from ``(summary, category_id)`` pairs.
+
+    Documents stay sparse and are added straight into per-category sums, so
+    memory is one dense row per category rather than one per sample.
+    Returns ``None`` when NumPy is missing or no category has enough samples.
+    """
+    if np is None:
+        return None
+
+    by_category = {}
+    for summary, category_id in samples:
+        if summary and category_id and category_id != "uncategorized":
+            by_category.setdefault(category_id, []).append(summary)
+    by_category = {
+        category_id: summaries
+        for category_id, summaries in by_category.items()
+        if len(summaries) >= MIN_SAMPLES_PER_CATEGORY
+    }
+    if len(by_category) < 2:
+        return None
+
+    category_ids = sorted(by_category)
+    terms = {
+        category_id: [_sparse_terms(summary) for summary in by_category[category_id]]
+        for category_id in category_ids
+    }
+    samples_count = sum(len(docs) for docs in terms.values())
+
+    document_frequency = np.zeros(FEATURE_DIMENSIONS, dtype=np.int64)
+    for docs in terms.values():
+        for indices, _ in docs:
+            document_frequency[indices] += 1
+    idf = np.log((1 + samples_count) / (1 + document_frequency)).astype(np.float32) + 1
+
+    centroids = np.zeros((len(category_ids), FEATURE_DIMENSIONS), dtype=np.float32)
+    for row, category_id in enumerate(category_ids):
+        for doc in terms[category_id]:
+            indices, weights = _tfidf(doc, idf)
+            centroids[row] += np.bincount(
+                indices, weights=weights, minlength=FEATURE_DIMENSIONS
+            ).astype(np.float32)
+        centroids[row] /= len(terms[category_id])
+
+    return {
+        "category_ids": category_ids,
+        "idf": idf,
+        "centroids": _normalize_rows(centroids),
+        "samples": samples_count,
+    }
+
+
+def save_model(model, fileobj, category_version=None):
+    """Write ``model`` to ``fileobj`` as a compressed .npz.
+
+    ``category_version`` records the category set the centroids were built
+    for, so a reader can reject a model that names deleted categories.
+    """
+    np.savez_compressed(
+        fileobj,
+        category_ids=np.asarray(model["category_ids"], dtype=str),
+        idf=model["idf"],
+        centroids=model["centroids"],
+        samples=np.asarray(model["samples"]),
+        category_version=np.asarray(category_version or ""),
+    )
+
+
+def load_model(fileobj):
+    """Return ``(model, category_version)`` as written by ``save_model``."""
+    with np.load(fileobj, allow_pickle=False) as data:
+        model = {
+            "category_ids": [str(category_id) for category_id in data["category_ids"]],
+            "idf": data["idf"],
+            "centroids": data["centroids"],
+            "samples": int(data["samples"]),
+        }
+        return model, str(data["category_version"]) or None
+
+
+def classify(model, summaries, threshold, min_margin=0.0):
+    """Return a category id per summary, or ``None`` when not confident."""
+    if model is None or not summaries:
+        return [None] * len(summaries)
+
+    centroids = model["centroids"]
+    similarities = np.zeros((len(summaries), len(centroids)), dtype=np.float32)
+    for row, summary in enumerate(summaries):
+        indices, weights = _tfidf(_sparse_terms(summary), model["idf"])
+        similarities[row] = centroids[:, indices] @ weights
+
+    if similarities.shape[1] > 1:
+        top_two = np.sort(similarities, axis=1)[:, -2:]
+        best, runner_up = top_two[:, 1], top_two[:, 0]
+    else:
+        best = similarities[:, 0]
+        runner_up = np.zeros_like(best)
+    winners = similarities.argmax(axis=1)
+
+    results = []
+    for row in range(len(summaries)):
+        if best[row] >= threshold and best[row] - runner_up[row] >= min_margin:
+            results.append(model["category_ids"][winners[row]])
+        else:
+            results.append(None)
+    return results
+
+
+def evaluate(samples, threshold, min_margin=0.0, holdout_every=5):
+    """Hold out every ``holdout_every``-th sample and score against its label."""
+    train = [sample for idx, sample in enumerate(samples) if idx % holdout_every]
+    test = [sample for idx, sample in enumerate(samples) if not idx % holdout_every]
+
+    model = build_model(train)
+    predictions = classify(
+        model, [summary for summary, _ in test], threshold, min_margin
+    )
+
+    assigned = [
+        (prediction, label)
+        for prediction, (_, label) in zip(predictions, test)
+        if prediction is not None
+    ]
+    correct = sum(1 for prediction, label in assigned if prediction == label)
+    return {
+        "train_samples": len(train),
+        "test_samples": len(test),
+        "categories": len(model["category_ids"]) if model else 0,
+        "threshold": threshold,
+        "min_margin": min_margin,
+        "calls_avoided": round(len(assigned) / len(test), 4) if test else 0.0,
+        "accuracy_on_assigned": (
+            round(correct / len(assigned), 4) if assigned else None
+        ),
+    }
+
+
+def _scan_labeled_news(table_name, region, limit):
+    import boto3
+
+    table = boto3.resource("dynamodb", region_name=region).Table(table_name)
+    scan_kwargs = {
+        "ProjectionExpression": "summary, category_id",
+        "FilterExpression": "category_source = :source",
+        "ExpressionAttributeValues": {":source": SOURCE_BEDROCK},
+    }
+    samples = []
+    while len(samples) < limit:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            if item.get("category_id") not in (None, "", "uncategorized"):
+                samples.append((item.get("summary", ""), item["category_id"]))
+        if "LastEvaluatedKey" not in response:
+            break
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+    return samples[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--table", default=os.environ.get("NEWS_TABLE_NAME"))
+    parser.add_argument(
+        "--region", default=os.environ.get("AWS_REGION", "eu-central-1")
+    )
+    parser.add_argument("--limit", type=int, default=5000)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        action="append",
+        help="Similarity threshold to evaluate; repeat to compare several.",
+    )
+    parser.add_argument("--min-margin", type=float, default=DEFAULT_MIN_MARGIN)
+    args = parser.parse_args()
+
+    if not available():
+        parser.error("numpy is required for the pre-classifier")
+    if not args.table:
+        parser.error("--table or NEWS_TABLE_NAME is required")
+
+    samples = _scan_labeled_news(args.table, args.region, args.limit)
+    for threshold in args.threshold or [0.3, 0.4, DEFAULT_THRESHOLD, 0.5, 0.6]:
+        print(json.dumps(evaluate(samples, threshold, args.min_margin)))
+
+
+if __name__ == "__main__":
+    main()
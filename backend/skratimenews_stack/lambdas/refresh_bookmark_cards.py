@@ -0,0 +1,128 @@
+import os
+import json
+from pynamodb.models import Model
+from pynamodb.attributes import UnicodeAttribute, UTCDateTimeAttribute
+from pynamodb.exceptions import DeleteError, UpdateError
+from pynamodb.indexes import GlobalSecondaryIndex, KeysOnlyProjection
+from aws_lambda_powertools import Logger
+
+BOOKMARKS_TABLE_NAME = os.environ["BOOKMARKS_TABLE_NAME"]
+NEWS_TABLE_NAME = os.environ["NEWS_TABLE_NAME"]
+AWS_REGION = "eu-central-1"
+CARD_FIELDS = ["id", "title", "summary", "category_id", "picture_url"]
+
+logger = Logger(service="RefreshBookmarkCardsLambda")
+
+
+class NewsBookmarksIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "bookmarks-news-index"
+        projection = KeysOnlyProjection()
+        region = AWS_REGION
+
+    news_id = UnicodeAttribute(hash_key=True)
+    user_id = UnicodeAttribute(range_key=True)
+
+
+class UserBookmarkModel(Model):
+    class Meta:
+        table_name = BOOKMARKS_TABLE_NAME
+        region = AWS_REGION
+
+    user_id = UnicodeAttribute(hash_key=True)
+    news_id = UnicodeAttribute(range_key=True)
+    created_at = UTCDateTimeAttribute()
+    news_index = NewsBookmarksIndex()
+
+    # Card snapshot of the bookmarked news item
+    title = UnicodeAttribute(null=True)
+    summary = UnicodeAttribute(null=True)
+    category_id = UnicodeAttribute(null=True)
+    picture_url = UnicodeAttribute(null=True)
+
+
+class SkratimenewsModel(Model):
+    class Meta:
+        table_name = NEWS_TABLE_NAME
+        region = AWS_REGION
+
+    id = UnicodeAttribute(hash_key=True)
+    title = UnicodeAttribute(null=True)
+    summary = UnicodeAttribute(null=True)
+    category_id = UnicodeAttribute(null=True)
+    picture_url = UnicodeAttribute(null=True)
+
+
+def handler(event, context):
+    """Refresh bookmark card snapshots for news items that changed.
+
+    Each SQS message carries only a ``news_id``; the current item is re-read
+    so redelivered or out-of-order messages converge on the latest card. A
+    deleted news item removes the bookmarks pointing at it.
+    """
+    records = event.get("Records", [])
+    logger.info("Received records", extra={"count": len(records)})
+
+    batch_item_failures = []
+    for record in records:
+        try:
+            news_id = json.loads(record["body"])["news_id"]
+        except (KeyError, TypeError, ValueError) as e:
+            # Malformed bodies never succeed on redelivery, so they aren't retried.
+            logger.error("Malformed message", extra={"error": str(e)})
+            continue
+
+        try:
+            refresh_bookmark_cards(news_id)
+        except Exception as e:
+            logger.error(
+                "Failed to refresh bookmark cards",
+                extra={"news_id": news_id, "error": str(e)},
+            )
+            batch_item_failures.append({"itemIdentifier": record["messageId"]})
+
+    return {"batchItemFailures": batch_item_failures}
+
+
+def _card_actions(news_item):
+    actions = []
+    for field in CARD_FIELDS[1:]:
+        attribute = getattr(UserBookmarkModel, field)
+        value = getattr(news_item, field)
+        actions.append(attribute.remove() if value is None else attribute.set(value))
+    return actions
+
+
+def refresh_bookmark_cards(news_id):
+    """Copy the current card of ``news_id`` onto every bookmark of it."""
+    try:
+        news_item = SkratimenewsModel.get(news_id, attributes_to_get=CARD_FIELDS)
+    except SkratimenewsModel.DoesNotExist:
+        news_item = None
+
+    refreshed = 0
+    for bookmark in UserBookmarkModel.news_index.query(news_id):
+        try:
+            if news_item is None:
+                bookmark.delete()
+            else:
+                bookmark.update(
+                    actions=_card_actions(news_item),
+                    # Don't resurrect a bookmark removed since the index read.
+                    condition=UserBookmarkModel.news_id.exists(),
+                )
+        except (DeleteError, UpdateError) as e:
+            if e.cause_response_code != "ConditionalCheckFailedException":
+                raise
+            continue
+        refreshed += 1
+
+    logger.info(
+        "Bookmark cards refreshed",
+        extra={
+            "news_id": news_id,
+            "deleted": news_item is None,
+            "bookmarks": refreshed,
+        },
+    )
+    return refreshed
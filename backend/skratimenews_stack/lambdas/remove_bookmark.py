@@ -2,6 +2,7 @@ import os
 import json
 from pynamodb.models import Model
 from pynamodb.attributes import UnicodeAttribute, UTCDateTimeAttribute
+from pynamodb.exceptions import DeleteError
 from aws_lambda_powertools import Logger
 
 TABLE_NAME = os.environ["BOOKMARKS_TABLE_NAME"]
@@ -52,20 +53,14 @@ def handler(event, context):
                 "body": json.dumps({"error": "news_id is required"}),
             }
 
-        # Try to delete the bookmark
+        # Delete only if the bookmark exists, in a single round trip
         try:
-            bookmark = UserBookmarkModel.get(user_id, news_id)
-            bookmark.delete()
-            logger.info(
-                "Bookmark deleted successfully",
-                extra={"user_id": user_id, "news_id": news_id},
+            UserBookmarkModel(user_id, news_id).delete(
+                condition=UserBookmarkModel.news_id.exists()
             )
-
-            return {
-                "statusCode": 200,
-                "body": json.dumps({"message": "Bookmark removed successfully"}),
-            }
-        except UserBookmarkModel.DoesNotExist:
+        except DeleteError as e:
+            if e.cause_response_code != "ConditionalCheckFailedException":
+                raise
             logger.warning(
                 "Bookmark not found", extra={"user_id": user_id, "news_id": news_id}
             )
@@ -74,6 +69,16 @@ def handler(event, context):
                 "body": json.dumps({"error": "Bookmark not found"}),
             }
 
+        logger.info(
+            "Bookmark deleted successfully",
+            extra={"user_id": user_id, "news_id": news_id},
+        )
+
+        return {
+            "statusCode": 200,
+            "body": json.dumps({"message": "Bookmark removed successfully"}),
+        }
+
     except Exception as e:
         logger.error("Unhandled exception", extra={"error": str(e)})
         return {
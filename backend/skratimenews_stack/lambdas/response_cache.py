@@ -0,0 +1,128 @@
+"""Shared response caching for read-only API handlers.
+
+``cached(policy)`` wraps a Lambda handler so GET responses get a strong ETag
+and a per-route ``Cache-Control`` header, ``If-None-Match`` revalidations are
+answered with 304, and successful responses are kept in an in-process LRU that
+survives across warm invocations of the same container.
+
+``policy(event)`` returns ``(cache_control, ttl_seconds)``; a TTL of 0 keeps
+the response out of the LRU (e.g. per-user responses) but still sets the
+ETag, so clients can revalidate.
+"""
+
+import functools
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("RESPONSE_CACHE_MAX_ENTRIES", "256"))
+
+
+class LRUCache:
+    """Thread-safe LRU of responses with a per-entry expiry."""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value, ttl_seconds):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_responses = LRUCache(RESPONSE_CACHE_MAX_ENTRIES)
+
+
+def strong_etag(body):
+    return '"' + hashlib.sha256(body.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def cache_key(event):
+    """Key a response by method, path and query string."""
+    query_params = event.get("queryStringParameters") or {}
+    query = "&".join(f"{name}={query_params[name]}" for name in sorted(query_params))
+    return f"{event.get('httpMethod', 'GET')} {event.get('path', '')}?{query}"
+
+
+def _header(event, name):
+    name = name.lower()
+    for key, value in (event.get("headers") or {}).items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def etag_matches(if_none_match, etag):
+    """Weak comparison, as RFC 9110 prescribes for If-None-Match."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def cached(policy):
+    def decorator(handler):
+        @functools.wraps(handler)
+        def wrapper(event, context):
+            if event.get("httpMethod", "GET") != "GET":
+                return handler(event, context)
+
+            cache_control, ttl_seconds = policy(event)
+            key = cache_key(event)
+
+            response = _responses.get(key) if ttl_seconds else None
+            if response is None:
+                response = handler(event, context)
+                if response.get("statusCode") != 200:
+                    return response
+                response = {
+                    **response,
+                    "headers": {
+                        **(response.get("headers") or {}),
+                        "ETag": strong_etag(response["body"]),
+                        "Cache-Control": cache_control,
+                    },
+                }
+                if ttl_seconds:
+                    _responses.put(key, response, ttl_seconds)
+
+            if etag_matches(
+                _header(event, "If-None-Match"), response["headers"]["ETag"]
+            ):
+                return {
+                    "statusCode": 304,
+                    "headers": response["headers"],
+                    "body": "",
+                }
+            return response
+
+        return wrapper
+
+    return decorator
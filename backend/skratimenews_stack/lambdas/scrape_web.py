@@ -1,137 +1,526 @@
 import datetime
+import gzip
 import json
 import os
+import threading
+import time
 import uuid
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 import boto3
 import feedparser
 import requests
 from aws_lambda_powertools import Logger
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+
+from news_store import dynamodb_resource, find_existing_news_ids
+
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 logger = Logger(service="ScrapeWebLambda", level="INFO")
 
 RSS_URL = os.environ.get("RSS_URL", "https://feeds.feedburner.com/TheHackersNews")
 TABLE_NAME = os.environ["TABLE_NAME"]
+FEEDS_TABLE_NAME = os.environ.get("FEEDS_TABLE_NAME")
+LEGACY_FEED_ID = "default"
+NEWS_TABLE_NAME = os.environ["NEWS_TABLE_NAME"]
 QUEUE_URL = os.environ["RSS_QUEUE_URL"]
 AWS_REGION = os.environ.get("AWS_REGION", "eu-central-1")
+FEED_CONCURRENCY = int(os.environ.get("FEED_CONCURRENCY", "8"))
+FETCH_CONCURRENCY = int(os.environ.get("FETCH_CONCURRENCY", "8"))
+FETCH_PER_HOST_LIMIT = int(os.environ.get("FETCH_PER_HOST_LIMIT", "2"))
+FETCH_TIMEOUT_SECONDS = int(os.environ.get("FETCH_TIMEOUT_SECONDS", "10"))
+SQS_MAX_BATCH_ENTRIES = 10
+SQS_MAX_BATCH_BYTES = 256 * 1024
+SQS_SEND_ATTEMPTS = int(os.environ.get("SQS_SEND_ATTEMPTS", "3"))
+ARTICLE_BUCKET_NAME = os.environ.get("ARTICLE_BUCKET_NAME")
+ARTICLE_STORE_DIR = os.environ.get("ARTICLE_STORE_DIR")
+CLAIM_CHECK_THRESHOLD_BYTES = int(
+    os.environ.get("CLAIM_CHECK_THRESHOLD_BYTES", str(16 * 1024))
+)
 
-dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION)
-tracking_table = dynamodb.Table(TABLE_NAME)
 sqs = boto3.client("sqs", region_name=AWS_REGION)
+s3 = boto3.client("s3", region_name=AWS_REGION)
+
+# Pooled HTTP session reused across warm invocations and fetch threads.
+http_session = requests.Session()
+for _scheme in ("https://", "http://"):
+    http_session.mount(
+        _scheme,
+        HTTPAdapter(pool_connections=FETCH_CONCURRENCY, pool_maxsize=FETCH_CONCURRENCY),
+    )
+
+# Per-host politeness cap so concurrent fetches don't hammer a single site.
+_host_semaphores = defaultdict(lambda: threading.BoundedSemaphore(FETCH_PER_HOST_LIMIT))
+_host_semaphores_lock = threading.Lock()
 
 
 def lambda_handler(event, context):
     logger.info("Lambda invoked", extra={"event": event})
 
-    last_scrape_time = _load_last_scrape()
-    feed = _fetch_feed()
-
-    timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
-    tracking_table.put_item(
-        Item={"last_scrape": "last_scrape", "scraped_at": timestamp}
+    event = event or {}
+    shard_index = int(event.get("shard_index", 0))
+    shard_count = max(1, int(event.get("shard_count", 1)))
+    feeds = _shard_feeds(_load_feeds(), shard_index, shard_count)
+    logger.info(
+        "Scraping feeds",
+        extra={
+            "feeds": len(feeds),
+            "shard_index": shard_index,
+            "shard_count": shard_count,
+        },
     )
-    logger.info("Updated last scrape timestamp", extra={"scraped_at": timestamp})
 
-    processed = 0
-    skipped_old = 0
-    failed = 0
+    workers = max(1, min(FEED_CONCURRENCY, len(feeds)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_scrape_feed, feeds))
 
-    for idx, entry in enumerate(feed.entries, start=1):
-        logger.info(
-            "Processing entry", extra={"index": idx, "title": entry.get("title")}
+    new_entries = []
+    for result in results:
+        new_entries.extend(result.pop("entries"))
+    skipped_old = sum(result["skipped_old"] for result in results)
+
+    new_entries, skipped_duplicate = _drop_duplicates(new_entries)
+
+    articles = fetch_articles([entry.get("link", "") for _, entry, _, _ in new_entries])
+
+    payloads = [
+        build_payload(feed_id, entry, published_at, published_dt_utc, full_article)
+        for (feed_id, entry, published_at, published_dt_utc), full_article in zip(
+            new_entries, articles
         )
-        published_at = entry.get("published")
-        published_dt_utc = _to_utc(published_at)
+    ]
 
-        if (
-            last_scrape_time
-            and published_dt_utc
-            and published_dt_utc <= last_scrape_time
-        ):
-            skipped_old += 1
-            logger.info(
-                "Skipping previously processed item",
-                extra={
-                    "title": entry.get("title"),
-                    "published_at": published_at,
-                    "last_scrape": last_scrape_time.isoformat(),
-                },
-            )
-            continue
+    for payload in payloads:
+        _offload_full_article(payload)
 
-        payload = {
-            "id": str(uuid.uuid4()),
-            "title": entry.get("title", "No Title"),
-            "summary": entry.get("summary", "No Summary"),
-            "news_link": entry.get("link", "No Link"),
-            "author": entry.get("author", "Unknown Author"),
-            "published_at": published_at,
-            "published_at_utc": (
-                published_dt_utc.isoformat() if published_dt_utc else None
-            ),
-            "picture_url": _extract_image(entry.get("links", [])),
-            "full_article": scrape_full_article_from_url(entry.get("link", "")),
-        }
+    processed, failed = enqueue_payloads(payloads)
 
-        try:
-            sqs.send_message(
-                QueueUrl=QUEUE_URL,
-                MessageBody=json.dumps(payload),
-                MessageGroupId="rss",
-            )
-            processed += 1
-            logger.info("Queued news item", extra={"title": payload["title"]})
-        except Exception as exc:
-            failed += 1
-            logger.error(
-                "Failed to enqueue news item",
-                extra={"error": str(exc), "title": payload["title"]},
-            )
+    for result in sorted(results, key=lambda r: r["elapsed_ms"], reverse=True):
+        logger.info("Feed scraped", extra=result)
 
     logger.info(
         "Scrape completed",
         extra={
+            "feeds": len(feeds),
             "queued": processed,
             "skipped_old": skipped_old,
+            "skipped_duplicate": skipped_duplicate,
             "failed": failed,
-            "total_entries": len(feed.entries),
+            "total_entries": sum(result["total_entries"] for result in results),
         },
     )
     return {
         "statusCode": 200,
-        "body": json.dumps({"queued": processed, "skipped": skipped_old}),
+        "body": json.dumps(
+            {
+                "queued": processed,
+                "skipped": skipped_old + skipped_duplicate,
+                "failed": failed,
+                "feeds": results,
+            }
+        ),
+    }
+
+
+def build_payload(feed_id, entry, published_at, published_dt_utc, full_article):
+    return {
+        "id": news_id_for_link(entry.get("link")),
+        "feed_id": feed_id,
+        "title": entry.get("title", "No Title"),
+        "summary": entry.get("summary", "No Summary"),
+        "news_link": entry.get("link", "No Link"),
+        "author": entry.get("author", "Unknown Author"),
+        "published_at": published_at,
+        "published_at_utc": (
+            published_dt_utc.isoformat() if published_dt_utc else None
+        ),
+        "picture_url": _extract_image(entry.get("links", [])),
+        "full_article": full_article,
+    }
+
+
+def _load_feeds():
+    """Return enabled feed configs, falling back to RSS_URL when none exist."""
+    feeds = []
+    if FEEDS_TABLE_NAME:
+        try:
+            feeds_table = dynamodb_resource(AWS_REGION).Table(FEEDS_TABLE_NAME)
+            response = feeds_table.scan()
+            feeds.extend(response.get("Items", []))
+            while "LastEvaluatedKey" in response:
+                response = feeds_table.scan(
+                    ExclusiveStartKey=response["LastEvaluatedKey"]
+                )
+                feeds.extend(response.get("Items", []))
+        except Exception as exc:
+            logger.error("Failed to load feeds", extra={"error": str(exc)})
+
+    feeds = [
+        feed
+        for feed in feeds
+        if feed.get("id") and feed.get("url") and feed.get("enabled", True)
+    ]
+    if not feeds:
+        logger.info("No feeds configured; using RSS_URL", extra={"url": RSS_URL})
+        return [{"id": LEGACY_FEED_ID, "url": RSS_URL}]
+
+    logger.info("Loaded feeds", extra={"count": len(feeds)})
+    return sorted(feeds, key=lambda feed: feed["id"])
+
+
+def _shard_feeds(feeds, shard_index, shard_count):
+    if shard_count == 1:
+        return feeds
+    return [
+        feed
+        for feed in feeds
+        if zlib.crc32(feed["id"].encode("utf-8")) % shard_count == shard_index
+    ]
+
+
+def _scrape_feed(feed):
+    """Fetch one feed and return its new entries plus timing and counters."""
+    started = time.monotonic()
+    result = {
+        "feed_id": feed["id"],
+        "url": feed["url"],
+        "status": "ok",
+        "total_entries": 0,
+        "new_entries": 0,
+        "skipped_old": 0,
+        "entries": [],
     }
 
+    try:
+        last_scrape_time, validators = _load_last_scrape(feed["id"])
+        parsed = _fetch_feed(feed["url"], **validators)
+        if parsed is None:
+            result["status"] = "not_modified"
+        else:
+            _save_last_scrape(feed["id"], parsed)
+            result["total_entries"] = len(parsed.entries)
+            for entry in parsed.entries:
+                published_at = entry.get("published")
+                published_dt_utc = _to_utc(published_at)
+
+                if (
+                    last_scrape_time
+                    and published_dt_utc
+                    and published_dt_utc <= last_scrape_time
+                ):
+                    result["skipped_old"] += 1
+                    continue
+
+                result["entries"].append(
+                    (feed["id"], entry, published_at, published_dt_utc)
+                )
+            result["new_entries"] = len(result["entries"])
+    except Exception as exc:
+        result["status"] = "error"
+        result["error"] = str(exc)
+        logger.error(
+            "Failed to scrape feed",
+            extra={"feed_id": feed["id"], "url": feed["url"], "error": str(exc)},
+        )
+
+    result["elapsed_ms"] = int((time.monotonic() - started) * 1000)
+    return result
+
+
+def canonical_link(url):
+    """Normalize an article URL so republished links map to the same key."""
+    parsed = urlparse(url.strip())
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_")
+    )
+    return urlunparse(
+        (
+            (parsed.scheme or "https").lower(),
+            parsed.netloc.lower(),
+            parsed.path.rstrip("/") or "/",
+            "",
+            urlencode(query),
+            "",
+        )
+    )
+
+
+def news_id_for_link(url):
+    """Derive a stable news id from the canonical link.
+
+    The news table's primary key doubles as the dedup index: the scraper
+    checks it before fetching and the categorizer writes with
+    ``attribute_not_exists(id)``. Entries without a link get a random id.
+    """
+    if not url:
+        return str(uuid.uuid4())
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, canonical_link(url)))
+
+
+def _drop_duplicates(entries):
+    ids = [news_id_for_link(entry.get("link")) for _, entry, _, _ in entries]
+    existing = _find_existing_news_ids(ids)
+
+    unique = []
+    seen = set()
+    for news_id, item in zip(ids, entries):
+        if news_id in existing or news_id in seen:
+            logger.info(
+                "Skipping duplicate item",
+                extra={"title": item[1].get("title"), "news_id": news_id},
+            )
+            continue
+        seen.add(news_id)
+        unique.append(item)
+    return unique, len(entries) - len(unique)
+
+
+def _find_existing_news_ids(news_ids):
+    try:
+        return find_existing_news_ids(
+            dynamodb_resource(AWS_REGION), NEWS_TABLE_NAME, news_ids
+        )
+    except Exception as exc:
+        logger.warning(
+            "Failed to check dedup index; assuming items are new",
+            extra={"error": str(exc)},
+        )
+        return set()
+
+
+def enqueue_payloads(payloads):
+    """Send payloads with SendMessageBatch and return (queued, failed) counts."""
+    queued = 0
+    failed = 0
+
+    messages = []
+    for payload in payloads:
+        body = json.dumps(payload)
+        size = len(body.encode("utf-8"))
+        if size > SQS_MAX_BATCH_BYTES:
+            failed += 1
+            logger.error(
+                "News item exceeds SQS message size limit",
+                extra={"title": payload.get("title"), "bytes": size},
+            )
+            continue
+        messages.append({"body": body, "size": size, "title": payload.get("title")})
+
+    for batch in _build_batches(messages):
+        sent, not_sent = _send_batch(batch)
+        queued += sent
+        failed += not_sent
+    return queued, failed
+
+
+def _build_batches(messages):
+    batch = []
+    batch_bytes = 0
+    for message in messages:
+        if batch and (
+            len(batch) >= SQS_MAX_BATCH_ENTRIES
+            or batch_bytes + message["size"] > SQS_MAX_BATCH_BYTES
+        ):
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(message)
+        batch_bytes += message["size"]
+    if batch:
+        yield batch
+
+
+def _send_batch(batch):
+    pending = {str(idx): item for idx, item in enumerate(batch)}
+    sent = 0
+    failed = 0
+
+    for attempt in range(1, SQS_SEND_ATTEMPTS + 1):
+        if not pending:
+            break
+        if attempt > 1:
+            time.sleep(0.2 * 2 ** (attempt - 2))
+        try:
+            response = sqs.send_message_batch(
+                QueueUrl=QUEUE_URL,
+                Entries=[
+                    {
+                        "Id": entry_id,
+                        "MessageBody": item["body"],
+                        "MessageGroupId": "rss",
+                    }
+                    for entry_id, item in pending.items()
+                ],
+            )
+        except sqs.exceptions.BatchRequestTooLong:
+            if len(pending) == 1:
+                break
+            logger.warning("Batch too large; splitting", extra={"size": len(pending)})
+            items = list(pending.values())
+            half = len(items) // 2
+            for part in (items[:half], items[half:]):
+                part_sent, part_failed = _send_batch(part)
+                sent += part_sent
+                failed += part_failed
+            return sent, failed
+        except Exception as exc:
+            logger.warning(
+                "SendMessageBatch call failed",
+                extra={"error": str(exc), "attempt": attempt, "size": len(pending)},
+            )
+            continue
+
+        for result in response.get("Successful", []):
+            item = pending.pop(result["Id"], None)
+            if item:
+                sent += 1
+                logger.info("Queued news item", extra={"title": item["title"]})
+
+        for result in response.get("Failed", []):
+            if result.get("SenderFault"):
+                item = pending.pop(result["Id"], None)
+                failed += 1
+                logger.error(
+                    "Failed to enqueue news item",
+                    extra={
+                        "error": result.get("Message"),
+                        "code": result.get("Code"),
+                        "title": item["title"] if item else None,
+                    },
+                )
 
-def _load_last_scrape():
+    for item in pending.values():
+        failed += 1
+        logger.error(
+            "Failed to enqueue news item after retries",
+            extra={"title": item["title"], "attempts": SQS_SEND_ATTEMPTS},
+        )
+    return sent, failed
+
+
+def _offload_full_article(payload):
+    """Move a large article body to the blob store, leaving a reference behind.
+
+    The categorizer resolves ``full_article_ref`` back to the text when it
+    persists the item, so the queue only carries the small metadata fields.
+    """
+    full_article = payload.get("full_article") or ""
+    if not (ARTICLE_STORE_DIR or ARTICLE_BUCKET_NAME):
+        return
+    if len(full_article.encode("utf-8")) < CLAIM_CHECK_THRESHOLD_BYTES:
+        return
+
+    key = f"articles/{payload['id']}.txt.gz"
+    data = gzip.compress(full_article.encode("utf-8"))
     try:
-        response = tracking_table.get_item(Key={"last_scrape": "last_scrape"})
+        if ARTICLE_STORE_DIR:
+            path = os.path.join(ARTICLE_STORE_DIR, key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as fh:
+                fh.write(data)
+            ref = f"file://{path}"
+        else:
+            s3.put_object(
+                Bucket=ARTICLE_BUCKET_NAME,
+                Key=key,
+                Body=data,
+                ContentType="text/plain; charset=utf-8",
+                ContentEncoding="gzip",
+            )
+            ref = f"s3://{ARTICLE_BUCKET_NAME}/{key}"
+    except Exception as exc:
+        logger.warning(
+            "Failed to offload article body; sending inline",
+            extra={"title": payload.get("title"), "error": str(exc)},
+        )
+        return
+
+    payload["full_article"] = None
+    payload["full_article_ref"] = ref
+    logger.info(
+        "Offloaded article body",
+        extra={"ref": ref, "bytes": len(data), "title": payload.get("title")},
+    )
+
+
+def _tracking_key(feed_id):
+    # The single-feed deployment stored its cursor under "last_scrape"; keep
+    # that row for the fallback feed so upgrading doesn't re-queue everything.
+    if feed_id == LEGACY_FEED_ID:
+        return "last_scrape"
+    return f"feed#{feed_id}"
+
+
+def _load_last_scrape(feed_id):
+    """Return the feed's last scrape time and its conditional-GET validators.
+
+    The record is overwritten after a successful fetch and left untouched on a
+    304, so the cutoff and validators always describe the last feed we parsed.
+    """
+    key = _tracking_key(feed_id)
+    try:
+        tracking_table = dynamodb_resource(AWS_REGION).Table(TABLE_NAME)
+        response = tracking_table.get_item(Key={"last_scrape": key})
         item = response.get("Item")
         if not item:
-            logger.info("No previous scrape timestamp found")
-            return None
+            logger.info("No previous scrape timestamp found", extra={"key": key})
+            return None, {}
         last_scrape_time = datetime.datetime.fromisoformat(item["scraped_at"])
+        validators = {
+            "etag": item.get("etag"),
+            "modified": item.get("modified"),
+        }
         logger.info(
             "Loaded last scrape timestamp",
-            extra={"timestamp": item["scraped_at"]},
+            extra={"key": key, "timestamp": item["scraped_at"], **validators},
         )
-        tracking_table.delete_item(Key={"last_scrape": "last_scrape"})
-        logger.info("Cleared previous scrape record")
-        return last_scrape_time
+        return last_scrape_time, validators
     except Exception as exc:
         logger.warning(
-            "Failed to load last scrape timestamp", extra={"error": str(exc)}
+            "Failed to load last scrape timestamp",
+            extra={"key": key, "error": str(exc)},
         )
-        return None
+        return None, {}
+
+
+def _save_last_scrape(feed_id, feed):
+    timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    item = {"last_scrape": _tracking_key(feed_id), "scraped_at": timestamp}
+    if feed.get("etag"):
+        item["etag"] = feed.etag
+    if feed.get("modified"):
+        item["modified"] = feed.modified
+    dynamodb_resource(AWS_REGION).Table(TABLE_NAME).put_item(Item=item)
+    logger.info(
+        "Updated last scrape timestamp",
+        extra={"feed_id": feed_id, "scraped_at": timestamp},
+    )
 
 
-def _fetch_feed():
-    logger.info("Fetching RSS feed", extra={"url": RSS_URL})
-    feed = feedparser.parse(RSS_URL)
+def _fetch_feed(url, etag=None, modified=None):
+    logger.info(
+        "Fetching RSS feed",
+        extra={"url": url, "etag": etag, "modified": modified},
+    )
+    feed = feedparser.parse(url, etag=etag, modified=modified)
+    if feed.get("status") == 304:
+        logger.info("RSS feed not modified since last scrape", extra={"url": url})
+        return None
     if feed.bozo:
         raise RuntimeError(f"RSS parse error: {feed.bozo_exception}")
-    logger.info("RSS feed fetched", extra={"entries": len(feed.entries)})
+    logger.info("RSS feed fetched", extra={"url": url, "entries": len(feed.entries)})
     return feed
 
 
@@ -155,11 +544,40 @@ def _extract_image(links):
     return None
 
 
+def fetch_articles(urls: list[str]) -> list[str]:
+    """Fetch and extract article bodies concurrently, preserving input order."""
+    if not urls:
+        return []
+
+    started = datetime.datetime.now(datetime.timezone.utc)
+    workers = max(1, min(FETCH_CONCURRENCY, len(urls)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        articles = list(executor.map(scrape_full_article_from_url, urls))
+
+    elapsed = datetime.datetime.now(datetime.timezone.utc) - started
+    logger.info(
+        "Fetched article bodies",
+        extra={
+            "count": len(urls),
+            "workers": workers,
+            "elapsed_ms": int(elapsed.total_seconds() * 1000),
+        },
+    )
+    return articles
+
+
+def _host_semaphore(url):
+    host = urlparse(url).netloc.lower()
+    with _host_semaphores_lock:
+        return _host_semaphores[host]
+
+
 def scrape_full_article_from_url(url: str) -> str:
     if not url:
         return ""
     try:
-        response = requests.get(url, timeout=10)
+        with _host_semaphore(url):
+            response = http_session.get(url, timeout=FETCH_TIMEOUT_SECONDS)
         response.raise_for_status()
     except Exception as exc:
         logger.warning(
@@ -167,13 +585,86 @@ def scrape_full_article_from_url(url: str) -> str:
         )
         return ""
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    return extract_article(url, response.text)
+
+
+# Host -> extractor(html) returning the article text, or "" when the page
+# doesn't match the expected layout.
+ARTICLE_EXTRACTORS = {}
+
+_BOILERPLATE_TAGS = [
+    "script",
+    "style",
+    "noscript",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+    "form",
+    "iframe",
+]
+
+
+def register_extractor(*hosts):
+    def decorator(extractor):
+        for host in hosts:
+            ARTICLE_EXTRACTORS[host] = extractor
+        return extractor
+
+    return decorator
+
+
+def extract_article(url: str, html: str) -> str:
+    host = urlparse(url).netloc.lower().removeprefix("www.")
+    extractor = ARTICLE_EXTRACTORS.get(host)
+    if extractor:
+        text = extractor(html)
+        if text:
+            return text
+        logger.info("Host extractor found no article body", extra={"url": url})
+
+    text = _extract_generic(html)
+    if not text:
+        logger.info("Article body not found", extra={"url": url})
+    return text
+
+
+_HACKER_NEWS_STRAINER = SoupStrainer("div", id="articlebody")
+
+
+@register_extractor("thehackernews.com")
+def _extract_hacker_news(html):
+    # Only the article container is built into a tree; the rest of the page
+    # is skipped by the strainer.
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=_HACKER_NEWS_STRAINER)
     article_div = soup.find("div", id="articlebody")
     if not article_div:
-        logger.info("Article body not found", extra={"url": url})
         return ""
 
     for div in article_div.find_all("div", class_=["dog_two", "separator"]):
         div.decompose()
 
     return article_div.get_text(separator="\n", strip=True)
+
+
+def _extract_generic(html):
+    """Readability-style fallback: the <article> tag or the densest <p> block."""
+    soup = BeautifulSoup(html, HTML_PARSER)
+    for tag in soup(_BOILERPLATE_TAGS):
+        tag.decompose()
+
+    container = soup.find("article")
+    if not container:
+        candidates = {}
+        scores = defaultdict(int)
+        for paragraph in soup.find_all("p"):
+            parent = paragraph.parent
+            if parent is None:
+                continue
+            candidates[id(parent)] = parent
+            scores[id(parent)] += len(paragraph.get_text(strip=True))
+        if not scores:
+            return ""
+        container = candidates[max(scores, key=scores.get)]
+
+    return container.get_text(separator="\n", strip=True)
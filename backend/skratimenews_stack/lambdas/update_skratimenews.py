@@ -1,15 +1,20 @@
 import os
 import base64
 import json
+import boto3
 from pynamodb.models import Model
 from pynamodb.attributes import UnicodeAttribute
+from pynamodb.exceptions import UpdateError
 from pydantic import BaseModel, ValidationError
 from aws_lambda_powertools import Logger
 
 
 TABLE_NAME = os.environ["TABLE_NAME"]
+BOOKMARK_CARDS_QUEUE_URL = os.environ["BOOKMARK_CARDS_QUEUE_URL"]
 AWS_REGION = "eu-central-1"
 
+sqs = boto3.client("sqs", region_name=AWS_REGION)
+
 
 
 class SkratimenewsModel(Model):
@@ -29,6 +34,8 @@ class SkratimenewsModel(Model):
     
     picture_url = UnicodeAttribute(null=True)
     
+    category_source = UnicodeAttribute(null=True)
+    
 
 
 
@@ -48,6 +55,18 @@ class UpdateSkratimenewsSchema(BaseModel):
 
 logger = Logger(service="SkratimenewsUpdateLambda")
 
+def notify_bookmark_cards(news_id):
+    """Queue a refresh of the bookmark cards that snapshot this item."""
+    try:
+        sqs.send_message(
+            QueueUrl=BOOKMARK_CARDS_QUEUE_URL,
+            MessageBody=json.dumps({"news_id": news_id}),
+        )
+    except Exception as e:
+        # The item change is already committed; cards refresh on the next one.
+        logger.error("Failed to queue bookmark card refresh", extra={"news_id": news_id, "error": str(e)})
+
+
 def handler(event, context):
     logger.info("Received event", extra={"event": event})
 
@@ -71,28 +90,44 @@ def handler(event, context):
 
         key = partition_key_value
         
-        item = SkratimenewsModel.get(key)
-        logger.info("Fetched existing item", extra={"key": key})
-
+        # UpdateItem only touches the given attributes, so fields this model
+        # doesn't declare (published_at, full_article, ...) are kept.
+        actions = []
         
         if data.title is not None:
-            item.title = data.title
+            actions.append(SkratimenewsModel.title.set(data.title))
             logger.debug("Updated field")
         
         if data.summary is not None:
-            item.summary = data.summary
+            actions.append(SkratimenewsModel.summary.set(data.summary))
             logger.debug("Updated field")
         
         if data.category_id is not None:
-            item.category_id = data.category_id
+            actions.append(SkratimenewsModel.category_id.set(data.category_id))
+            # A hand-picked category isn't a Bedrock label to train on.
+            actions.append(SkratimenewsModel.category_source.set("manual"))
             logger.debug("Updated field")
         
         if data.picture_url is not None:
-            item.picture_url = data.picture_url
+            actions.append(SkratimenewsModel.picture_url.set(data.picture_url))
             logger.debug("Updated field")
         
-        item.save()
-        logger.info("Item saved successfully")
+        if not actions:
+            SkratimenewsModel.get(key)
+            logger.info("No fields to update", extra={"key": key})
+        else:
+            try:
+                SkratimenewsModel(key).update(
+                    actions=actions,
+                    condition=SkratimenewsModel.id.exists(),
+                )
+            except UpdateError as e:
+                if e.cause_response_code != "ConditionalCheckFailedException":
+                    raise
+                raise SkratimenewsModel.DoesNotExist()
+            logger.info("Item saved successfully")
+
+            notify_bookmark_cards(key)
 
         
         response = {
@@ -0,0 +1,306 @@
+"""Local backfill pipeline: scrape -> categorize -> batch-write in one process.
+
+Reuses the ``scrape_web`` and ``categorizer`` Lambda functions as pipeline
+stages connected by bounded queues, so onboarding a feed or re-categorizing
+history doesn't go through EventBridge and SQS one message at a time.
+
+    # Backfill one or more feeds
+    NEWS_TABLE_NAME=... CATEGORIES_TABLE_NAME=... \\
+        python backfill.py feeds https://example.com/rss --checkpoint feeds.ckpt
+
+    # Re-categorize everything already in the news table
+    NEWS_TABLE_NAME=... CATEGORIES_TABLE_NAME=... \\
+        python backfill.py recategorize --checkpoint recat.ckpt
+
+Re-categorizing rewrites only ``category_id`` and ``category_source``; every
+other stored attribute, the dates included, is written back unchanged, and
+items an editor categorized by hand are left alone.
+
+Point ``AWS_ENDPOINT_URL`` at DynamoDB Local / moto server and
+``BEDROCK_ENDPOINT_URL`` at a fake Bedrock to run against local stand-ins.
+Completed news ids are recorded in the checkpoint file after each write, and
+an interrupted run resumes by skipping them.
+"""
+
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "lambdas"))
+
+# scrape_web reads these at import time but the backfill never touches the
+# tracking table or the queue.
+os.environ.setdefault("TABLE_NAME", "unused")
+os.environ.setdefault("RSS_QUEUE_URL", "unused")
+
+from aws_lambda_powertools import Logger  # noqa: E402
+
+import categorizer  # noqa: E402
+import scrape_web  # noqa: E402
+from news_store import dynamodb_resource  # noqa: E402
+
+logger = Logger(service="BackfillPipeline", level="INFO")
+
+_DONE = object()
+# Set by update_skratimenews when an editor picks the category.
+MANUAL_CATEGORY_SOURCE = "manual"
+
+
+class Checkpoint:
+    """Append-only record of written news ids, safe to share across threads."""
+
+    def __init__(self, path):
+        self.path = path
+        self.done = set()
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path) as fh:
+                for line in fh:
+                    line = line.strip()
+                    if line:
+                        self.done.add(line)
+            logger.info(
+                "Loaded checkpoint", extra={"path": path, "done": len(self.done)}
+            )
+
+    def __contains__(self, news_id):
+        return news_id in self.done
+
+    def record(self, news_ids):
+        with self._lock:
+            self.done.update(news_ids)
+            if not self.path:
+                return
+            with open(self.path, "a") as fh:
+                fh.writelines(f"{news_id}\n" for news_id in news_ids)
+                fh.flush()
+                os.fsync(fh.fileno())
+
+
+def feed_source(feed_urls, checkpoint):
+    """Yield raw entries from the given feeds that aren't checkpointed yet."""
+    for url in feed_urls:
+        feed = scrape_web._fetch_feed(url)
+        news_ids = [
+            scrape_web.news_id_for_link(entry.get("link")) for entry in feed.entries
+        ]
+        stored = scrape_web._find_existing_news_ids(news_ids)
+        for news_id, entry in zip(news_ids, feed.entries):
+            if news_id in checkpoint or news_id in stored:
+                continue
+            yield {"feed_id": url, "entry": entry}
+
+
+def extract_stage(work):
+    """Fetch and extract the article body for one feed entry."""
+    entry = work["entry"]
+    published_at = entry.get("published")
+    yield scrape_web.build_payload(
+        work["feed_id"],
+        entry,
+        published_at,
+        scrape_web._to_utc(published_at),
+        scrape_web.scrape_full_article_from_url(entry.get("link", "")),
+    )
+
+
+def table_source(checkpoint, segment=0, total_segments=1):
+    """Yield stored news items for re-categorization, skipping manual ones."""
+    news_table = dynamodb_resource(categorizer.AWS_REGION).Table(
+        categorizer.NEWS_TABLE_NAME
+    )
+    scan_kwargs = {
+        "Segment": segment,
+        "TotalSegments": total_segments,
+        "FilterExpression": (
+            "attribute_not_exists(category_source) OR category_source <> :manual"
+        ),
+        "ExpressionAttributeValues": {":manual": MANUAL_CATEGORY_SOURCE},
+    }
+    while True:
+        response = news_table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            if item["id"] in checkpoint:
+                continue
+            yield {
+                "id": item["id"],
+                "summary": item.get("summary", ""),
+                "stored_item": item,
+            }
+        if "LastEvaluatedKey" not in response:
+            return
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def _recategorized(stored_item, category_id, category_source):
+    news_item = dict(stored_item, category_id=category_id)
+    news_item.pop("category_source", None)
+    if category_source:
+        news_item["category_source"] = category_source
+    return news_item
+
+
+def _run_stage(name, workers, inbox, outbox, handle):
+    """Start ``workers`` threads that apply ``handle`` to every inbox item.
+
+    ``handle`` returns an iterable of results, which are put on ``outbox``.
+    The last worker to finish forwards the end-of-stream marker.
+    """
+    remaining = [workers]
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                inbox.put(_DONE)
+                break
+            try:
+                for result in handle(item):
+                    outbox.put(result)
+            except Exception as exc:
+                logger.error(f"{name} stage failed", extra={"error": str(exc)})
+        with lock:
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                outbox.put(_DONE)
+
+    for idx in range(workers):
+        threading.Thread(target=worker, name=f"{name}-{idx}", daemon=True).start()
+
+
+def _batched(inbox, size, max_wait_seconds=2.0):
+    """Drain ``inbox`` into lists of up to ``size`` items until end-of-stream."""
+    batch = []
+    deadline = None
+    while True:
+        timeout = None if deadline is None else max(0, deadline - time.monotonic())
+        try:
+            item = inbox.get(timeout=timeout)
+        except queue.Empty:
+            item = None
+        if item is _DONE:
+            if batch:
+                yield batch
+            return
+        if item is not None:
+            batch.append(item)
+            deadline = deadline or time.monotonic() + max_wait_seconds
+        if batch and (len(batch) >= size or time.monotonic() >= deadline):
+            yield batch
+            batch = []
+            deadline = None
+
+
+def run_pipeline(
+    source,
+    checkpoint,
+    extract=None,
+    extract_workers=8,
+    categorize_workers=2,
+    queue_size=100,
+):
+    """Drive ``source`` through extract -> categorize -> write and return stats."""
+    snapshot = categorizer._get_category_snapshot()
+    stats = {"written": 0, "failed": 0}
+
+    raw = queue.Queue(maxsize=queue_size)
+    extracted = queue.Queue(maxsize=queue_size)
+    categorized = queue.Queue(maxsize=queue_size)
+    batches = queue.Queue(maxsize=max(1, categorize_workers * 2))
+
+    def categorize(batch):
+        categories = categorizer.categorize_summaries(
+            [payload.get("summary", "") for payload in batch],
+            snapshot["names"],
+            snapshot["lookup"],
+            category_version=snapshot["set_version"],
+            category_index=snapshot["index"],
+        )
+        for payload, (category_id, category_source) in zip(batch, categories):
+            if category_id is None:
+                # Left out of the checkpoint, so the next run retries it.
+                logger.warning(
+                    "Bedrock call failed; skipping item",
+                    extra={"news_id": payload["id"]},
+                )
+                continue
+            if "stored_item" in payload:
+                yield _recategorized(
+                    payload["stored_item"], category_id, category_source
+                )
+            else:
+                yield categorizer.build_news_item(
+                    payload["id"], payload, category_id, category_source
+                )
+
+    if extract:
+        _run_stage("extract", extract_workers, raw, extracted, extract)
+    else:
+        extracted = raw
+
+    def batch_feeder():
+        for batch in _batched(extracted, categorizer.CATEGORIZE_BATCH_SIZE):
+            batches.put(batch)
+        batches.put(_DONE)
+
+    threading.Thread(target=batch_feeder, daemon=True).start()
+    _run_stage("categorize", categorize_workers, batches, categorized, categorize)
+
+    def writer():
+        for batch in _batched(categorized, categorizer.DYNAMODB_BATCH_WRITE_LIMIT):
+            failed_ids = categorizer.write_news_items(batch)
+            written = [item["id"] for item in batch if item["id"] not in failed_ids]
+            checkpoint.record(written)
+            stats["written"] += len(written)
+            stats["failed"] += len(failed_ids)
+            logger.info("Backfill progress", extra=stats)
+
+    writer_thread = threading.Thread(target=writer, daemon=True)
+    writer_thread.start()
+
+    for item in source:
+        raw.put(item)
+    raw.put(_DONE)
+
+    writer_thread.join()
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", choices=["feeds", "recategorize"])
+    parser.add_argument("feed_urls", nargs="*")
+    parser.add_argument("--checkpoint", help="File recording completed news ids")
+    parser.add_argument("--extract-workers", type=int, default=8)
+    parser.add_argument("--categorize-workers", type=int, default=2)
+    parser.add_argument("--queue-size", type=int, default=100)
+    args = parser.parse_args()
+
+    checkpoint = Checkpoint(args.checkpoint)
+    if args.source == "feeds":
+        if not args.feed_urls:
+            parser.error("feeds requires at least one feed URL")
+        source = feed_source(args.feed_urls, checkpoint)
+        extract = extract_stage
+    else:
+        source = table_source(checkpoint)
+        extract = None
+
+    stats = run_pipeline(
+        source,
+        checkpoint,
+        extract=extract,
+        extract_workers=args.extract_workers,
+        categorize_workers=args.categorize_workers,
+        queue_size=args.queue_size,
+    )
+    print(json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Backfill ``published_day`` on news items stored before the date indexes.
+
+news-date-index is keyed on ``published_day``/``published_at``, and DynamoDB
+only indexes items that carry both, so items written before the categorizer
+set ``published_day`` never show up in the latest listing:
+
+    python backfill_published_day.py --table SkratimenewsStack-SkratimenewsTable...
+    python backfill_published_day.py --table ... --dry-run
+
+Items with a usable ``published_at`` get ``published_day`` set to its date.
+Items whose ``published_at`` is empty or null (no feed date) get it removed,
+since an empty or null index key is rejected by the date indexes; they stay
+reachable by id and through the scan listing, and are counted as
+``undated`` on later runs. Safe to re-run: every write is conditioned on
+``published_day`` still being absent.
+"""
+
+import argparse
+import datetime
+import json
+import os
+
+import boto3
+from botocore.exceptions import ClientError
+
+
+def _published_day(published_at):
+    if not isinstance(published_at, str) or len(published_at) < 10:
+        return None
+    try:
+        return datetime.date.fromisoformat(published_at[:10]).isoformat()
+    except ValueError:
+        return None
+
+
+def backfill(table, dry_run=False):
+    stats = {"scanned": 0, "dated": 0, "cleared": 0, "undated": 0, "skipped": 0}
+    scan_kwargs = {
+        "ProjectionExpression": "id, published_at",
+        "FilterExpression": "attribute_not_exists(published_day)",
+    }
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            stats["scanned"] += 1
+            if "published_at" not in item:
+                stats["undated"] += 1
+                continue
+            day = _published_day(item.get("published_at"))
+            if day:
+                update = {
+                    "UpdateExpression": "SET published_day = :day",
+                    "ExpressionAttributeValues": {":day": day},
+                }
+                outcome = "dated"
+            else:
+                update = {"UpdateExpression": "REMOVE published_at"}
+                outcome = "cleared"
+
+            if not dry_run:
+                try:
+                    table.update_item(
+                        Key={"id": item["id"]},
+                        ConditionExpression=(
+                            "attribute_exists(id) AND attribute_not_exists(published_day)"
+                        ),
+                        **update,
+                    )
+                except ClientError as exc:
+                    code = exc.response["Error"]["Code"]
+                    if code != "ConditionalCheckFailedException":
+                        raise
+                    # Deleted or re-stored by the categorizer meanwhile.
+                    outcome = "skipped"
+            stats[outcome] += 1
+
+        if "LastEvaluatedKey" not in response:
+            return stats
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--table", default=os.environ.get("NEWS_TABLE_NAME"))
+    parser.add_argument(
+        "--region", default=os.environ.get("AWS_REGION", "eu-central-1")
+    )
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    if not args.table:
+        parser.error("--table or NEWS_TABLE_NAME is required")
+
+    table = boto3.resource("dynamodb", region_name=args.region).Table(args.table)
+    print(json.dumps(backfill(table, dry_run=args.dry_run)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Time get_bookmark for users with 10, 100 and 1000 bookmarks.
+
+Seeds a user per size and times the handler in-process: the first page, and
+walking every page with the cursor. Bookmarks are seeded with their card
+snapshot, and with ``--legacy`` also without one, which exercises the
+batch-get join against the news table:
+
+    python bench_get_bookmark.py
+    python bench_get_bookmark.py --sizes 10 100 1000 --repeat 5 --legacy
+
+Runs against moto's in-memory DynamoDB unless ``--endpoint-url`` points at
+DynamoDB Local, so the numbers compare code paths rather than production
+latency.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "lambdas"))
+
+os.environ.setdefault("BOOKMARKS_TABLE_NAME", "bench-bookmarks")
+os.environ.setdefault("NEWS_TABLE_NAME", "bench-news")
+os.environ.setdefault("CURSOR_SECRET", "bench")
+os.environ.setdefault("POWERTOOLS_LOG_LEVEL", "ERROR")
+
+import get_bookmark  # noqa: E402
+
+MODELS = (get_bookmark.UserBookmarkModel, get_bookmark.SkratimenewsModel)
+
+
+def create_tables(endpoint_url):
+    for model in MODELS:
+        if endpoint_url:
+            model.Meta.host = endpoint_url
+        if not model.exists():
+            model.create_table(billing_mode="PAY_PER_REQUEST", wait=True)
+
+
+def seed(user_id, count, snapshot):
+    started = datetime.now(timezone.utc)
+    with get_bookmark.SkratimenewsModel.batch_write() as batch:
+        for i in range(count):
+            batch.save(
+                get_bookmark.SkratimenewsModel(
+                    id=f"{user_id}-{i:04d}",
+                    title=f"Title {i}",
+                    summary=f"Summary {i}",
+                    category_id="bench",
+                )
+            )
+    with get_bookmark.UserBookmarkModel.batch_write() as batch:
+        for i in range(count):
+            card = {}
+            if snapshot:
+                card = {"title": f"Title {i}", "summary": f"Summary {i}"}
+            batch.save(
+                get_bookmark.UserBookmarkModel(
+                    user_id=user_id,
+                    news_id=f"{user_id}-{i:04d}",
+                    created_at=started + timedelta(seconds=i),
+                    **card,
+                )
+            )
+
+
+def _event(user_id, cursor=None):
+    return {
+        "httpMethod": "GET",
+        "queryStringParameters": {"last_evaluated_key": cursor} if cursor else {},
+        "requestContext": {"authorizer": {"claims": {"sub": user_id}}},
+    }
+
+
+def first_page(user_id):
+    body = json.loads(get_bookmark.handler(_event(user_id), None)["body"])
+    return body["count"]
+
+
+def all_pages(user_id):
+    count, cursor = 0, None
+    while True:
+        body = json.loads(get_bookmark.handler(_event(user_id, cursor), None)["body"])
+        count += body["count"]
+        cursor = body["last_evaluated_key"]
+        if not cursor:
+            return count
+
+
+def _median_ms(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 1), result
+
+
+def run(sizes, repeat, variants):
+    results = []
+    for variant in variants:
+        for size in sizes:
+            user_id = f"bench-{variant}-{size}"
+            seed(user_id, size, snapshot=variant == "snapshot")
+            first_ms, first_count = _median_ms(lambda: first_page(user_id), repeat)
+            all_ms, all_count = _median_ms(lambda: all_pages(user_id), repeat)
+            assert all_count == size, (variant, size, all_count)
+            results.append(
+                {
+                    "variant": variant,
+                    "bookmarks": size,
+                    "first_page_items": first_count,
+                    "first_page_ms": first_ms,
+                    "all_pages_ms": all_ms,
+                }
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--legacy",
+        action="store_true",
+        help="Also time bookmarks without a card snapshot.",
+    )
+    parser.add_argument("--endpoint-url", help="DynamoDB Local endpoint")
+    args = parser.parse_args()
+
+    variants = ["snapshot", "legacy"] if args.legacy else ["snapshot"]
+    if args.endpoint_url:
+        create_tables(args.endpoint_url)
+        results = run(args.sizes, args.repeat, variants)
+    else:
+        from moto import mock_aws
+
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "bench")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "bench")
+        with mock_aws():
+            create_tables(None)
+            results = run(args.sizes, args.repeat, variants)
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""Measure DynamoDB reads per 1000 requests with and without the response cache.
+
+Replays a mixed read workload (latest page, category pages, single items,
+ETag revalidations) against the ``get_skratimenews`` and ``get_category``
+handlers in-process and counts the DynamoDB read calls they make, the read
+units they consume and the response bytes they return:
+
+    TABLE_NAME=... CATEGORIES_TABLE_NAME=... BOOKMARKS_TABLE_NAME=... \\
+        CURSOR_SECRET=local python cache_load_bench.py --requests 1000
+
+    # Seed in-memory tables through moto instead
+    python cache_load_bench.py --moto-items 2000
+
+Point ``AWS_ENDPOINT_URL`` at DynamoDB Local / moto server to run against a
+local stand-in. Read units are worked out from the size of every item a read
+touches, as DynamoDB bills them (eventually consistent, 4 KB steps, summed per
+Query/Scan page, index reads sized by what the index projects), since neither
+local stand-in reports real consumed capacity.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "lambdas"))
+
+# The handlers read these at import time; --moto-items creates the tables.
+os.environ.setdefault("TABLE_NAME", "load-news")
+os.environ.setdefault("CATEGORIES_TABLE_NAME", "load-categories")
+os.environ.setdefault("BOOKMARKS_TABLE_NAME", "load-bookmarks")
+os.environ.setdefault("CURSOR_SECRET", "load")
+os.environ.setdefault("POWERTOOLS_LOG_LEVEL", "ERROR")
+
+import get_category  # noqa: E402
+import get_skratimenews  # noqa: E402
+import response_cache  # noqa: E402
+
+READ_OPERATIONS = {"GetItem", "BatchGetItem", "Query", "Scan"}
+READ_UNIT_BYTES = 4096
+MODELS = (get_skratimenews.SkratimenewsModel, get_category.CategoriesModel)
+
+
+def _value_size(value):
+    ((kind, data),) = value.items()
+    if kind in ("S", "B"):
+        return len(data.encode("utf-8") if kind == "S" else data)
+    if kind == "N":
+        return len(data.lstrip("-").replace(".", "")) // 2 + 1
+    if kind in ("L", "M"):
+        members = data if kind == "L" else data.values()
+        size = 3 + sum(1 + _value_size(member) for member in members)
+        if kind == "M":
+            size += sum(len(name.encode("utf-8")) for name in data)
+        return size
+    return 1
+
+
+def _item_size(item):
+    return sum(
+        len(name.encode("utf-8")) + _value_size(value) for name, value in item.items()
+    )
+
+
+def _read_units(size):
+    return math.ceil(size / READ_UNIT_BYTES) * 0.5
+
+
+def _snapshot_tables(models):
+    """Stored items by table and id, so reads can be sized by what they touch."""
+    stored = {}
+    for model in models:
+        client = model._get_connection().connection.client
+        table_name = model.Meta.table_name
+        stored[table_name] = {}
+        for page in client.get_paginator("scan").paginate(TableName=table_name):
+            for item in page["Items"]:
+                stored[table_name][item["id"]["S"]] = item
+    return stored
+
+
+def _index_projections(models):
+    projections = {}
+    for model in models:
+        for name, index in model._indexes.items():
+            schema = index._get_schema()
+            projection = schema["projection"]
+            if projection["ProjectionType"] == "ALL":
+                projections[name] = None
+            else:
+                projections[name] = {"id"}
+                projections[name].update(
+                    key["AttributeName"] for key in schema["key_schema"]
+                )
+                projections[name].update(projection.get("NonKeyAttributes", []))
+    return projections
+
+
+def _count_reads(models, counter, stored=None):
+    """Count read calls in ``counter[0]`` and read units in ``counter[1]``."""
+    projections = _index_projections(models)
+
+    def before_parameter_build(params, context, **kwargs):
+        context["read_target"] = (params.get("TableName"), params.get("IndexName"))
+
+    def before_call(model, **kwargs):
+        if model.name in READ_OPERATIONS:
+            counter[0] += 1
+
+    def after_call(parsed, model, context, **kwargs):
+        if stored is None or model.name not in READ_OPERATIONS:
+            return
+        if model.name == "BatchGetItem":
+            for table_name, items in parsed.get("Responses", {}).items():
+                for item in items:
+                    counter[1] += _read_units(_stored_size(table_name, None, item))
+            return
+        table_name, index_name = context.get("read_target", (None, None))
+        if model.name == "GetItem":
+            item = parsed.get("Item")
+            size = _stored_size(table_name, None, item) if item else 1
+            counter[1] += _read_units(size)
+            return
+        size = sum(
+            _stored_size(table_name, index_name, item)
+            for item in parsed.get("Items", [])
+        )
+        # A Query or Scan page costs at least half a unit even when empty.
+        counter[1] += max(0.5, _read_units(size))
+
+    def _stored_size(table_name, index_name, item):
+        full = stored.get(table_name, {}).get(item["id"]["S"], item)
+        projected = projections.get(index_name) if index_name else None
+        if projected is not None:
+            full = {name: value for name, value in full.items() if name in projected}
+        return _item_size(full)
+
+    for model in models:
+        client = model._get_connection().connection.client
+        client.meta.events.register(
+            "before-parameter-build.dynamodb", before_parameter_build
+        )
+        client.meta.events.register("before-call.dynamodb", before_call)
+        client.meta.events.register("after-call.dynamodb", after_call)
+
+
+def seed(news_items, seed_value):
+    """Create the tables and store ``news_items`` cards with article bodies."""
+    for model in MODELS:
+        if not model.exists():
+            model.create_table(billing_mode="PAY_PER_REQUEST", wait=True)
+
+    rng = random.Random(seed_value)
+    category_ids = [f"category-{i}" for i in range(8)]
+    with get_category.CategoriesModel.batch_write() as batch:
+        for category_id in category_ids:
+            batch.save(get_category.CategoriesModel(id=category_id, name=category_id))
+
+    now = datetime.now(timezone.utc)
+    words = "threat actors exploited a critical flaw in the edge appliance".split()
+    with get_skratimenews.SkratimenewsModel.batch_write() as batch:
+        for i in range(news_items):
+            published_at = (now - timedelta(minutes=30 * i)).isoformat()
+            batch.save(
+                get_skratimenews.SkratimenewsModel(
+                    id=f"news-{i:05d}",
+                    title=" ".join(rng.choices(words, k=10)),
+                    summary=" ".join(rng.choices(words, k=60)),
+                    category_id=rng.choice(category_ids),
+                    picture_url=f"https://images.example.com/{i}.jpg",
+                    news_link=f"https://news.example.com/{i}",
+                    published_at=published_at,
+                    published_day=published_at[:10],
+                    author="Newsroom",
+                    # Article bodies run to a few thousand words.
+                    full_article=" ".join(rng.choices(words, k=rng.randint(800, 2500))),
+                )
+            )
+
+
+def _event(path, query_params, etag=None):
+    return {
+        "httpMethod": "GET",
+        "path": path,
+        "queryStringParameters": query_params,
+        "headers": {"If-None-Match": etag} if etag else {},
+    }
+
+
+def build_workload(requests, seed):
+    """Sample a request mix from what's currently in the tables."""
+    latest = json.loads(get_skratimenews.handler(_event("/news", {}), None)["body"])
+    categories = json.loads(
+        get_category.handler(_event("/categories", {}), None)["body"]
+    )
+    news_ids = [item["id"] for item in latest["items"]] or ["missing"]
+    category_ids = [category["id"] for category in categories["items"]] or [
+        "uncategorized"
+    ]
+
+    rng = random.Random(seed)
+    workload = []
+    for _ in range(requests):
+        roll = rng.random()
+        if roll < 0.3:
+            workload.append(("news", "/news", {}))
+        elif roll < 0.55:
+            workload.append(
+                ("news", "/news", {"category_id": rng.choice(category_ids)})
+            )
+        elif roll < 0.85:
+            workload.append(("news", "/news", {"id": rng.choice(news_ids)}))
+        else:
+            workload.append(("category", "/categories", {}))
+    return workload
+
+
+def run(workload, reads, revalidate_share, seed):
+    handlers = {"news": get_skratimenews.handler, "category": get_category.handler}
+    reads[0] = 0
+    reads[1] = 0.0
+
+    rng = random.Random(seed)
+    etags = {}
+    statuses = {}
+    response_bytes = 0
+    for name, path, query_params in workload:
+        key = (name, json.dumps(query_params, sort_keys=True))
+        etag = etags.get(key) if rng.random() < revalidate_share else None
+        response = handlers[name](_event(path, query_params, etag), None)
+        statuses[response["statusCode"]] = statuses.get(response["statusCode"], 0) + 1
+        response_bytes += len((response.get("body") or "").encode("utf-8"))
+        if "ETag" in (response.get("headers") or {}):
+            etags[key] = response["headers"]["ETag"]
+    return reads[0], reads[1], response_bytes, statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument(
+        "--revalidate-share",
+        type=float,
+        default=0.5,
+        help="Share of repeat requests that send If-None-Match.",
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--moto-items",
+        type=int,
+        help="Run against moto's in-memory DynamoDB seeded with this many items.",
+    )
+    args = parser.parse_args()
+
+    if args.moto_items:
+        from moto import mock_aws
+
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "load")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "load")
+        with mock_aws():
+            seed(args.moto_items, args.seed)
+            results = measure(args)
+    else:
+        results = measure(args)
+    print(json.dumps(results, indent=2))
+
+
+def measure(args):
+    workload = build_workload(args.requests, args.seed)
+    reads = [0, 0.0]
+    _count_reads(MODELS, reads, stored=_snapshot_tables(MODELS))
+
+    results = {}
+    for label, max_entries in (("without_cache", 0), ("with_cache", 256)):
+        response_cache._responses.clear()
+        response_cache._responses.max_entries = max_entries
+        read_count, read_units, response_bytes, statuses = run(
+            workload, reads, args.revalidate_share, args.seed
+        )
+        results[label] = {
+            "requests": len(workload),
+            "dynamodb_reads": read_count,
+            "reads_per_1000_requests": round(read_count * 1000 / len(workload), 1),
+            "read_units": read_units,
+            "read_units_per_1000_requests": round(read_units * 1000 / len(workload), 1),
+            "response_bytes": response_bytes,
+            "status_codes": statuses,
+        }
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Measure how many raw model outputs resolve to the right category.
+
+Replays the corpus of raw Bedrock outputs in ``category_match_corpus.json``
+through the exact lowercase lookup ``normalize_category`` used to do and
+through the current ``normalize_category`` with its precomputed fuzzy index:
+
+    python category_match_rate.py
+    python category_match_rate.py --corpus other.json --show-misses
+
+Each corpus entry names the category it should resolve to, or ``null`` when
+the output doesn't describe any category and must stay uncategorized.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "lambdas"))
+
+# categorizer reads these at import time but matching never touches AWS.
+os.environ.setdefault("NEWS_TABLE_NAME", "unused")
+os.environ.setdefault("CATEGORIES_TABLE_NAME", "unused")
+
+import categorizer  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), "category_match_corpus.json")
+
+
+def exact_match(text, category_lookup):
+    """The lookup ``normalize_category`` did before the fuzzy index."""
+    cleaned = re.sub(r"[^A-Za-z0-9\s-]", "", text or "").strip().lower()
+    return category_lookup.get(cleaned, "uncategorized")
+
+
+def score(corpus, match):
+    lookup = {name.lower(): name for name in corpus["categories"]}
+    stats = {"outputs": 0, "correct": 0, "wrong": 0, "missed": 0}
+    misses = []
+    for entry in corpus["outputs"]:
+        expected = entry["expected"] or "uncategorized"
+        actual = match(entry["output"], lookup)
+        stats["outputs"] += 1
+        if actual == expected:
+            stats["correct"] += 1
+            continue
+        stats["wrong" if actual != "uncategorized" else "missed"] += 1
+        misses.append({**entry, "actual": actual})
+    stats["match_rate"] = round(stats["correct"] / stats["outputs"], 3)
+    return stats, misses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--show-misses", action="store_true")
+    args = parser.parse_args()
+
+    with open(args.corpus, encoding="utf-8") as fh:
+        corpus = json.load(fh)
+
+    index = categorizer.build_category_index(
+        {name.lower(): name for name in corpus["categories"]}
+    )
+    matchers = {
+        "exact": exact_match,
+        "fuzzy_index": lambda text, lookup: categorizer.normalize_category(
+            text, lookup, index
+        ),
+    }
+
+    results = {}
+    for label, match in matchers.items():
+        stats, misses = score(corpus, match)
+        if args.show_misses:
+            stats["misses"] = misses
+        results[label] = stats
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
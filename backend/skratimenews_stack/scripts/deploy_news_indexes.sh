@@ -0,0 +1,44 @@
+#!/usr/bin/env bash
+# Roll out the news-table date indexes on an existing SkratimenewsStack.
+#
+# DynamoDB creates or deletes at most one GSI per table update, so adding
+# news-category-date-index and news-date-index and dropping the unused
+# news-category-index take one CloudFormation deploy each. The rollout is:
+#
+#   1. Deploy with newsDateIndex=false. This creates news-category-date-index
+#      (CloudFormation waits until it is ACTIVE) and ships the Lambdas; the get
+#      Lambda serves the latest listing from a scan meanwhile.
+#   2. Backfill published_day on items stored before the categorizer set it,
+#      so news-date-index is populated as soon as it exists.
+#   3. Deploy with newsDateIndex=true (the cdk.json default). This creates
+#      news-date-index and switches the latest listing to it.
+#   4. Deploy with legacyCategoryIndex=false (the cdk.json default). This
+#      drops news-category-index, which nothing has queried since step 1.
+#
+# A fresh stack creates the table with every index at once, so a plain
+# `cdk deploy` is enough there. Run from backend/skratimenews_stack:
+#
+#   scripts/deploy_news_indexes.sh [extra cdk deploy args]
+set -euo pipefail
+
+STACK_NAME="${STACK_NAME:-SkratimenewsStack}"
+cd "$(dirname "$0")/.."
+
+echo "Step 1/4: deploying news-category-date-index"
+cdk deploy "$STACK_NAME" -c newsDateIndex=false -c legacyCategoryIndex=true \
+    --require-approval never "$@"
+
+echo "Step 2/4: backfilling published_day"
+NEWS_TABLE_NAME="$(aws cloudformation describe-stacks \
+    --stack-name "$STACK_NAME" \
+    --query "Stacks[0].Outputs[?OutputKey=='NewsTableName'].OutputValue" \
+    --output text)"
+python3 scripts/backfill_published_day.py --table "$NEWS_TABLE_NAME"
+
+echo "Step 3/4: deploying news-date-index"
+cdk deploy "$STACK_NAME" -c newsDateIndex=true -c legacyCategoryIndex=true \
+    --require-approval never "$@"
+
+echo "Step 4/4: dropping news-category-index"
+cdk deploy "$STACK_NAME" -c newsDateIndex=true -c legacyCategoryIndex=false \
+    --require-approval never "$@"
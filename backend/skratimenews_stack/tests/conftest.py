@@ -0,0 +1,109 @@
+import io
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "lambdas"))
+
+# The Lambda modules read their configuration at import time.
+os.environ.setdefault("AWS_DEFAULT_REGION", "eu-central-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+os.environ.setdefault("TABLE_NAME", "news")
+os.environ.setdefault("NEWS_TABLE_NAME", "news")
+os.environ.setdefault("BOOKMARKS_TABLE_NAME", "bookmarks")
+os.environ.setdefault("CATEGORIES_TABLE_NAME", "categories")
+os.environ.setdefault("CURSOR_SECRET", "test-cursor-secret")
+
+moto = pytest.importorskip("moto")
+
+CATEGORIES = {"cloud": "Cloud", "malware": "Malware"}
+
+
+@pytest.fixture
+def aws():
+    with moto.mock_aws():
+        import response_cache
+
+        response_cache._responses.clear()
+        yield
+        response_cache._responses.clear()
+
+
+class FakeBedrock:
+    """Stands in for the bedrock-runtime client.
+
+    Raises the queued ``errors`` first, then answers every numbered line of
+    the prompt with ``category`` after ``latency`` seconds.
+    """
+
+    def __init__(self, errors=(), latency=0.0, category="Cloud"):
+        self.errors = list(errors)
+        self.latency = latency
+        self.category = category
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def invoke_model(self, modelId, body):
+        with self._lock:
+            self.calls += 1
+            error = self.errors.pop(0) if self.errors else None
+        if error:
+            raise error
+        if self.latency:
+            time.sleep(self.latency)
+        prompt = json.loads(body)["inputText"]
+        positions = [
+            line.split(".", 1)[0]
+            for line in prompt.split("Summaries:\n", 1)[-1].splitlines()
+            if line[:1].isdigit()
+        ]
+        if positions:
+            text = "\n".join(f"{position}: {self.category}" for position in positions)
+        else:
+            text = self.category
+        output = {"results": [{"outputText": text}]}
+        return {"body": io.BytesIO(json.dumps(output).encode())}
+
+
+@pytest.fixture
+def bedrock(monkeypatch):
+    """Return a function that installs a FakeBedrock as the categorizer's client."""
+    import categorizer
+
+    def install(errors=(), latency=0.0, category="Cloud", rate=1000.0, concurrency=4):
+        fake = FakeBedrock(errors, latency, category)
+        monkeypatch.setattr(categorizer, "bedrock", fake)
+        monkeypatch.setattr(categorizer, "BEDROCK_CONCURRENCY", concurrency)
+        monkeypatch.setattr(
+            categorizer, "bedrock_limiter", categorizer.TokenBucket(rate, concurrency)
+        )
+        monkeypatch.setattr(categorizer, "PRECLASSIFIER_THRESHOLD", 0)
+        return fake
+
+    return install
+
+
+@pytest.fixture
+def categorizer_tables(aws, monkeypatch):
+    """Create the news and categories tables and seed ``CATEGORIES``."""
+    import boto3
+
+    import categorizer
+
+    client = boto3.client("dynamodb")
+    for name in ("news", "categories"):
+        client.create_table(
+            TableName=name,
+            KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+    categories = boto3.resource("dynamodb").Table("categories")
+    for category_id, name in CATEGORIES.items():
+        categories.put_item(Item={"id": category_id, "name": name})
+    monkeypatch.setattr(categorizer, "_category_snapshot", None)
@@ -0,0 +1,164 @@
+import os
+import sys
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "scripts"))
+
+import backfill  # noqa: E402
+
+NEWS_COUNT = 30
+MANUAL_ID = "news-manual"
+UNDATED_ID = "news-undated"
+
+
+@pytest.fixture
+def news(categorizer_tables):
+    """Store items categorized as "cloud", plus a manual and an undated one."""
+    items = {}
+    for i in range(NEWS_COUNT):
+        published_at = f"2026-09-{1 + i % 28:02d}T08:00:00+00:00"
+        items[f"news-{i:02d}"] = {
+            "id": f"news-{i:02d}",
+            "title": f"Title {i}",
+            "summary": f"Summary {i}",
+            "category_id": "cloud",
+            "category_source": "bedrock",
+            "published_at": published_at,
+            "published_day": published_at[:10],
+            "full_article": f"Body {i}",
+        }
+    items[MANUAL_ID] = {
+        **items["news-00"],
+        "id": MANUAL_ID,
+        "category_source": "manual",
+    }
+    items[UNDATED_ID] = {
+        "id": UNDATED_ID,
+        "title": "Undated",
+        "summary": "No feed date",
+        "category_id": "cloud",
+    }
+    table = boto3.resource("dynamodb").Table("news")
+    with table.batch_writer() as batch:
+        for item in items.values():
+            batch.put_item(Item=item)
+    return items
+
+
+def _stored():
+    table = boto3.resource("dynamodb").Table("news")
+    return {item["id"]: item for item in table.scan()["Items"]}
+
+
+def _recategorize(checkpoint):
+    return backfill.run_pipeline(
+        backfill.table_source(checkpoint), checkpoint, categorize_workers=2
+    )
+
+
+def test_recategorize_rewrites_only_the_category(news, bedrock, tmp_path):
+    fake = bedrock(category="Malware")
+    checkpoint = backfill.Checkpoint(str(tmp_path / "recat.ckpt"))
+
+    stats = _recategorize(checkpoint)
+
+    stored = _stored()
+    assert stats == {"written": NEWS_COUNT + 1, "failed": 0}
+    assert fake.calls > 0
+    for news_id, before in news.items():
+        if news_id == MANUAL_ID:
+            assert stored[news_id] == before
+        else:
+            expected = {**before, "category_id": "malware"}
+            expected["category_source"] = "bedrock"
+            assert stored[news_id] == expected
+    assert "published_at" not in stored[UNDATED_ID]
+    assert "published_day" not in stored[UNDATED_ID]
+
+    recorded = (tmp_path / "recat.ckpt").read_text().split()
+    assert sorted(recorded) == sorted(set(news) - {MANUAL_ID})
+
+
+def test_interrupted_run_resumes_from_the_checkpoint(news, bedrock, tmp_path):
+    path = str(tmp_path / "recat.ckpt")
+    done = [f"news-{i:02d}" for i in range(10)]
+    backfill.Checkpoint(path).record(done)
+    bedrock(category="Malware")
+
+    stats = _recategorize(backfill.Checkpoint(path))
+
+    stored = _stored()
+    assert stats["written"] == NEWS_COUNT + 1 - len(done)
+    assert {stored[news_id]["category_id"] for news_id in done} == {"cloud"}
+    assert {
+        item["category_id"]
+        for news_id, item in stored.items()
+        if news_id not in done and news_id != MANUAL_ID
+    } == {"malware"}
+
+
+def test_failed_model_calls_are_retried_on_the_next_run(
+    news, bedrock, monkeypatch, tmp_path
+):
+    path = str(tmp_path / "recat.ckpt")
+    monkeypatch.setattr(backfill.categorizer, "BEDROCK_MAX_ATTEMPTS", 1)
+    outage = ClientError(
+        {
+            "Error": {"Code": "ServiceUnavailableException", "Message": "down"},
+            "ResponseMetadata": {"HTTPStatusCode": 503},
+        },
+        "InvokeModel",
+    )
+    bedrock([outage] * 1000, category="Malware")
+
+    first = _recategorize(backfill.Checkpoint(path))
+
+    assert first == {"written": 0, "failed": 0}
+    assert {item["category_id"] for item in _stored().values()} == {"cloud"}
+
+    bedrock(category="Malware")
+    second = _recategorize(backfill.Checkpoint(path))
+
+    assert second["written"] == NEWS_COUNT + 1
+    assert _stored()[UNDATED_ID]["category_id"] == "malware"
+
+
+def test_feed_entries_are_extracted_categorized_and_written(
+    categorizer_tables, bedrock, monkeypatch, tmp_path
+):
+    monkeypatch.setattr(
+        backfill.scrape_web,
+        "scrape_full_article_from_url",
+        lambda url: f"Article at {url}",
+    )
+    bedrock(category="Cloud")
+    entries = [
+        {
+            "link": f"https://example.com/post-{i}",
+            "title": f"Post {i}",
+            "summary": f"Summary {i}",
+            "published": "Tue, 01 Sep 2026 08:00:00 +0000",
+        }
+        for i in range(12)
+    ]
+    checkpoint = backfill.Checkpoint(str(tmp_path / "feeds.ckpt"))
+
+    stats = backfill.run_pipeline(
+        ({"feed_id": "https://example.com/rss", "entry": entry} for entry in entries),
+        checkpoint,
+        extract=backfill.extract_stage,
+        extract_workers=4,
+    )
+
+    stored = _stored()
+    assert stats == {"written": 12, "failed": 0}
+    assert len(stored) == 12
+    assert all(item["category_id"] == "cloud" for item in stored.values())
+    assert {item["full_article"] for item in stored.values()} == {
+        f"Article at https://example.com/post-{i}" for i in range(12)
+    }
+    assert {item["published_day"] for item in stored.values()} == {"2026-09-01"}
+    assert checkpoint.done == set(stored)
@@ -0,0 +1,123 @@
+import json
+
+import boto3
+import botocore.client
+import pytest
+
+import add_bookmark
+import bulk_bookmarks
+import remove_bookmark
+
+USER_ID = "user-1"
+
+
+@pytest.fixture
+def tables(aws):
+    client = boto3.client("dynamodb")
+    client.create_table(
+        TableName="bookmarks",
+        KeySchema=[
+            {"AttributeName": "user_id", "KeyType": "HASH"},
+            {"AttributeName": "news_id", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "user_id", "AttributeType": "S"},
+            {"AttributeName": "news_id", "AttributeType": "S"},
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    client.create_table(
+        TableName="news",
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    news = boto3.resource("dynamodb").Table("news")
+    for i in range(5):
+        news.put_item(Item={"id": f"news-{i}", "title": f"Title {i}"})
+
+
+@pytest.fixture
+def calls(tables, monkeypatch):
+    """DynamoDB operations made after the tables are set up, in order."""
+    recorded = []
+    make_api_call = botocore.client.BaseClient._make_api_call
+
+    def spy(self, operation_name, api_params):
+        recorded.append(operation_name)
+        return make_api_call(self, operation_name, api_params)
+
+    monkeypatch.setattr(botocore.client.BaseClient, "_make_api_call", spy)
+    return recorded
+
+
+def _event(body=None, news_id=None):
+    return {
+        "httpMethod": "POST" if body is not None else "DELETE",
+        "body": json.dumps(body) if body is not None else None,
+        "pathParameters": {"news_id": news_id} if news_id else None,
+        "requestContext": {"authorizer": {"claims": {"sub": USER_ID}}},
+    }
+
+
+def _add(news_id):
+    return add_bookmark.handler(_event({"news_id": news_id}), None)
+
+
+def test_add_is_one_read_and_one_conditional_write(calls):
+    assert _add("news-0")["statusCode"] == 201
+    assert calls == ["GetItem", "PutItem"]
+
+
+def test_repeated_add_keeps_created_at_without_extra_calls(calls):
+    _add("news-0")
+    table = boto3.resource("dynamodb").Table("bookmarks")
+    key = {"user_id": USER_ID, "news_id": "news-0"}
+    created_at = table.get_item(Key=key)["Item"]["created_at"]
+    del calls[:]
+
+    response = _add("news-0")
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["message"] == "Bookmark already exists"
+    assert calls == ["GetItem", "PutItem"]
+    assert table.get_item(Key=key)["Item"]["created_at"] == created_at
+
+
+@pytest.mark.parametrize("bookmarked, status", [(True, 200), (False, 404)])
+def test_remove_is_one_conditional_delete(calls, bookmarked, status):
+    if bookmarked:
+        _add("news-0")
+        del calls[:]
+
+    response = remove_bookmark.handler(_event(news_id="news-0"), None)
+
+    assert response["statusCode"] == status
+    assert calls == ["DeleteItem"]
+
+
+def test_bulk_add_is_two_batch_reads_and_one_batch_write(calls):
+    _add("news-0")
+    del calls[:]
+
+    response = bulk_bookmarks.handler(
+        _event({"add": ["news-0", "news-1", "news-2", "missing"]}), None
+    )
+
+    body = json.loads(response["body"])
+    assert response["statusCode"] == 200
+    assert body["added"] == ["news-1", "news-2"]
+    assert body["already_bookmarked"] == ["news-0"]
+    assert body["not_found"] == ["missing"]
+    assert calls == ["BatchGetItem", "BatchGetItem", "BatchWriteItem"]
+
+
+def test_bulk_remove_is_one_batch_write(calls):
+    for news_id in ("news-0", "news-1"):
+        _add(news_id)
+    del calls[:]
+
+    response = bulk_bookmarks.handler(_event({"remove": ["news-0", "news-1"]}), None)
+
+    assert response["statusCode"] == 200
+    assert calls == ["BatchWriteItem"]
@@ -0,0 +1,155 @@
+import json
+import time
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+import categorizer
+
+CATEGORIES = {"cloud": "Cloud", "malware": "Malware"}
+
+
+def _client_error(code, status):
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": code},
+            "ResponseMetadata": {"HTTPStatusCode": status},
+        },
+        "InvokeModel",
+    )
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Backoff delays requested by _invoke_bedrock, with the bounds drawn from."""
+    recorded = {"bounds": [], "delays": []}
+
+    def uniform(low, high):
+        recorded["bounds"].append((low, high))
+        return high
+
+    monkeypatch.setattr(categorizer.random, "uniform", uniform)
+    monkeypatch.setattr(categorizer.time, "sleep", recorded["delays"].append)
+    return recorded
+
+
+def _categorize(summaries):
+    return categorizer.categorize_summaries(
+        summaries,
+        list(CATEGORIES.values()),
+        {name.lower(): category_id for category_id, name in CATEGORIES.items()},
+    )
+
+
+def test_token_bucket_limits_the_request_rate():
+    bucket = categorizer.TokenBucket(rate=50, capacity=2)
+
+    started = time.monotonic()
+    for _ in range(12):
+        bucket.acquire()
+    elapsed = time.monotonic() - started
+
+    # Two tokens are available up front; the other ten arrive at 50/s.
+    assert 0.18 <= elapsed < 0.5
+
+
+def test_throttling_is_retried_with_full_jitter(bedrock, sleeps):
+    fake = bedrock([_client_error("ThrottlingException", 429)] * 3)
+
+    assert categorizer._invoke_bedrock("prompt", max_tokens=20) == "Cloud"
+
+    assert fake.calls == 4
+    assert sleeps["bounds"] == [(0, 0.5), (0, 1.0), (0, 2.0)]
+    assert sleeps["delays"] == [0.5, 1.0, 2.0]
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        _client_error("ServiceUnavailableException", 503),
+        _client_error("ModelTimeoutException", 408),
+        _client_error("InternalServerException", 500),
+        _client_error("SomethingNew", 502),
+        EndpointConnectionError(endpoint_url="https://bedrock-runtime"),
+    ],
+)
+def test_transient_errors_are_retried(bedrock, sleeps, error):
+    fake = bedrock([error])
+
+    assert categorizer._invoke_bedrock("prompt", max_tokens=20) == "Cloud"
+    assert fake.calls == 2
+
+
+def test_client_errors_are_not_retried(bedrock, sleeps):
+    fake = bedrock([_client_error("ValidationException", 400)])
+
+    assert categorizer._invoke_bedrock("prompt", max_tokens=20) is None
+    assert fake.calls == 1
+    assert sleeps["delays"] == []
+
+
+def test_backoff_is_capped(bedrock, sleeps, monkeypatch):
+    monkeypatch.setattr(categorizer, "BEDROCK_MAX_ATTEMPTS", 7)
+    bedrock([_client_error("ThrottlingException", 429)] * 6)
+
+    categorizer._invoke_bedrock("prompt", max_tokens=20)
+
+    assert [high for _, high in sleeps["bounds"]] == [0.5, 1, 2, 4, 8, 8]
+
+
+def test_exhausted_retries_mark_items_failed(bedrock, sleeps):
+    error = _client_error("ServiceUnavailableException", 503)
+    bedrock([error] * 100)
+
+    assert _categorize(["one", "two", "three"]) == [(None, None)] * 3
+
+
+def test_pool_overlaps_bedrock_calls(bedrock, monkeypatch):
+    monkeypatch.setattr(categorizer, "CATEGORIZE_BATCH_SIZE", 2)
+    fake = bedrock(latency=0.2, concurrency=4)
+
+    started = time.monotonic()
+    results = _categorize([f"summary {i}" for i in range(16)])
+    elapsed = time.monotonic() - started
+
+    assert results == [("cloud", "bedrock")] * 16
+    # Eight 200 ms calls take 1.6 s one at a time and two rounds on four workers.
+    assert fake.calls == 8
+    assert elapsed < 0.8
+
+
+def _record(news_id):
+    payload = {
+        "id": news_id,
+        "title": f"Title {news_id}",
+        "summary": f"Summary {news_id}",
+        "published_at_utc": "2026-10-01T08:00:00+00:00",
+    }
+    return {"messageId": f"message-{news_id}", "body": json.dumps(payload)}
+
+
+def test_failed_model_calls_are_reported_for_redelivery(
+    categorizer_tables, bedrock, sleeps
+):
+    bedrock([_client_error("ServiceUnavailableException", 503)] * 100)
+
+    response = categorizer.lambda_handler(
+        {"Records": [_record("news-1"), _record("news-2")]}, None
+    )
+
+    assert response["batchItemFailures"] == [
+        {"itemIdentifier": "message-news-1"},
+        {"itemIdentifier": "message-news-2"},
+    ]
+    assert boto3.resource("dynamodb").Table("news").scan()["Items"] == []
+
+
+def test_recovered_model_calls_store_the_category(categorizer_tables, bedrock, sleeps):
+    bedrock([EndpointConnectionError(endpoint_url="https://bedrock")])
+
+    response = categorizer.lambda_handler({"Records": [_record("news-1")]}, None)
+
+    assert response["batchItemFailures"] == []
+    item = boto3.resource("dynamodb").Table("news").get_item(Key={"id": "news-1"})
+    assert item["Item"]["category_id"] == "cloud"
@@ -0,0 +1,238 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import boto3
+import pytest
+
+import get_skratimenews
+import pagination
+
+NEWS_COUNT = 25
+# Enough for a scan to cross many DynamoDB pages and segment boundaries.
+LARGE_NEWS_COUNT = 2500
+CATEGORIES = ["cloud", "malware"]
+
+
+def _key(name):
+    return {"AttributeName": name, "KeyType": "HASH"}
+
+
+def _range(name):
+    return {"AttributeName": name, "KeyType": "RANGE"}
+
+
+@pytest.fixture
+def news(aws, request):
+    """Create the news table with the stack's indexes and seed it.
+
+    Seeds ``NEWS_COUNT`` items unless parametrized indirectly with another
+    count. Items are an hour apart, newest first, so they span several UTC
+    days.
+    """
+    news_count = getattr(request, "param", NEWS_COUNT)
+    client = boto3.client("dynamodb")
+    client.create_table(
+        TableName="news",
+        KeySchema=[_key("id")],
+        AttributeDefinitions=[
+            {"AttributeName": name, "AttributeType": "S"}
+            for name in ("id", "category_id", "published_at", "published_day")
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                "IndexName": "news-category-date-index",
+                "KeySchema": [_key("category_id"), _range("published_at")],
+                "Projection": {
+                    "ProjectionType": "INCLUDE",
+                    "NonKeyAttributes": get_skratimenews.CATEGORY_DATE_INDEX_FIELDS[3:],
+                },
+            },
+            {
+                "IndexName": "news-date-index",
+                "KeySchema": [_key("published_day"), _range("published_at")],
+                "Projection": {
+                    "ProjectionType": "INCLUDE",
+                    "NonKeyAttributes": get_skratimenews.DATE_INDEX_FIELDS[3:],
+                },
+            },
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+
+    table = boto3.resource("dynamodb").Table("news")
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    items = []
+    with table.batch_writer() as batch:
+        for i in range(news_count):
+            published_at = (now - timedelta(hours=i)).isoformat()
+            item = {
+                "id": f"news-{i:02d}",
+                "title": f"Title {i}",
+                "summary": f"Summary {i}",
+                "category_id": CATEGORIES[i % len(CATEGORIES)],
+                "published_at": published_at,
+                "published_day": published_at[:10],
+                "full_article": "body",
+            }
+            batch.put_item(Item=item)
+            items.append(item)
+    return items
+
+
+def _get(query_params, groups=None):
+    claims = {"sub": "user-1"}
+    if groups is not None:
+        claims["cognito:groups"] = groups
+    event = {
+        "httpMethod": "GET",
+        "path": "/news",
+        "queryStringParameters": query_params,
+        "headers": {},
+        "requestContext": {"authorizer": {"claims": claims}},
+    }
+    response = get_skratimenews.handler(event, None)
+    return response["statusCode"], json.loads(response["body"])
+
+
+def _walk(query_params, groups=None, max_pages=NEWS_COUNT + 1):
+    """Follow cursors to the end and return the pages' items."""
+    items, cursor = [], None
+    for _ in range(max_pages):
+        params = dict(query_params)
+        if cursor:
+            params["last_evaluated_key"] = cursor
+        status, body = _get(params, groups)
+        assert status == 200, body
+        items.extend(body["items"])
+        cursor = body["last_evaluated_key"]
+        if not cursor:
+            return items
+    pytest.fail("listing never ran out of pages")
+
+
+def _ids(items):
+    return [item["id"] for item in items]
+
+
+@pytest.mark.parametrize("news", [NEWS_COUNT, LARGE_NEWS_COUNT], indirect=True)
+def test_scan_pages_every_item_once(news):
+    items = _walk({"scan": "true"}, max_pages=len(news) + 1)
+
+    assert sorted(_ids(items)) == sorted(_ids(news))
+    assert all("full_article" not in item for item in items)
+
+
+@pytest.mark.parametrize(
+    "news, page_size",
+    [
+        (NEWS_COUNT, 4),
+        (LARGE_NEWS_COUNT, get_skratimenews.MAX_SCAN_PAGE_SIZE),
+    ],
+    indirect=["news"],
+)
+def test_segmented_scan_covers_the_table_once(news, page_size):
+    ids = []
+    for segment in range(3):
+        ids.extend(
+            _ids(
+                _walk(
+                    {
+                        "scan": "true",
+                        "segment": str(segment),
+                        "total_segments": "3",
+                        "page_size": str(page_size),
+                    },
+                    groups="[admin, editors]",
+                    max_pages=len(news) + 1,
+                )
+            )
+        )
+
+    assert len(ids) == len(news)
+    assert sorted(ids) == sorted(_ids(news))
+
+
+@pytest.mark.parametrize("groups", [None, "editors"])
+def test_segmented_scan_requires_admin_group(news, groups):
+    status, body = _get({"scan": "true", "total_segments": "2"}, groups)
+
+    assert status == 403
+    assert "admin" in body["error"]
+
+
+def test_category_listing_pages_newest_first(news):
+    items = _walk({"category_id": "cloud"})
+
+    expected = [item for item in news if item["category_id"] == "cloud"]
+    assert _ids(items) == _ids(expected)
+
+
+def test_category_listing_reads_only_projected_fields(news):
+    status, body = _get({"category_id": "cloud", "fields": "all"})
+
+    assert status == 200
+    returned = {field for item in body["items"] for field in item}
+    assert returned == {"id", "category_id", "published_at", "title", "summary"}
+
+    status, body = _get({"category_id": "cloud", "fields": "title,full_article"})
+
+    assert status == 400
+    assert "full_article" in body["error"]
+
+
+def test_latest_listing_pages_newest_first_across_days(news):
+    items = _walk({})
+
+    assert len({item["published_day"] for item in news}) >= 2
+    assert _ids(items) == _ids(news)
+
+
+def test_latest_listing_falls_back_to_scan_without_date_index(news, monkeypatch):
+    monkeypatch.setattr(get_skratimenews, "NEWS_DATE_INDEX_ENABLED", False)
+
+    items = _walk({})
+
+    assert sorted(_ids(items)) == sorted(_ids(news))
+
+
+def _first_cursor(query_params, groups=None):
+    status, body = _get(query_params, groups)
+    assert status == 200
+    assert body["last_evaluated_key"]
+    return body["last_evaluated_key"]
+
+
+def test_tampered_cursor_is_rejected(news):
+    cursor = _first_cursor({"scan": "true"})
+    version, payload, signature = cursor.split(".")
+    forged = pagination._b64encode(
+        json.dumps({"s": "scan:None/None", "p": {"id": {"S": "news-24"}}}).encode()
+    )
+
+    for bad in (
+        f"{version}.{forged}.{signature}",
+        f"{version}.{payload}.{signature[::-1]}",
+        f"v0.{payload}.{signature}",
+        "not-a-cursor",
+    ):
+        status, body = _get({"scan": "true", "last_evaluated_key": bad})
+        assert status == 400, bad
+        assert body["error"] == "Invalid cursor"
+
+
+@pytest.mark.parametrize(
+    "issued_for, replayed_on",
+    [
+        ({"scan": "true"}, {"category_id": "cloud"}),
+        ({"category_id": "cloud"}, {"category_id": "malware"}),
+        ({"category_id": "cloud"}, {"category_id": "cloud", "order": "oldest"}),
+        ({}, {"scan": "true"}),
+    ],
+)
+def test_cursor_from_another_listing_is_rejected(news, issued_for, replayed_on):
+    cursor = _first_cursor(issued_for)
+
+    status, body = _get({**replayed_on, "last_evaluated_key": cursor})
+
+    assert status == 400
+    assert body["error"] == "Cursor does not belong to this listing"
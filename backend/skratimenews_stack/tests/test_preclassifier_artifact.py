@@ -0,0 +1,119 @@
+import io
+
+import boto3
+import botocore.client
+import pytest
+
+import build_preclassifier
+import categorizer
+import preclassifier
+
+pytest.importorskip("numpy")
+
+BUCKET = "preclassifier-models"
+SUMMARIES = {
+    "cloud": "Misconfigured cloud storage bucket exposed customer records",
+    "malware": "New ransomware strain encrypts files and spreads over SMB",
+}
+
+
+@pytest.fixture
+def published(aws, monkeypatch):
+    client = boto3.client("dynamodb")
+    for name in ("news", "categories"):
+        client.create_table(
+            TableName=name,
+            KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+    dynamodb = boto3.resource("dynamodb")
+    categories = [
+        {"id": "cloud", "name": "Cloud"},
+        {"id": "malware", "name": "Malware"},
+    ]
+    for category in categories:
+        dynamodb.Table("categories").put_item(Item=category)
+    with dynamodb.Table("news").batch_writer() as batch:
+        for category_id, summary in SUMMARIES.items():
+            for i in range(8):
+                batch.put_item(
+                    Item={
+                        "id": f"{category_id}-{i}",
+                        "summary": f"{summary} variant {i}",
+                        "category_id": category_id,
+                        "category_source": "bedrock",
+                    }
+                )
+    boto3.client("s3").create_bucket(
+        Bucket=BUCKET,
+        CreateBucketConfiguration={"LocationConstraint": "eu-central-1"},
+    )
+
+    monkeypatch.setattr(categorizer, "PRECLASSIFIER_BUCKET_NAME", BUCKET)
+    monkeypatch.setattr(
+        categorizer,
+        "_preclassifier_state",
+        {"checked_at": 0.0, "etag": None, "category_version": None, "model": None},
+    )
+    result = build_preclassifier.lambda_handler({}, None)
+    assert result["published"], result
+    return categorizer._category_set_version(categories)
+
+
+@pytest.fixture
+def calls(published, monkeypatch):
+    recorded = []
+    make_api_call = botocore.client.BaseClient._make_api_call
+
+    def spy(self, operation_name, api_params):
+        recorded.append(operation_name)
+        return make_api_call(self, operation_name, api_params)
+
+    monkeypatch.setattr(botocore.client.BaseClient, "_make_api_call", spy)
+    return recorded
+
+
+def test_builder_publishes_the_labelled_categories(published):
+    body = boto3.client("s3").get_object(
+        Bucket=BUCKET, Key=categorizer.PRECLASSIFIER_MODEL_KEY
+    )["Body"]
+    model, category_version = preclassifier.load_model(io.BytesIO(body.read()))
+
+    assert model["category_ids"] == ["cloud", "malware"]
+    assert model["samples"] == 16
+    assert category_version == published
+
+
+def test_categorizer_loads_the_model_without_reading_the_table(published, calls):
+    model = categorizer._get_preclassifier(published)
+
+    assert calls == ["GetObject"]
+    assert preclassifier.classify(
+        model, list(SUMMARIES.values()), threshold=0.3
+    ) == list(SUMMARIES)
+
+
+def test_warm_container_rechecks_with_a_conditional_get(published, calls):
+    model = categorizer._get_preclassifier(published)
+    assert categorizer._get_preclassifier(published) is model
+    assert calls == ["GetObject"]
+
+    categorizer._preclassifier_state["checked_at"] -= (
+        categorizer.PRECLASSIFIER_MAX_AGE_SECONDS + 1
+    )
+
+    assert categorizer._get_preclassifier(published) is model
+    assert calls == ["GetObject", "GetObject"]
+
+
+def test_model_for_another_category_set_is_not_used(published, calls):
+    assert categorizer._get_preclassifier("other-version") is None
+
+
+def test_missing_model_disables_the_preclassifier(published, calls):
+    boto3.client("s3").delete_object(
+        Bucket=BUCKET, Key=categorizer.PRECLASSIFIER_MODEL_KEY
+    )
+
+    assert categorizer._get_preclassifier(published) is None
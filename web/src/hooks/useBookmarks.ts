@@ -1,4 +1,4 @@
-import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
+import { useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import ky from 'ky';
 import config from '../config';
 import { useState, useEffect, useCallback } from 'react';
@@ -24,26 +24,30 @@ export interface Bookmark {
 export interface BookmarksResponse {
   bookmarks: Bookmark[];
   count: number;
+  last_evaluated_key?: string | null;
 }
 
-// Fetch all bookmarks for the current user
+// Fetch the current user's bookmarks one page at a time, newest first.
+// Render `data.pages` as they arrive and call `fetchNextPage` (while
+// `hasNextPage`) from a "load more" control or scroll sentinel.
 export const useGetBookmarks = () => {
-  return useQuery<BookmarksResponse>({
+  return useInfiniteQuery({
     queryKey: ['bookmarks'],
-    queryFn: async () => {
+    queryFn: async ({ pageParam }) => {
       const token = getAuthToken();
       if (!token) throw new Error('No auth token found');
 
-      const response = await ky
+      return ky
         .get(`${API_URL}/bookmarks`, {
           headers: {
             Authorization: `Bearer ${token}`,
           },
+          searchParams: pageParam ? { last_evaluated_key: pageParam } : {},
         })
         .json<BookmarksResponse>();
-
-      return response;
     },
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.last_evaluated_key ?? null,
     enabled: !!getAuthToken(),
   });
 };
@@ -13,6 +13,8 @@ import { useToggleBookmark } from '../hooks/useBookmarks';
 import { sortArticlesByRelevance, trackArticleClick } from '../lib/relevance-alorithm';
 import { Article, Category } from '../types';
 
+const NEWS_API_URL = 'https://1zt5usufzc.execute-api.eu-central-1.amazonaws.com/prod/news';
+
 interface DashboardProps {
   onSettingsClick: () => void;
 }
@@ -99,7 +101,7 @@ export function Dashboard({ onSettingsClick }: DashboardProps) {
       try {
         const token = localStorage.getItem('idToken');
         console.log(token);
-        const response = await fetch('https://1zt5usufzc.execute-api.eu-central-1.amazonaws.com/prod/news', {
+        const response = await fetch(NEWS_API_URL, {
           headers: {
             Authorization: `Bearer ${token}`,
           },
@@ -138,6 +140,35 @@ export function Dashboard({ onSettingsClick }: DashboardProps) {
     fetchNews();
   }, [navigate]);
 
+  // List pages only carry card fields, so the article body is loaded on open.
+  const openArticle = async (article: Article) => {
+    trackArticleClick(article);
+    setSelectedArticle(article);
+    if (article.fullContent) return;
+
+    try {
+      const token = localStorage.getItem('idToken');
+      const params = new URLSearchParams({ id: article.id, fields: 'full_article,news_link' });
+      const response = await fetch(`${NEWS_API_URL}?${params}`, {
+        headers: {
+          Authorization: `Bearer ${token}`,
+        },
+      });
+      if (!response.ok) throw new Error(`Failed to fetch article: ${response.status}`);
+
+      const item = await response.json();
+      const detailed: Article = {
+        ...article,
+        fullContent: item.full_article,
+        linkToArticle: item.news_link ?? article.linkToArticle,
+      };
+      setArticles((current) => current.map((a) => (a.id === article.id ? detailed : a)));
+      setSelectedArticle((current) => (current?.id === article.id ? detailed : current));
+    } catch (error) {
+      console.error('Error fetching article:', error);
+    }
+  };
+
   useEffect(() => {
     const now = new Date();
     const hours = now.getHours();
@@ -314,10 +345,7 @@ export function Dashboard({ onSettingsClick }: DashboardProps) {
                     key={article.id}
                     article={article}
                     viewMode={viewMode}
-                    onClick={() => {
-                      trackArticleClick(article);
-                      setSelectedArticle(article);
-                    }}
+                    onClick={() => openArticle(article)}
                   />
                 ))}
               </div>